@@ -1,32 +1,39 @@
-import pdfplumber
+import hashlib
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, Any, Container, Dict, List, Optional, Set
 from app.domain.ports import PdfExtractor
 from app.domain.entities import Presentation, Slide
 from app.domain.errors import ExtractionError
 
+if TYPE_CHECKING:
+    from pdfplumber.page import Page
+
 class PdfPlumberExtractor(PdfExtractor):
     
-    def extract(self, file_path: Path) -> Presentation:
+    def extract(self, file_path: Path, known_pages: Optional[Container[str]] = None) -> Presentation:
         try:
             if not file_path.exists():
                 raise FileNotFoundError(f"PDF файл не найден: {file_path}")
             
+            import pdfplumber
+            
             slides = []
-            all_fonts = {}
             
             with pdfplumber.open(file_path) as pdf:
-                all_fonts = self._extract_fonts_from_pdf(pdf)
-                
                 for page_num, page in enumerate(pdf.pages):
-                    slide = self._parse_page(page, page_num + 1)
+                    content_key = self.page_key(page) if known_pages is not None else None
+                    if content_key is not None and content_key in known_pages:
+                        slide = Slide(page_number=page_num + 1, width=page.width, height=page.height)
+                    else:
+                        slide = self._parse_page(page, page_num + 1)
+                    slide.content_key = content_key
                     slides.append(slide)
             
             return Presentation(
                 file_path=file_path,
                 slides=slides,
                 metadata=getattr(pdf, 'metadata', {}),
-                fonts_used=all_fonts
+                fonts_used=collect_fonts(slides)
             )
             
         except FileNotFoundError:
@@ -34,7 +41,22 @@ class PdfPlumberExtractor(PdfExtractor):
         except Exception as e:
             raise ExtractionError(f"Ошибка извлечения из PDF: {str(e)}") from e
     
-    def _parse_page(self, page: pdfplumber.page.Page, page_num: int) -> Slide:
+    def preload(self) -> None:
+        import pdfplumber
+    
+    def page_key(self, page: "Page") -> Optional[str]:
+        digest = hashlib.blake2b(digest_size=16)
+        page_obj = page.page_obj
+        try:
+            digest.update(f"{page.width:.2f}x{page.height:.2f}|{page_obj.rotate}|".encode("ascii"))
+            seen: Set[int] = set()
+            _feed_object(digest, page_obj.resources, seen)
+            _feed_object(digest, page_obj.contents, seen)
+        except Exception:
+            return None
+        return digest.hexdigest()
+    
+    def _parse_page(self, page: "Page", page_num: int) -> Slide:
         chars = page.chars
         width = page.width
         height = page.height
@@ -44,24 +66,64 @@ class PdfPlumberExtractor(PdfExtractor):
             width=width,
             height=height,
             blocks=[],
-            raw_chars=chars
+            raw_chars=chars,
+            font_stats=page_font_stats(chars)
         )
+
+def page_font_stats(chars: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    stats: Dict[str, Dict[str, Any]] = {}
+    for char in chars:
+        font_name = char.get('fontname', 'Unknown')
+        font = stats.get(font_name)
+        if font is None:
+            font = stats[font_name] = {'size': char.get('size', 0), 'char_count': 0}
+        font['char_count'] += 1
+    return stats
+
+def collect_fonts(slides: List[Slide]) -> Dict[str, Any]:
+    fonts_info = {}
     
-    def _extract_fonts_from_pdf(self, pdf) -> Dict[str, Any]:
-        fonts_info = {}
-        
-        for page_num, page in enumerate(pdf.pages):
-            chars = page.chars
-            for char in chars:
-                font_name = char.get('fontname', 'Unknown')
-                size = char.get('size', 0)
-                if font_name not in fonts_info:
-                    fonts_info[font_name] = {
-                        'size': size,
-                        'pages': set(),
-                        'char_count': 0
-                    }
-                fonts_info[font_name]['pages'].add(page_num + 1)
-                fonts_info[font_name]['char_count'] += 1
-        
-        return fonts_info
+    for slide in slides:
+        for font_name, stats in slide.font_stats.items():
+            if font_name not in fonts_info:
+                fonts_info[font_name] = {
+                    'size': stats['size'],
+                    'pages': set(),
+                    'char_count': 0
+                }
+            fonts_info[font_name]['pages'].add(slide.page_number)
+            fonts_info[font_name]['char_count'] += stats['char_count']
+    
+    return fonts_info
+
+def _feed_object(digest, obj: Any, seen: Set[int], depth: int = 0) -> None:
+    from pdfminer.pdftypes import PDFObjRef, PDFStream
+    
+    if depth > 32:
+        raise ValueError("Слишком глубокая вложенность объектов PDF")
+    if isinstance(obj, PDFObjRef):
+        if obj.objid in seen:
+            digest.update(b"@")
+            return
+        seen.add(obj.objid)
+        obj = obj.resolve()
+    
+    if isinstance(obj, PDFStream):
+        digest.update(b"S")
+        _feed_object(digest, obj.attrs, seen, depth + 1)
+        data = obj.get_data()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    elif isinstance(obj, dict):
+        digest.update(b"{")
+        for key in sorted(obj, key=str):
+            digest.update(f"{key}=".encode("utf-8", "replace"))
+            _feed_object(digest, obj[key], seen, depth + 1)
+        digest.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"[")
+        for item in obj:
+            _feed_object(digest, item, seen, depth + 1)
+        digest.update(b"]")
+    else:
+        digest.update(f"{obj!r};".encode("utf-8", "replace"))
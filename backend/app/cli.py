@@ -0,0 +1,445 @@
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.adapters.pdf.pdfplumber_extractor import PdfPlumberExtractor
+from app.core.config import get_settings
+from app.core.logging import get_logger, setup_logging
+from app.services.batch_service import BatchSummary
+from app.services.dsl import DSLParseError, get_engine_cache, rules_hash
+from app.services.file_service import FileService
+from app.services.pipeline_executor import run_pipeline
+from app.services.profile_service import ProfileError, get_profile_store
+from app.services.result_cache import ResultCache, result_cache_key
+from app.services.uploads import CHUNK_SIZE
+
+logger = get_logger(__name__)
+
+FORMATS = ("jsonl", "junit", "sarif")
+SEVERITY_RANK = {"info": 0, "warning": 1, "error": 2}
+SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+EXIT_OK = 0
+EXIT_VIOLATIONS = 1
+EXIT_ERROR = 2
+
+MIN_WORKER_MEMORY_MB = 1024
+
+class CliError(Exception):
+    pass
+
+@dataclass(frozen=True)
+class Deck:
+    index: int
+    path: Path
+    filename: str
+    sha256: str
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def discover(inputs: Sequence[str]) -> List[Path]:
+    found: Dict[Path, Path] = {}
+    for pattern in inputs:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*") if p.suffix.lower() == ".pdf" and p.is_file())
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(
+                Path(match) for match in glob.glob(pattern, recursive=True)
+                if match.lower().endswith(".pdf") and os.path.isfile(match)
+            )
+        if not matches:
+            raise CliError(f"Не найдено PDF-файлов: {pattern}")
+        for match in matches:
+            found.setdefault(match.resolve(), match)
+    return list(found.values())
+
+def resolve_rules(rules: Optional[str], profile: Optional[str]) -> Tuple[str, str]:
+    if (rules is None) == (profile is None):
+        raise CliError("Необходимо передать либо файл правил (--rules), либо профиль (--profile)")
+
+    if rules is not None:
+        try:
+            return Path(rules).read_text(encoding="utf-8"), Path(rules).name
+        except UnicodeDecodeError:
+            raise CliError("Файл правил должен быть в кодировке UTF-8")
+        except OSError as e:
+            raise CliError(f"Не удалось прочитать файл правил: {e}")
+
+    profile_id, _, version = profile.partition(":")
+    try:
+        store = get_profile_store()
+        stored = store.get(profile_id, int(version) if version else None)
+        return store.get_source(stored.profile_id, stored.version), f"{stored.profile_id}@v{stored.version}"
+    except ValueError:
+        raise CliError(f"Некорректная версия профиля: {version}")
+    except ProfileError as e:
+        raise CliError(str(e))
+
+def default_memory_limit(workers: int) -> int:
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return 0
+    return max(MIN_WORKER_MEMORY_MB, total // max(workers, 1))
+
+def _limit_memory(max_memory_mb: int) -> None:
+    if not max_memory_mb:
+        return
+    try:
+        import resource
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning("Не удалось ограничить память процесса: %s", e)
+
+def _init_worker(yaml_content: str, max_memory_mb: int, log_level: int) -> None:
+    setup_logging(log_level)
+    _limit_memory(max_memory_mb)
+    get_engine_cache().get_or_compile(yaml_content)
+    PdfPlumberExtractor().preload()
+
+def _cached_response(cache: ResultCache, key: str, filename: str) -> Optional[Dict[str, Any]]:
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    response = dict(cached.response)
+    response["files"] = {**response["files"], "pdf_filename": filename}
+    return response
+
+def lint(
+    decks: Sequence[Deck],
+    yaml_content: str,
+    rules_name: str,
+    workers: int = 0,
+    max_tasks_per_child: Optional[int] = None,
+    max_memory_mb: int = 0,
+    cache: Optional[ResultCache] = None,
+    changed_since: bool = False,
+    log_level: int = logging.WARNING
+) -> Iterator[Dict[str, Any]]:
+    summary = BatchSummary(rules_name)
+    unchanged = 0
+    rules_sha256 = rules_hash(yaml_content)
+    engine = get_engine_cache().get_or_compile(yaml_content)
+
+    def finish(deck: Deck, key: Optional[str], produce: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        item: Dict[str, Any] = {"type": "file", "index": deck.index, "filename": deck.filename, "sha256": deck.sha256}
+        try:
+            result = produce()
+        except Exception as e:
+            logger.warning("Ошибка проверки файла %s: %s", deck.filename, e)
+            summary.add_error()
+            item.update({"status": "error", "error": str(e) or type(e).__name__})
+            return item
+
+        response = FileService.to_response(result)
+        if cache is not None and key is not None:
+            cache.put(key, response, result.get("deterministic", False))
+        summary.add_result(deck.filename, response)
+        item.update(response)
+        item["cache"] = "miss"
+        return item
+
+    pending: List[Tuple[Deck, Optional[str]]] = []
+    for deck in decks:
+        key = None
+        if cache is not None:
+            key = result_cache_key(deck.sha256, rules_sha256, "", rules_name)
+            response = _cached_response(cache, key, deck.filename)
+            if response is not None:
+                item = {"type": "file", "index": deck.index, "filename": deck.filename, "sha256": deck.sha256}
+                if changed_since:
+                    unchanged += 1
+                    item.update({"status": "unchanged", "cache": "hit"})
+                else:
+                    summary.add_result(deck.filename, response)
+                    item.update(response)
+                    item["cache"] = "hit"
+                yield item
+                continue
+        pending.append((deck, key))
+
+    if workers == 0 or len(pending) <= 1:
+        service = FileService()
+        for deck, key in pending:
+            yield finish(deck, key, lambda: service.process_file(deck.path, engine, deck.filename, rules_name))
+    else:
+        yield from _lint_in_pool(pending, yaml_content, rules_name, workers, max_tasks_per_child,
+                                 max_memory_mb, log_level, finish)
+
+    yield {"type": "summary", **summary.to_dict(), "unchanged": unchanged}
+
+def _lint_in_pool(
+    pending: Sequence[Tuple[Deck, Optional[str]]],
+    yaml_content: str,
+    rules_name: str,
+    workers: int,
+    max_tasks_per_child: Optional[int],
+    max_memory_mb: int,
+    log_level: int,
+    finish: Callable[[Deck, Optional[str], Callable[[], Dict[str, Any]]], Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    window = workers * 2
+    queue = iter(pending)
+    futures: Dict[Future, Tuple[Deck, Optional[str]]] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(yaml_content, max_memory_mb, log_level),
+        max_tasks_per_child=max_tasks_per_child
+    ) as pool:
+        def launch() -> Optional[BrokenProcessPool]:
+            for deck, key in queue:
+                try:
+                    future = pool.submit(run_pipeline, str(deck.path), yaml_content, deck.filename, rules_name)
+                except BrokenProcessPool as e:
+                    broken.append((deck, key))
+                    return e
+                futures[future] = (deck, key)
+                if len(futures) >= window:
+                    return None
+            return None
+
+        broken: List[Tuple[Deck, Optional[str]]] = []
+        error = launch()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: futures[f][0].index):
+                deck, key = futures.pop(future)
+                yield finish(deck, key, future.result)
+            if error is None:
+                error = launch()
+
+    if error is not None:
+        logger.error("Пул процессов обработки аварийно завершился: %s", error)
+        broken.extend(queue)
+
+        def fail() -> Dict[str, Any]:
+            raise error
+
+        for deck, key in broken:
+            yield finish(deck, key, fail)
+
+def failed_at(item: Dict[str, Any], threshold: str) -> List[Dict[str, Any]]:
+    if threshold == "never":
+        return []
+    return [
+        result for result in item.get("detailed_results", [])
+        if result["status"] == "failed" and SEVERITY_RANK[result["severity"]] >= SEVERITY_RANK[threshold]
+    ]
+
+def exit_code(items: Sequence[Dict[str, Any]], threshold: str) -> int:
+    if any(item["status"] == "error" for item in items):
+        return EXIT_ERROR
+    if any(failed_at(item, threshold) for item in items):
+        return EXIT_VIOLATIONS
+    return EXIT_OK
+
+def to_junit(items: Sequence[Dict[str, Any]], summary: Dict[str, Any]) -> str:
+    suites = ET.Element("testsuites", name=summary["rules_name"], time=f"{summary['elapsed_ms'] / 1000:.3f}")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+
+    for item in items:
+        suite = ET.SubElement(suites, "testsuite", name=item["filename"])
+        counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+
+        if item["status"] == "error":
+            case = ET.SubElement(suite, "testcase", classname=item["filename"], name="pipeline")
+            ET.SubElement(case, "error", message=item["error"])
+            counts["tests"] += 1
+            counts["errors"] += 1
+        elif item["status"] == "unchanged":
+            case = ET.SubElement(suite, "testcase", classname=item["filename"], name="unchanged")
+            ET.SubElement(case, "skipped", message="Файл не изменился с прошлой проверки")
+            counts["tests"] += 1
+            counts["skipped"] += 1
+
+        for result in item.get("detailed_results", []):
+            case = ET.SubElement(suite, "testcase", classname=item["filename"], name=result["rule_name"])
+            counts["tests"] += 1
+            if result["status"] == "failed":
+                ET.SubElement(case, "failure", message=result["message"], type=result["severity"])
+                counts["failures"] += 1
+            elif result["status"] == "skipped":
+                ET.SubElement(case, "skipped", message=result["message"])
+                counts["skipped"] += 1
+
+        for name, value in counts.items():
+            suite.set(name, str(value))
+            totals[name] += value
+
+    for name, value in totals.items():
+        suites.set(name, str(value))
+    ET.indent(suites)
+    return ET.tostring(suites, encoding="unicode", xml_declaration=True) + "\n"
+
+def to_sarif(items: Sequence[Dict[str, Any]], summary: Dict[str, Any]) -> str:
+    settings = get_settings()
+    rules: Dict[str, Dict[str, Any]] = {}
+    results = []
+    notifications = []
+
+    for item in items:
+        location = {"physicalLocation": {"artifactLocation": {"uri": Path(item["filename"]).as_posix()}}}
+        if item["status"] == "error":
+            notifications.append({"level": "error", "message": {"text": item["error"]}, "locations": [location]})
+            continue
+
+        for result in item.get("detailed_results", []):
+            rule = rules.setdefault(result["rule_name"], {
+                "id": result["rule_name"],
+                "defaultConfiguration": {"level": SARIF_LEVELS[result["severity"]]}
+            })
+            if result["status"] != "failed":
+                continue
+            results.append({
+                "ruleId": rule["id"],
+                "level": SARIF_LEVELS[result["severity"]],
+                "message": {"text": result["message"]},
+                "locations": [location],
+                "partialFingerprints": {"sha256": item["sha256"]}
+            })
+
+    report = {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": settings.APP_NAME,
+                "version": settings.APP_VERSION,
+                "rules": list(rules.values())
+            }},
+            "invocations": [{
+                "executionSuccessful": summary["errors"] == 0,
+                "toolExecutionNotifications": notifications
+            }],
+            "properties": {"rules_name": summary["rules_name"]},
+            "results": results
+        }]
+    }
+    return json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+
+def write_report(items: Iterator[Dict[str, Any]], output_format: str, output: TextIO) -> List[Dict[str, Any]]:
+    files = []
+    summary: Dict[str, Any] = {}
+    for item in items:
+        if item["type"] == "summary":
+            summary = item
+        else:
+            files.append(item)
+        if output_format == "jsonl":
+            output.write(json.dumps(item, ensure_ascii=False) + "\n")
+            output.flush()
+
+    files.sort(key=lambda item: item["index"])
+    if output_format == "junit":
+        output.write(to_junit(files, summary))
+    elif output_format == "sarif":
+        output.write(to_sarif(files, summary))
+    return files
+
+def build_parser() -> argparse.ArgumentParser:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        prog="pptx-dsl", description="Пакетная проверка PDF-презентаций по правилам без HTTP-сервера"
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF-файлы, каталоги или glob-шаблоны")
+    parser.add_argument("-r", "--rules", help="YAML-файл с правилами")
+    parser.add_argument("-p", "--profile", help="Сохраненный профиль правил: ID или ID:VERSION")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="jsonl", help="Формат отчета")
+    parser.add_argument("-o", "--output", help="Файл отчета (по умолчанию stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Количество процессов обработки (0 - в текущем процессе)")
+    parser.add_argument("--max-tasks-per-child", type=int, default=50,
+                        help="Перезапускать процесс обработки после N презентаций (0 - без ограничения)")
+    parser.add_argument("--max-memory-mb", type=int, default=None,
+                        help="Ограничение адресного пространства процесса обработки, МБ "
+                             "(по умолчанию объем RAM, деленный на число процессов, но не меньше "
+                             f"{MIN_WORKER_MEMORY_MB}; 0 - без ограничения)")
+    parser.add_argument("--cache-dir", default=settings.RESULT_CACHE_DIR or None,
+                        help="Каталог локального кэша результатов")
+    parser.add_argument("--changed-since", action="store_true",
+                        help="Пропускать презентации, результат для которых уже есть в кэше")
+    parser.add_argument("--fail-on", choices=("error", "warning", "info", "never"), default="error",
+                        help="Минимальная серьезность нарушения для ненулевого кода выхода")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Подробный журнал в stderr")
+    return parser
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    setup_logging(log_level)
+
+    cache_dir = args.cache_dir
+    if args.changed_since and not cache_dir:
+        cache_dir = ".pptx-dsl-cache"
+
+    try:
+        yaml_content, rules_name = resolve_rules(args.rules, args.profile)
+        get_engine_cache().get_or_compile(yaml_content)
+        decks = [
+            Deck(index=index, path=path, filename=str(path), sha256=file_sha256(path))
+            for index, path in enumerate(discover(args.inputs))
+        ]
+    except DSLParseError as e:
+        print(f"Ошибка парсинга правил валидации: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except (CliError, OSError) as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_ERROR
+
+    settings = get_settings()
+    cache = None
+    if cache_dir:
+        cache = ResultCache(
+            maxsize=0,
+            ttl=settings.RESULT_CACHE_TTL,
+            nondeterministic_ttl=settings.RESULT_CACHE_NONDETERMINISTIC_TTL,
+            directory=Path(cache_dir)
+        )
+
+    workers = max(0, min(args.workers, len(decks)))
+    max_memory_mb = args.max_memory_mb if args.max_memory_mb is not None else default_memory_limit(workers)
+    items = lint(
+        decks, yaml_content, rules_name,
+        workers=workers,
+        max_tasks_per_child=args.max_tasks_per_child or None,
+        max_memory_mb=max_memory_mb,
+        cache=cache,
+        changed_since=args.changed_since,
+        log_level=log_level
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            files = write_report(items, args.format, output)
+    else:
+        files = write_report(items, args.format, sys.stdout)
+    return exit_code(files, args.fail_on)
+
+if __name__ == "__main__":
+    sys.exit(main())
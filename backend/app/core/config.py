@@ -19,6 +19,48 @@ class Settings(BaseSettings):
     MAX_PDF_MB: int = 25
     MAX_RULES_MB: int = 2
     REQUEST_BODY_LIMIT_MB: int = 30
+
+    ENGINE_CACHE_SIZE: int = 32
+
+    JOB_QUEUE_BACKEND: str = "memory"
+    JOB_WORKERS: int = 2
+    JOB_MAX_PENDING: int = 100
+    JOB_RETENTION_TTL: float = 604800.0
+
+    PIPELINE_WORKERS: int = 2
+    PIPELINE_QUEUE_LIMIT: int = 8
+    PIPELINE_RETRY_AFTER: int = 5
+
+    RESULT_CACHE_SIZE: int = 128
+    RESULT_CACHE_TTL: float = 86400.0
+    RESULT_CACHE_NONDETERMINISTIC_TTL: float = 600.0
+    RESULT_CACHE_DIR: str = ""
+
+    SLIDE_CACHE_SIZE: int = 20000
+    SLIDE_CACHE_PATH: str = ""
+    SLIDE_CACHE_MAX_ROWS: int = 200000
+
+    TRACE_SAMPLE_RATE: float = 0.0
+    TRACE_DIR: str = ""
+    TRACE_DEBUG_ENABLED: bool = False
+
+    BATCH_MAX_FILES: int = 500
+    BATCH_REQUEST_BODY_LIMIT_MB: int = 2048
+
+    SPELLER_API_URL: str = "https://speller.yandex.net/services/spellservice.json"
+    SPELLER_TIMEOUT: float = 5.0
+    SPELLER_POOL_SIZE: int = 8
+    SPELLER_CONCURRENCY: int = 4
+    SPELLER_RATE_LIMIT: float = 0.0
+    SPELLER_BREAKER_THRESHOLD: int = 3
+    SPELLER_BREAKER_RESET: float = 30.0
+    SPELLING_CACHE_SIZE: int = 50000
+    SPELLING_CACHE_PATH: str = ""
+    SPELLING_DICTIONARIES: List[str] = []
+    SPELLING_INDEX_PATH: str = ""
+    SPELLING_MAX_EDIT_DISTANCE: int = 2
+
+    CHECK_PLUGINS: List[str] = []
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -37,6 +79,18 @@ class Settings(BaseSettings):
     def request_body_limit_bytes(self) -> int:
         return int(self.REQUEST_BODY_LIMIT_MB) * 1024 * 1024
 
+    @property
+    def batch_request_body_limit_bytes(self) -> int:
+        return int(self.BATCH_REQUEST_BODY_LIMIT_MB) * 1024 * 1024
+
+    @property
+    def max_pdf_bytes(self) -> int:
+        return int(self.MAX_PDF_MB) * 1024 * 1024
+
+    @property
+    def max_rules_bytes(self) -> int:
+        return int(self.MAX_RULES_MB) * 1024 * 1024
+
     @property
     def upload_path(self) -> Path:
         return Path(self.UPLOAD_DIR).resolve()
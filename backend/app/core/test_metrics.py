@@ -0,0 +1,95 @@
+"""
+Тесты метрик в формате Prometheus
+"""
+
+import pytest
+
+from app.core.metrics import MetricsRegistry, STAGES, observe_pipeline, STAGE_SECONDS, CHECK_SECONDS
+
+
+def sample_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+class TestMetricsRegistry:
+    """Тесты формата экспорта метрик"""
+
+    def test_counter_with_labels(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Запросы", ["method", "status"])
+
+        requests.labels("GET", "200").inc()
+        requests.labels("GET", "200").inc(2)
+        requests.labels("POST", "500").inc()
+
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{method="GET",status="200"} 3' in text
+        assert 'requests_total{method="POST",status="500"} 1' in text
+
+    def test_label_count_is_checked(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Запросы", ["method"])
+
+        with pytest.raises(ValueError):
+            requests.labels("GET", "200")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Задержка", buckets=[0.1, 1.0])
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        lines = sample_lines(registry.render(), "latency_seconds")
+        assert lines == [
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 3.65",
+            "latency_seconds_count 4",
+        ]
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.gauge("value", "Значение", ["name"]).labels('a"b\\c').set(1)
+
+        assert 'value{name="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_callback_metric(self):
+        registry = MetricsRegistry()
+        registry.callback("queue_depth", "Очередь", ["queue"], lambda: [(("jobs",), 4)])
+        registry.callback("rejected_total", "Отказы", [], lambda: [((), 2)], kind="counter")
+
+        text = registry.render()
+        assert 'queue_depth{queue="jobs"} 4' in text
+        assert "# TYPE rejected_total counter" in text
+        assert "rejected_total 2" in text
+
+    def test_register_returns_existing_metric(self):
+        registry = MetricsRegistry()
+
+        first = registry.counter("requests_total", "Запросы")
+        assert registry.counter("requests_total", "Запросы") is first
+
+
+class TestObservePipeline:
+    """Тесты учета результатов конвейера"""
+
+    def test_records_stage_and_check_timings(self):
+        stage = STAGE_SECONDS.labels("extract")
+        check = CHECK_SECONDS.labels("TestOnlyCheck")
+        stages_before = sum(stage.counts)
+
+        observe_pipeline({
+            "presentation": {"total_slides": 3},
+            "timing": {
+                "stages": {name: 1.5 for name in STAGES},
+                "checks": {"TestOnlyCheck": 0.25},
+                "slide_cache": None
+            }
+        })
+
+        assert sum(stage.counts) == stages_before + 1
+        assert sum(check.counts) == 1
+        assert check.sum == pytest.approx(0.00025)
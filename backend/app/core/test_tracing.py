@@ -0,0 +1,113 @@
+"""
+Тесты трассировки конвейера обработки
+"""
+
+import json
+
+from app.core.tracing import current_trace, should_sample, span, traced, write_trace
+from app.services.pipeline_executor import run_pipeline
+from benchmarks.pdf_fixtures import build_pdf
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 3}
+      severity: error
+  - rule:
+      name: "Минимальный шрифт"
+      level: slide
+      check: font_min_size
+      params: {min: 10}
+      severity: warning
+"""
+
+
+def contains(outer, inner):
+    return outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+class TestTracing:
+    """Тесты записи интервалов"""
+
+    def test_spans_are_noop_without_trace(self):
+        assert current_trace() is None
+        with span("outer", page=1):
+            assert current_trace() is None
+
+    def test_disabled_trace_is_not_activated(self):
+        with traced(False) as trace:
+            assert trace is None
+            assert current_trace() is None
+
+    def test_nested_spans(self):
+        with traced(True, "abc") as trace:
+            with span("outer", page=1):
+                with span("inner"):
+                    pass
+        assert current_trace() is None
+
+        chrome = trace.to_chrome()
+        outer, inner = chrome["traceEvents"]
+        assert chrome["otherData"]["trace_id"] == "abc"
+        assert (outer["name"], inner["name"]) == ("outer", "inner")
+        assert outer["ph"] == "X" and outer["args"] == {"page": 1}
+        assert contains(outer, inner)
+
+    def test_span_records_error(self):
+        with traced(True) as trace:
+            try:
+                with span("failing"):
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+
+        assert trace.events[0]["args"]["error"] == "ValueError"
+
+    def test_sampling(self):
+        assert not should_sample(0.0)
+        assert should_sample(1.0)
+        assert should_sample(0.5, rng=lambda: 0.1)
+        assert not should_sample(0.5, rng=lambda: 0.9)
+
+    def test_write_trace(self, tmp_path):
+        with traced(True) as trace:
+            with span("outer"):
+                pass
+
+        path = write_trace(tmp_path / "traces", trace.to_chrome())
+
+        assert json.loads(path.read_text(encoding="utf-8"))["traceEvents"][0]["name"] == "outer"
+
+
+class TestPipelineTracing:
+    """Тесты трассировки полного конвейера"""
+
+    def test_pipeline_spans_are_nested(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(2))
+
+        result = run_pipeline(str(pdf_path), RULES, "deck.pdf", "rules.yaml", trace=True)
+
+        events = result["trace"]["traceEvents"]
+        by_name = {}
+        for event in events:
+            by_name.setdefault(event["name"], []).append(event)
+
+        root = by_name["file_service.process_file"][0]
+        assert all(contains(root, event) for event in by_name["pdf.extract"] + by_name["engine.slide"])
+        assert [event["args"]["page"] for event in by_name["engine.slide"]] == [1, 2]
+
+        checks = by_name["Минимальный шрифт"]
+        assert len(checks) == 2
+        assert all(any(contains(slide, check) for slide in by_name["engine.slide"]) for check in checks)
+        assert checks[0]["args"]["check"] == "FontMinSizeSlideCheck"
+        assert by_name["Количество слайдов"][0]["cat"] == "check"
+
+    def test_pipeline_without_trace(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(2))
+
+        assert "trace" not in run_pipeline(str(pdf_path), RULES, "deck.pdf", "rules.yaml")
@@ -0,0 +1,112 @@
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_active: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+
+class Span:
+
+    __slots__ = ("trace", "name", "category", "args", "started")
+
+    def __init__(self, trace: "Trace", name: str, category: str, args: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.category = category
+        self.args = args
+        self.started = 0
+
+    def __enter__(self) -> "Span":
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.trace.end(self.name, self.category, self.started, self.args)
+
+class _NoopSpan:
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+_NOOP_SPAN = _NoopSpan()
+
+class Trace:
+
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = "pipeline", **args: Any) -> Span:
+        return Span(self, name, category, args)
+
+    def begin(self) -> int:
+        return time.perf_counter_ns()
+
+    def end(self, name: str, category: str, started: int, args: Optional[Dict[str, Any]] = None) -> None:
+        finished = time.perf_counter_ns()
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (started - self._origin) / 1000,
+            "dur": (finished - started) / 1000,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+            "args": args or {}
+        })
+
+    def to_chrome(self) -> Dict[str, Any]:
+        return {
+            "traceEvents": sorted(self.events, key=lambda event: (event["ts"], -event["dur"])),
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.trace_id}
+        }
+
+def current_trace() -> Optional[Trace]:
+    return _active.get()
+
+def span(name: str, category: str = "pipeline", **args: Any):
+    trace = _active.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return Span(trace, name, category, args)
+
+def should_sample(rate: float, rng: Callable[[], float] = random.random) -> bool:
+    return rate > 0 and (rate >= 1 or rng() < rate)
+
+@contextmanager
+def traced(enabled: bool, trace_id: Optional[str] = None) -> Iterator[Optional[Trace]]:
+    if not enabled:
+        yield None
+        return
+
+    trace = Trace(trace_id)
+    token = _active.set(trace)
+    try:
+        yield trace
+    finally:
+        _active.reset(token)
+
+def write_trace(directory: Path, chrome_trace: Dict[str, Any]) -> Path:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    trace_id = chrome_trace.get("otherData", {}).get("trace_id") or uuid.uuid4().hex
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    path = directory / f"{stamp}-{trace_id[:12]}.json"
+    path.write_text(json.dumps(chrome_trace, ensure_ascii=False), encoding="utf-8")
+    return path
@@ -44,6 +44,15 @@ class PresentationDetailResponse(BaseModel):
     processing_time: float
     created_at: datetime
 
+class RuleProfileResponse(BaseModel):
+    profile_id: str
+    version: int
+    rules_hash: str
+    filename: str
+    rules_count: int
+    created_at: datetime
+    versions: Optional[List[int]] = None
+
 class ErrorResponse(BaseModel):
     error: str
     detail: Optional[str] = None
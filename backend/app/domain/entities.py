@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Callable, Hashable, TypeVar
 from enum import Enum
 from pathlib import Path
 
+T = TypeVar("T")
+
 class ListType(Enum):
     NONE = "none"
     BULLET = "bullet"
@@ -38,6 +40,82 @@ class Paragraph:
     list_number: Optional[int] = None
     list_prefix: str = ""
     bbox: Optional[Tuple[float, float, float, float]] = None
+    text_id: Optional[int] = None
+
+@dataclass
+class TextPool:
+    texts: List[str] = field(default_factory=list)
+    references: int = 0
+    _ids: Dict[str, int] = field(default_factory=dict, repr=False)
+    _memo: Dict[Tuple[Hashable, int], Any] = field(default_factory=dict, repr=False)
+    _hits: Dict[Hashable, int] = field(default_factory=dict, repr=False)
+    _misses: Dict[Hashable, int] = field(default_factory=dict, repr=False)
+
+    def intern(self, text: str) -> int:
+        self.references += 1
+        text_id = self._ids.get(text)
+        if text_id is None:
+            text_id = len(self.texts)
+            self._ids[text] = text_id
+            self.texts.append(text)
+        return text_id
+
+    def text(self, text_id: int) -> str:
+        return self.texts[text_id]
+
+    def memoize(self, namespace: Hashable, text_id: int, compute: Callable[[str], T]) -> T:
+        key = (namespace, text_id)
+        if key in self._memo:
+            self._hits[namespace] = self._hits.get(namespace, 0) + 1
+            return self._memo[key]
+
+        self._misses[namespace] = self._misses.get(namespace, 0) + 1
+        value = compute(self.texts[text_id])
+        self._memo[key] = value
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        memo = {}
+        for namespace in sorted(set(self._hits) | set(self._misses), key=str):
+            hits = self._hits.get(namespace, 0)
+            misses = self._misses.get(namespace, 0)
+            name = namespace[0] if isinstance(namespace, tuple) else namespace
+            entry = memo.setdefault(str(name), {"hits": 0, "misses": 0})
+            entry["hits"] += hits
+            entry["misses"] += misses
+
+        for entry in memo.values():
+            entry["hit_rate"] = round(entry["hits"] / (entry["hits"] + entry["misses"]), 3)
+
+        return {
+            "distinct_texts": len(self.texts),
+            "references": self.references,
+            "dedup_ratio": round(1 - len(self.texts) / self.references, 3) if self.references else 0.0,
+            "memo": memo
+        }
+
+@dataclass
+class PageNumberSlot:
+    bbox: Tuple[float, float, float, float]
+    cells: Tuple[Tuple[int, int], ...]
+    position: PageNumberPosition
+    support: int
+    observed: int
+    offset: Optional[int] = None
+
+    @property
+    def confidence(self) -> float:
+        return self.support / self.observed if self.observed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bbox": [round(v, 4) for v in self.bbox],
+            "position": self.position.value,
+            "support": self.support,
+            "observed": self.observed,
+            "confidence": round(self.confidence, 3),
+            "offset": self.offset,
+        }
 
 @dataclass
 class Slide:
@@ -49,6 +127,15 @@ class Slide:
     detected_page_number: Optional[str] = None
     page_number_position: PageNumberPosition = PageNumberPosition.NONE
     page_number_bbox: Optional[Tuple[float, float, float, float]] = None
+    fingerprint: Optional[str] = None
+    content_key: Optional[str] = None
+    font_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    text_pool: Optional[TextPool] = field(default=None, repr=False, compare=False)
+
+    def memoize_text(self, namespace: Hashable, block: Paragraph, compute: Callable[[str], T]) -> T:
+        if self.text_pool is None or block.text_id is None:
+            return compute(block.text)
+        return self.text_pool.memoize(namespace, block.text_id, compute)
 
 @dataclass
 class Presentation:
@@ -56,11 +143,26 @@ class Presentation:
     slides: List[Slide]
     metadata: Dict[str, Any] = field(default_factory=dict)
     fonts_used: Dict[str, Any] = field(default_factory=dict)
+    page_number_slot: Optional[PageNumberSlot] = None
+    text_pool: Optional[TextPool] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         if isinstance(self.file_path, str):
             self.file_path = Path(self.file_path)
 
+    def intern_texts(self) -> TextPool:
+        pool = TextPool()
+        for slide in self.slides:
+            slide.text_pool = pool
+            for block in slide.blocks:
+                block.text_id = pool.intern(block.text)
+        self.text_pool = pool
+        return pool
+
+    def distinct_texts(self, slides: Optional[List[Slide]] = None) -> List[str]:
+        slides = self.slides if slides is None else slides
+        return list(dict.fromkeys(block.text for slide in slides for block in slide.blocks))
+
     def get_slide_by_number(self, number: int) -> Optional[Slide]:
         for slide in self.slides:
             if slide.page_number == number:
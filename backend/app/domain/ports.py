@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Protocol,List,Dict
+from typing import Container, Protocol, List, Dict, Optional
 from pathlib import Path
 from .entities import Presentation, TextRun, Slide, Paragraph
 
 class PdfExtractor(Protocol):
-    def extract(self, file_path: Path) -> Presentation:
+    def extract(self, file_path: Path, known_pages: Optional[Container[str]] = None) -> Presentation:
         ...
 class TextNormalizer(Protocol):
     def normalize_symbols(self, raw_chars: List[Dict]) -> List[TextRun]:
@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 import sys
 
@@ -7,11 +8,30 @@ from fastapi.middleware.cors import CORSMiddleware
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.services.pdf.pdf_processing import PdfProcessingService
 from app.core.config import get_settings
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, get_logger
+from app.core.web.middleware import BodySizeLimitMiddleware, HttpMetricsMiddleware
+from app.services.jobs import get_job_service
+from app.services.pipeline_executor import get_pipeline_executor
+from app.services.profile_service import get_profile_store
 from app.v1.routers import router
 
+logger = get_logger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmed = get_profile_store().warm()
+    logger.info("Загружено профилей правил: %s", warmed)
+
+    pipeline = get_pipeline_executor()
+    pipeline.start()
+
+    jobs = get_job_service()
+    jobs.start()
+    yield
+    jobs.stop()
+    pipeline.shutdown()
+
 def create_app() -> FastAPI:
     s = get_settings()
     setup_logging()
@@ -21,8 +41,15 @@ def create_app() -> FastAPI:
         version=s.APP_VERSION,
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        max_bytes=s.request_body_limit_bytes,
+        path_limits={f"{s.API_V1_PREFIX}/validate/batch": s.batch_request_body_limit_bytes},
+    )
+    app.add_middleware(HttpMetricsMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=s.CORS_ORIGINS,
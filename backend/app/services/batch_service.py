@@ -0,0 +1,138 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Tuple
+
+from app.core.logging import get_logger
+from app.services.dsl import rules_hash
+from app.services.file_service import FileService
+from app.services.pipeline_executor import PipelineExecutor
+from app.services.result_cache import ResultCache, result_cache_key
+
+logger = get_logger(__name__)
+
+@dataclass(frozen=True)
+class BatchFile:
+    filename: str
+    path: Optional[Path] = None
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+class BatchSummary:
+
+    def __init__(self, rules_name: str):
+        self.rules_name = rules_name
+        self.files = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.errors = 0
+        self.rules: Dict[str, Dict[str, Any]] = {}
+        self._started = time.perf_counter()
+
+    def add_result(self, filename: str, response: Dict[str, Any]) -> None:
+        self.files += 1
+        if response["status"] == "success":
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+        for item in response["detailed_results"]:
+            stats = self.rules.setdefault(item["rule_name"], {
+                "rule_name": item["rule_name"],
+                "severity": item["severity"],
+                "passed": 0,
+                "failed": 0,
+                "skipped": 0,
+                "failed_files": []
+            })
+            stats[item["status"]] += 1
+            if item["status"] == "failed" and filename not in stats["failed_files"]:
+                stats["failed_files"].append(filename)
+
+    def add_error(self) -> None:
+        self.files += 1
+        self.errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        rules = sorted(self.rules.values(), key=lambda stats: (-stats["failed"], stats["rule_name"]))
+        return {
+            "rules_name": self.rules_name,
+            "files": self.files,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "errors": self.errors,
+            "rules": rules,
+            "elapsed_ms": round((time.perf_counter() - self._started) * 1000, 2)
+        }
+
+async def run_batch(
+    executor: PipelineExecutor,
+    files: Sequence[BatchFile],
+    yaml_content: str,
+    rules_name: str,
+    concurrency: Optional[int] = None,
+    cache: Optional[ResultCache] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    summary = BatchSummary(rules_name)
+    window = concurrency or max(1, executor.workers) * 2
+    rules_sha256 = rules_hash(yaml_content)
+    pending: Dict[asyncio.Future, int] = {}
+    queue = iter(enumerate(files))
+
+    async def check(batch_file: BatchFile) -> Tuple[Dict[str, Any], str]:
+        if batch_file.path is None:
+            raise ValueError(batch_file.error or "Файл не загружен")
+
+        key = None
+        if cache is not None and batch_file.sha256:
+            key = result_cache_key(batch_file.sha256, rules_sha256, batch_file.filename, rules_name)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached.response, "hit"
+
+        await executor.admit_when_free()
+        try:
+            result = await executor.run(batch_file.path, yaml_content, batch_file.filename, rules_name)
+        finally:
+            executor.release()
+        response = FileService.to_response(result)
+        if key is not None:
+            cache.put(key, response, result.get("deterministic", False))
+        return response, "miss"
+
+    def launch() -> None:
+        for index, batch_file in queue:
+            pending[asyncio.ensure_future(check(batch_file))] = index
+            if len(pending) >= window:
+                return
+
+    try:
+        launch()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                batch_file = files[index]
+                item: Dict[str, Any] = {
+                    "type": "file",
+                    "index": index,
+                    "filename": batch_file.filename,
+                    "sha256": batch_file.sha256
+                }
+                if future.exception() is not None:
+                    logger.warning("Ошибка проверки файла %s в пакете: %s", batch_file.filename, future.exception())
+                    summary.add_error()
+                    item.update({"status": "error", "error": str(future.exception())})
+                else:
+                    response, cache_status = future.result()
+                    summary.add_result(batch_file.filename, response)
+                    item.update(response)
+                    item["cache"] = cache_status
+                yield item
+            launch()
+    finally:
+        for future in pending:
+            future.cancel()
+
+    yield {"type": "summary", **summary.to_dict()}
@@ -4,10 +4,20 @@ from app.services.dsl.yaml_parser import (
     load_validation_engine,
     load_validation_engine_from_string
 )
+from app.services.dsl.plugins import CheckSpec
+from app.services.dsl.engine_cache import (
+    CompiledEngineCache,
+    get_engine_cache,
+    rules_hash
+)
 
 __all__ = [
     'DSLParser',
     'DSLParseError',
     'load_validation_engine',
-    'load_validation_engine_from_string'
+    'load_validation_engine_from_string',
+    'CheckSpec',
+    'CompiledEngineCache',
+    'get_engine_cache',
+    'rules_hash'
 ]
@@ -0,0 +1,97 @@
+import re
+from typing import Any, Callable, Hashable, Iterable, List, Set, Tuple
+
+from app.services.kernel.slide_features import SlideFeatures
+
+class ConditionError(Exception):
+    pass
+
+Predicate = Callable[[SlideFeatures], bool]
+
+class RuleCondition:
+    
+    def __init__(self, predicates: List[Predicate], key: Hashable):
+        self.predicates = tuple(predicates)
+        self.key = key
+    
+    def matches(self, features: SlideFeatures) -> bool:
+        for predicate in self.predicates:
+            if not predicate(features):
+                return False
+        return True
+
+class ConditionParser:
+    
+    SUPPORTED_KEYS = ('has_lists', 'min_blocks', 'max_blocks', 'title_matches', 'tags')
+    
+    @staticmethod
+    def parse(when: Any, known_tags: Iterable[str] = ()) -> RuleCondition:
+        if not isinstance(when, dict) or not when:
+            raise ConditionError("'when' должен быть непустым словарем условий")
+        
+        unknown = [key for key in when if key not in ConditionParser.SUPPORTED_KEYS]
+        if unknown:
+            raise ConditionError(
+                f"Неизвестные условия в 'when': {', '.join(map(str, unknown))}. "
+                f"Доступные условия: {list(ConditionParser.SUPPORTED_KEYS)}"
+            )
+        
+        predicates: List[Predicate] = []
+        key: List[Tuple[str, Hashable]] = []
+        
+        if 'has_lists' in when:
+            expected = ConditionParser._parse_bool('has_lists', when['has_lists'])
+            predicates.append(lambda f, expected=expected: f.has_lists == expected)
+            key.append(('has_lists', expected))
+        
+        if 'min_blocks' in when:
+            min_blocks = ConditionParser._parse_int('min_blocks', when['min_blocks'])
+            predicates.append(lambda f, min_blocks=min_blocks: f.blocks_count >= min_blocks)
+            key.append(('min_blocks', min_blocks))
+        
+        if 'max_blocks' in when:
+            max_blocks = ConditionParser._parse_int('max_blocks', when['max_blocks'])
+            predicates.append(lambda f, max_blocks=max_blocks: f.blocks_count <= max_blocks)
+            key.append(('max_blocks', max_blocks))
+        
+        if 'title_matches' in when:
+            pattern = when['title_matches']
+            if not isinstance(pattern, str):
+                raise ConditionError("'title_matches' должен быть строкой с регулярным выражением")
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                raise ConditionError(f"Некорректное регулярное выражение в 'title_matches': {e}")
+            predicates.append(lambda f, compiled=compiled: compiled.search(f.title) is not None)
+            key.append(('title_matches', pattern))
+        
+        if 'tags' in when:
+            tags = ConditionParser._parse_tags(when['tags'], set(known_tags))
+            predicates.append(lambda f, tags=tags: not tags.isdisjoint(f.tags))
+            key.append(('tags', tuple(sorted(tags))))
+        
+        return RuleCondition(predicates, tuple(key))
+    
+    @staticmethod
+    def _parse_bool(name: str, value: Any) -> bool:
+        if not isinstance(value, bool):
+            raise ConditionError(f"'{name}' должен быть true или false")
+        return value
+    
+    @staticmethod
+    def _parse_int(name: str, value: Any) -> int:
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ConditionError(f"'{name}' должен быть неотрицательным целым числом")
+        return value
+    
+    @staticmethod
+    def _parse_tags(value: Any, known_tags: Set[str]) -> frozenset:
+        tags = [value] if isinstance(value, str) else value
+        if not isinstance(tags, list) or not tags or not all(isinstance(tag, str) for tag in tags):
+            raise ConditionError("'tags' должен быть строкой или списком строк")
+        
+        unknown = [tag for tag in tags if tag not in known_tags]
+        if unknown:
+            raise ConditionError(f"Неизвестные теги слайдов: {', '.join(unknown)}")
+        
+        return frozenset(tags)
@@ -0,0 +1,73 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Union
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.services.kernel.validation_engine import ValidationEngine
+from app.services.dsl.yaml_parser import load_validation_engine_from_string
+
+logger = get_logger(__name__)
+
+def rules_hash(yaml_content: Union[str, bytes]) -> str:
+    if isinstance(yaml_content, str):
+        yaml_content = yaml_content.encode('utf-8')
+    return hashlib.sha256(yaml_content).hexdigest()
+
+class CompiledEngineCache:
+    
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._engines: "OrderedDict[str, ValidationEngine]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_compile(self, yaml_content: str) -> ValidationEngine:
+        key = rules_hash(yaml_content)
+        
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                self.hits += 1
+                return engine
+            self.misses += 1
+        
+        engine = load_validation_engine_from_string(yaml_content)
+        engine.rules_hash = key
+        
+        with self._lock:
+            cached = self._engines.get(key)
+            if cached is not None:
+                return cached
+            
+            self._engines[key] = engine
+            while len(self._engines) > self.maxsize:
+                evicted, _ = self._engines.popitem(last=False)
+                logger.debug("Скомпилированные правила %s вытеснены из кэша", evicted[:12])
+        
+        return engine
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._engines.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._engines),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+@lru_cache(maxsize=1)
+def get_engine_cache() -> CompiledEngineCache:
+    return CompiledEngineCache(maxsize=get_settings().ENGINE_CACHE_SIZE)
@@ -0,0 +1,142 @@
+import importlib
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from app.services.kernel.slide_features import SLIDE_FEATURES
+
+ENTRY_POINT_GROUP = "pptx_dsl.checks"
+
+LEVELS = ('presentation', 'slide')
+COSTS = ('cpu', 'io', 'network')
+PARAM_TYPES: Dict[str, Tuple[type, ...]] = {
+    'integer': (int,),
+    'number': (int, float),
+    'boolean': (bool,),
+    'string': (str,),
+    'list': (list, tuple),
+    'mapping': (dict,)
+}
+
+class PluginError(Exception):
+    pass
+
+@dataclass(frozen=True)
+class CheckSpec:
+    name: str
+    presentation: Optional[str] = None
+    slide: Optional[str] = None
+    default_level: Optional[str] = None
+    params: Optional[Mapping[str, str]] = None
+    cost: str = 'cpu'
+    deterministic: Optional[bool] = None
+    reads: FrozenSet[str] = field(default_factory=frozenset)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'reads', frozenset(self.reads))
+        if not self.available_levels:
+            raise PluginError(f"Проверка {self.name} не объявляет ни одного уровня")
+        if self.default_level is not None and self.default_level not in self.available_levels:
+            raise PluginError(f"Проверка {self.name}: уровень по умолчанию {self.default_level} не объявлен")
+        if self.cost not in COSTS:
+            raise PluginError(f"Проверка {self.name}: неизвестная стоимость {self.cost}, ожидается одна из {list(COSTS)}")
+        unknown_types = {kind for kind in (self.params or {}).values() if kind not in PARAM_TYPES}
+        if unknown_types:
+            raise PluginError(f"Проверка {self.name}: неизвестные типы параметров {sorted(unknown_types)}")
+        unknown_features = self.reads - SLIDE_FEATURES
+        if unknown_features:
+            raise PluginError(f"Проверка {self.name}: неизвестные признаки слайда {sorted(unknown_features)}")
+
+    @property
+    def available_levels(self) -> List[str]:
+        return [level for level in LEVELS if getattr(self, level) is not None]
+
+    def class_path(self, level: str) -> str:
+        return getattr(self, level)
+
+    def validate_params(self, params: Any) -> List[str]:
+        if params is None:
+            return []
+        if not isinstance(params, dict):
+            return ["'params' должен быть словарем"]
+        if self.params is None:
+            return []
+
+        errors = []
+        for name, value in params.items():
+            kind = self.params.get(name)
+            if kind is None:
+                errors.append(f"неизвестный параметр '{name}', доступные: {sorted(self.params)}")
+            elif value is not None and not _matches(value, kind):
+                errors.append(f"параметр '{name}' должен иметь тип {kind}")
+        return errors
+
+def _matches(value: Any, kind: str) -> bool:
+    if isinstance(value, bool) and kind != 'boolean':
+        return False
+    return isinstance(value, PARAM_TYPES[kind])
+
+def _load_object(reference: str) -> Any:
+    module_name, _, attribute = reference.partition(':')
+    try:
+        target = importlib.import_module(module_name.strip())
+        for part in attribute.strip().split('.') if attribute else ():
+            target = getattr(target, part)
+    except (ImportError, AttributeError) as e:
+        raise PluginError(f"Не удалось загрузить {reference}: {e}")
+    return target
+
+def _as_spec(name: str, loaded: Any, source: str) -> CheckSpec:
+    spec = loaded() if callable(loaded) and not isinstance(loaded, CheckSpec) else loaded
+    if not isinstance(spec, CheckSpec):
+        raise PluginError(f"{source} должен указывать на CheckSpec, получено {type(spec).__name__}")
+    if spec.name != name:
+        raise PluginError(f"{source} объявляет проверку {spec.name}, а зарегистрирован как {name}")
+    return spec
+
+def parse_plugin_references(references: Iterable[str]) -> Dict[str, str]:
+    parsed = {}
+    for reference in references:
+        name, separator, target = reference.partition('=')
+        if not separator or ':' not in target or not name.strip():
+            raise PluginError(f"Некорректное описание плагина '{reference}', ожидается имя=модуль:объект")
+        parsed[name.strip()] = target.strip()
+    return parsed
+
+class PluginLoader:
+
+    def __init__(self, references: Iterable[str] = (), group: str = ENTRY_POINT_GROUP):
+        self.references = parse_plugin_references(references)
+        self.group = group
+        self._entry_points: Optional[Dict[str, Any]] = None
+        self._loaded: Dict[str, CheckSpec] = {}
+
+    def names(self) -> List[str]:
+        return sorted(set(self.references) | set(self._discover()))
+
+    def load(self, name: str) -> Optional[CheckSpec]:
+        spec = self._loaded.get(name)
+        if spec is not None:
+            return spec
+
+        if name in self.references:
+            reference = self.references[name]
+            spec = _as_spec(name, _load_object(reference), reference)
+        else:
+            entry_point = self._discover().get(name)
+            if entry_point is None:
+                return None
+            source = f"Точка входа {self.group}:{name}"
+            try:
+                loaded = entry_point.load()
+            except Exception as e:
+                raise PluginError(f"{source} не загружается: {e}")
+            spec = _as_spec(name, loaded, source)
+
+        self._loaded[name] = spec
+        return spec
+
+    def _discover(self) -> Dict[str, Any]:
+        if self._entry_points is None:
+            self._entry_points = {entry_point.name: entry_point for entry_point in entry_points(group=self.group)}
+        return self._entry_points
@@ -0,0 +1,62 @@
+"""
+Тесты кэша скомпилированных правил
+"""
+
+import pytest
+
+from app.services.dsl.engine_cache import CompiledEngineCache
+from app.services.dsl.yaml_parser import DSLParseError
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      check: slides_count
+      params:
+        min: 5
+      severity: error
+"""
+
+
+class TestCompiledEngineCache:
+    """Тесты LRU кэша движков валидации"""
+
+    def test_same_rules_reuse_engine(self):
+        cache = CompiledEngineCache(maxsize=4)
+
+        first = cache.get_or_compile(RULES)
+        second = cache.get_or_compile(RULES)
+
+        assert first is second
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert first.rules_hash is not None
+
+    def test_lru_eviction(self):
+        cache = CompiledEngineCache(maxsize=1)
+
+        first = cache.get_or_compile(RULES)
+        cache.get_or_compile(RULES.replace("min: 5", "min: 6"))
+        again = cache.get_or_compile(RULES)
+
+        assert again is not first
+        assert cache.stats()["size"] == 1
+
+    def test_compiled_checks_are_immutable(self):
+        cache = CompiledEngineCache()
+        check = cache.get_or_compile(RULES).presentation_checks[0]
+
+        with pytest.raises(TypeError):
+            check.params['min'] = 1
+
+    def test_parse_error_is_not_cached(self):
+        cache = CompiledEngineCache()
+
+        with pytest.raises(DSLParseError):
+            cache.get_or_compile("rules: 1")
+
+        assert cache.stats()["size"] == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
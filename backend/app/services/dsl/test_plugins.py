@@ -0,0 +1,175 @@
+"""
+Тесты подключения сторонних проверок через реестр плагинов
+"""
+
+import sys
+import textwrap
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun
+from app.services.dsl import plugins
+from app.services.dsl.plugins import CheckSpec, PluginError, PluginLoader
+from app.services.dsl.yaml_parser import CheckRegistry, DSLParseError, load_validation_engine_from_string
+
+SPEC_MODULE = """
+from app.services.dsl.plugins import CheckSpec
+
+TITLE = CheckSpec(
+    name='title_length',
+    slide='corp_checks.impl:TitleLengthCheck',
+    default_level='slide',
+    params={'max': 'integer'},
+    reads={'text'}
+)
+
+def remote_spec(name):
+    return CheckSpec(name=name, slide='corp_checks.impl:RemoteCheck', cost='network')
+
+FIRST = lambda: remote_spec('remote_first')
+SECOND = lambda: remote_spec('remote_second')
+CONFLICT = CheckSpec(name='remote_conflict', slide='corp_checks.impl:RemoteCheck', deterministic=False)
+"""
+
+IMPL_MODULE = """
+import threading
+
+from app.services.kernel.base_checks import SlideCheck
+from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
+
+BARRIER = threading.Barrier(2, timeout=5)
+
+class TitleLengthCheck(SlideCheck):
+
+    def validate(self, slide):
+        title = slide.blocks[0].text if slide.blocks else ""
+        failed = len(title) > self.params.get('max', 40)
+        return ValidationResult(
+            status=ValidationStatus.FAILED if failed else ValidationStatus.PASSED,
+            severity=Severity[self.severity.upper()],
+            rule_name=self.rule_name,
+            message=f"Слайд {slide.page_number}: заголовок из {len(title)} символов"
+        )
+
+class RemoteCheck(SlideCheck):
+
+    @property
+    def deterministic(self):
+        return self.params.get('cached', False)
+
+    def prepare(self, presentation):
+        BARRIER.wait()
+
+    def validate(self, slide):
+        return ValidationResult(
+            status=ValidationStatus.PASSED,
+            severity=Severity[self.severity.upper()],
+            rule_name=self.rule_name,
+            message=f"Слайд {slide.page_number}: проверено"
+        )
+"""
+
+RULES = """
+rules:
+  - rule:
+      name: "Короткий заголовок"
+      check: title_length
+      params: {max: 10}
+      severity: warning
+"""
+
+
+@pytest.fixture
+def corp_checks(tmp_path, monkeypatch):
+    package = tmp_path / "corp_checks"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "specs.py").write_text(textwrap.dedent(SPEC_MODULE), encoding="utf-8")
+    (package / "impl.py").write_text(textwrap.dedent(IMPL_MODULE), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    CheckRegistry.use_plugins(None)
+    for name in [name for name in sys.modules if name.startswith("corp_checks")]:
+        del sys.modules[name]
+
+
+def make_slide(number, title):
+    run = TextRun(text=title, font_family="Arial", font_size=24, bbox=(0, 0, 10, 10))
+    return Slide(page_number=number, width=960, height=540, blocks=[Paragraph(text=title, runs=[run])])
+
+
+class TestCheckPlugins:
+    """Тесты обнаружения, ленивой загрузки и метаданных проверок"""
+
+    def test_configured_plugin_is_loaded_on_first_reference(self, corp_checks):
+        CheckRegistry.use_plugins(PluginLoader(["title_length=corp_checks.specs:TITLE"]))
+        load_validation_engine_from_string(
+            "rules:\n  - rule: {name: n, check: slides_count, params: {max: 3}, severity: info}\n"
+        )
+        assert "corp_checks.specs" not in sys.modules
+
+        engine = load_validation_engine_from_string(RULES)
+        results = engine.validate(Presentation(file_path="deck.pdf", slides=[make_slide(1, "Очень длинный заголовок")]))
+
+        check = engine.slide_checks[0]
+        assert (check.cost, check.reads, check.deterministic) == ("cpu", frozenset({"text"}), True)
+        assert results[0].status.value == "failed"
+        assert "title_length" in CheckRegistry.available()
+
+    def test_params_are_validated_against_schema(self, corp_checks):
+        CheckRegistry.use_plugins(PluginLoader(["title_length=corp_checks.specs:TITLE"]))
+
+        with pytest.raises(DSLParseError, match="тип integer"):
+            load_validation_engine_from_string(RULES.replace("{max: 10}", "{max: 'десять'}"))
+        with pytest.raises(DSLParseError, match="неизвестный параметр 'min'"):
+            load_validation_engine_from_string(RULES.replace("{max: 10}", "{min: 10}"))
+        with pytest.raises(DSLParseError, match="тип number"):
+            load_validation_engine_from_string(
+                "rules:\n  - rule: {name: n, check: font_min_size, level: slide, params: {min: true}, severity: info}\n"
+            )
+        load_validation_engine_from_string(
+            "rules:\n  - rule: {name: n, check: sentence_length, params: {max: 25.0}, severity: info}\n"
+        )
+
+    def test_entry_points_run_network_prepares_concurrently(self, corp_checks, monkeypatch):
+        group = plugins.ENTRY_POINT_GROUP
+        monkeypatch.setattr(plugins, "entry_points", lambda group: [
+            EntryPoint("remote_first", "corp_checks.specs:FIRST", group),
+            EntryPoint("remote_second", "corp_checks.specs:SECOND", group)
+        ])
+        CheckRegistry.use_plugins(PluginLoader())
+
+        engine = load_validation_engine_from_string(
+            "rules:\n"
+            "  - rule: {name: a, check: remote_first, params: {}, severity: info}\n"
+            "  - rule: {name: b, check: remote_second, params: {}, severity: info}\n"
+        )
+        results = engine.validate(Presentation(file_path="deck.pdf", slides=[make_slide(1, "Итоги")]))
+
+        assert [result.status.value for result in results] == ["passed", "passed"]
+        assert all(check.cost == "network" for check in engine.slide_checks)
+        assert not engine.deterministic
+        assert "deterministic" not in vars(engine.slide_checks[0])
+
+    def test_invalid_plugins_are_reported(self, corp_checks):
+        with pytest.raises(PluginError):
+            CheckSpec(name="broken", cost="gpu", slide="corp_checks.impl:RemoteCheck")
+        with pytest.raises(PluginError):
+            PluginLoader(["corp_checks.specs:TITLE"])
+
+        CheckRegistry.use_plugins(PluginLoader(["other_name=corp_checks.specs:TITLE"]))
+        with pytest.raises(DSLParseError, match="объявляет проверку title_length"):
+            load_validation_engine_from_string(RULES.replace("title_length", "other_name"))
+        with pytest.raises(DSLParseError, match="Неизвестный тип проверки"):
+            load_validation_engine_from_string(RULES.replace("title_length", "missing_check"))
+
+        CheckRegistry.use_plugins(PluginLoader(["remote_conflict=corp_checks.specs:CONFLICT"]))
+        with pytest.raises(DSLParseError, match="deterministic задан и в CheckSpec"):
+            load_validation_engine_from_string(
+                "rules:\n  - rule: {name: r, check: remote_conflict, params: {}, severity: info}\n"
+            )
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -10,6 +10,7 @@ from app.services.dsl.yaml_parser import (
     load_validation_engine_from_string
 )
 from app.services.kernel.validation_engine import ValidationEngine
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun, ListType
 
 
 class TestScopeParser:
@@ -268,6 +269,119 @@ rules:
             load_validation_engine_from_string(yaml_string)
 
 
+
+def make_slide(number, texts, list_type=ListType.NONE):
+    blocks = [
+        Paragraph(text=text, runs=[TextRun(text=text, font_size=14)], list_type=list_type if i else ListType.NONE)
+        for i, text in enumerate(texts)
+    ]
+    return Slide(page_number=number, width=960, height=540, blocks=blocks)
+
+
+class TestConditions:
+    """Тесты условий when"""
+
+    RULES = """
+slide_tags:
+  appendix: 3-4
+rules:
+  - rule:
+      name: "Пункты списков"
+      check: list_items_count
+      when:
+        has_lists: true
+      params:
+        max_items: 5
+      severity: warning
+  - rule:
+      name: "Плотность приложений"
+      check: text_density
+      when:
+        tags: appendix
+        min_blocks: 2
+      params:
+        max_blocks: 10
+      severity: info
+  - rule:
+      name: "Заголовки разделов"
+      check: heading_presence
+      when:
+        title_matches: "^Раздел"
+      params:
+        required: true
+      severity: info
+"""
+
+    def test_rules_skipped_on_non_matching_slides(self):
+        engine = load_validation_engine_from_string(self.RULES)
+        presentation = Presentation(file_path="deck.pdf", slides=[
+            make_slide(1, ["Раздел 1"]),
+            make_slide(2, ["Список", "пункт", "пункт"], ListType.BULLET),
+            make_slide(3, ["Приложение", "текст"]),
+            make_slide(4, ["Приложение"]),
+        ])
+
+        results = engine.validate(presentation)
+
+        assert [r.rule_name for r in results] == [
+            "Заголовки разделов",
+            "Пункты списков",
+            "Плотность приложений",
+        ]
+
+    def test_condition_is_part_of_rule_identity(self):
+        engine = load_validation_engine_from_string(self.RULES)
+        keys = {check.rule_key() for check in engine.slide_checks}
+
+        assert len(keys) == 3
+        assert engine.slide_checks[0].condition is not None
+
+    def test_unknown_condition(self):
+        yaml_string = """
+rules:
+  - rule:
+      name: "Заголовки"
+      check: heading_presence
+      when:
+        has_pictures: true
+      params:
+        required: true
+      severity: warning
+"""
+        with pytest.raises(DSLParseError, match="Неизвестные условия"):
+            load_validation_engine_from_string(yaml_string)
+
+    def test_unknown_tag(self):
+        yaml_string = """
+rules:
+  - rule:
+      name: "Заголовки"
+      check: heading_presence
+      when:
+        tags: [appendix]
+      params:
+        required: true
+      severity: warning
+"""
+        with pytest.raises(DSLParseError, match="Неизвестные теги"):
+            load_validation_engine_from_string(yaml_string)
+
+    def test_when_not_allowed_for_presentation_level(self):
+        yaml_string = """
+rules:
+  - rule:
+      name: "Слайды"
+      check: slides_count
+      when:
+        has_lists: true
+      params:
+        min: 5
+      severity: error
+"""
+        with pytest.raises(DSLParseError, match="только для проверок уровня slide"):
+            load_validation_engine_from_string(yaml_string)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
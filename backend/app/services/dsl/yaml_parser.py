@@ -1,179 +1,225 @@
+import importlib
 import yaml
-from typing import List, Dict, Any, Union, Set
+from functools import lru_cache
+from typing import List, Dict, Any, Union, Set, Optional, Type
 from app.services.kernel.validation_engine import ValidationEngine
 from app.services.kernel.base_checks import PresentationCheck, SlideCheck
-from app.services.kernel.checks.slides_count_check import SlidesCountCheck
-from app.services.kernel.checks.font_count_check import FontCountPresentationCheck, FontCountSlideCheck
-from app.services.kernel.checks.heading_presence_check import HeadingPresenceCheck
-from app.services.kernel.checks.font_sizes_count_check import FontSizesCountPresentationCheck, FontSizesCountSlideCheck
-from app.services.kernel.checks.sentence_length_check import SentenceLengthCheck
-from app.services.kernel.checks.list_nesting_check import ListNestingCheck
-from app.services.kernel.checks.list_consistency_check import ListConsistencyPresentationCheck, ListConsistencySlideCheck
-from app.services.kernel.checks.font_min_size_check import FontMinSizePresentationCheck, FontMinSizeSlideCheck
-from app.services.kernel.checks.uppercase_percent_check import UppercasePercentPresentationCheck, UppercasePercentSlideCheck
-from app.services.kernel.checks.elements_count_check import ElementsCountCheck
-from app.services.kernel.checks.spelling_check import SpellingCheck
-from app.services.kernel.checks.bullet_content_check import BulletConsistencyCheck
-from app.services.kernel.checks.list_count_check import ListItemsCountCheck, NestedListsDepthCheck, MixedListsCheck
-from app.services.kernel.checks.numbers_check import SlideNumbersPresentationCheck, SlideNumbersSlideCheck
-from app.services.kernel.checks.text_content_check import (
-    LongPhrasesCheck, ParagraphLengthCheck, SentenceCountCheck, 
-    TextDensityCheck, CapitalizationCheck
-)
+from app.services.dsl.conditions import ConditionParser, ConditionError
+from app.services.dsl.plugins import CheckSpec, PluginError, PluginLoader
+
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 class DSLParseError(Exception):
     pass
 
+_CHECKS = 'app.services.kernel.checks'
+
+BUILTIN_CHECKS: Dict[str, CheckSpec] = {spec.name: spec for spec in (
+    CheckSpec(
+        name='slides_count',
+        presentation=f'{_CHECKS}.slides_count_check:SlidesCountCheck',
+        default_level='presentation',
+        params={'min': 'number', 'max': 'number'}
+    ),
+    CheckSpec(
+        name='font_count',
+        presentation=f'{_CHECKS}.font_count_check:FontCountPresentationCheck',
+        slide=f'{_CHECKS}.font_count_check:FontCountSlideCheck',
+        params={'max': 'number'},
+        reads={'fonts'}
+    ),
+    CheckSpec(
+        name='font_sizes_count',
+        presentation=f'{_CHECKS}.font_sizes_count_check:FontSizesCountPresentationCheck',
+        slide=f'{_CHECKS}.font_sizes_count_check:FontSizesCountSlideCheck',
+        params={'max': 'number'},
+        reads={'fonts'}
+    ),
+    CheckSpec(
+        name='list_consistency',
+        presentation=f'{_CHECKS}.list_consistency_check:ListConsistencyPresentationCheck',
+        slide=f'{_CHECKS}.list_consistency_check:ListConsistencySlideCheck',
+        params={'same_type': 'boolean'},
+        reads={'lists'}
+    ),
+    CheckSpec(
+        name='font_min_size',
+        presentation=f'{_CHECKS}.font_min_size_check:FontMinSizePresentationCheck',
+        slide=f'{_CHECKS}.font_min_size_check:FontMinSizeSlideCheck',
+        params={'min': 'number', 'unit': 'string'},
+        reads={'fonts'}
+    ),
+    CheckSpec(
+        name='uppercase_percent',
+        presentation=f'{_CHECKS}.uppercase_percent_check:UppercasePercentPresentationCheck',
+        slide=f'{_CHECKS}.uppercase_percent_check:UppercasePercentSlideCheck',
+        params={'max': 'number'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='slide_numbers',
+        presentation=f'{_CHECKS}.numbers_check:SlideNumbersPresentationCheck',
+        slide=f'{_CHECKS}.numbers_check:SlideNumbersSlideCheck',
+        params={'max_gap': 'number', 'min_coverage': 'number', 'required': 'boolean'},
+        reads={'numbering'}
+    ),
+    CheckSpec(
+        name='heading_presence',
+        slide=f'{_CHECKS}.heading_presence_check:HeadingPresenceCheck',
+        default_level='slide',
+        params={'required': 'boolean'},
+        reads={'fonts'}
+    ),
+    CheckSpec(
+        name='sentence_length',
+        slide=f'{_CHECKS}.sentence_length_check:SentenceLengthCheck',
+        default_level='slide',
+        params={'max': 'number', 'unit': 'string'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='list_nesting',
+        slide=f'{_CHECKS}.list_nesting_check:ListNestingCheck',
+        default_level='slide',
+        params={'max_level': 'number'},
+        reads={'lists'}
+    ),
+    CheckSpec(
+        name='elements_count',
+        slide=f'{_CHECKS}.elements_count_check:ElementsCountCheck',
+        default_level='slide',
+        params={'max': 'number'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='spelling',
+        slide=f'{_CHECKS}.spelling_check:SpellingCheck',
+        default_level='slide',
+        params={'backend': 'string', 'enabled': 'boolean'},
+        cost='network',
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='bullet_consistency',
+        slide=f'{_CHECKS}.bullet_content_check:BulletConsistencyCheck',
+        default_level='slide',
+        params={'check_parallelism': 'boolean', 'check_punctuation': 'boolean'},
+        reads={'text', 'lists'}
+    ),
+    CheckSpec(
+        name='list_items_count',
+        slide=f'{_CHECKS}.list_count_check:ListItemsCountCheck',
+        default_level='slide',
+        params={'min_items': 'number', 'max_items': 'number', 'check_bullet': 'boolean',
+                'check_numbered': 'boolean', 'check_nested': 'boolean'},
+        reads={'lists'}
+    ),
+    CheckSpec(
+        name='nested_lists_depth',
+        slide=f'{_CHECKS}.list_count_check:NestedListsDepthCheck',
+        default_level='slide',
+        params={'max_depth': 'number', 'check_bullet': 'boolean', 'check_numbered': 'boolean'},
+        reads={'lists'}
+    ),
+    CheckSpec(
+        name='mixed_lists',
+        slide=f'{_CHECKS}.list_count_check:MixedListsCheck',
+        default_level='slide',
+        params={'allow_mixed': 'boolean'},
+        reads={'lists'}
+    ),
+    CheckSpec(
+        name='long_phrases',
+        slide=f'{_CHECKS}.text_content_check:LongPhrasesCheck',
+        default_level='slide',
+        params={'max_length': 'number'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='paragraph_length',
+        slide=f'{_CHECKS}.text_content_check:ParagraphLengthCheck',
+        default_level='slide',
+        params={'min_length': 'number', 'max_length': 'number'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='sentence_count',
+        slide=f'{_CHECKS}.text_content_check:SentenceCountCheck',
+        default_level='slide',
+        params={'min_sentences': 'number', 'max_sentences': 'number'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='text_density',
+        slide=f'{_CHECKS}.text_content_check:TextDensityCheck',
+        default_level='slide',
+        params={'max_blocks': 'number', 'max_total_chars': 'number'},
+        reads={'text'}
+    ),
+    CheckSpec(
+        name='capitalization',
+        slide=f'{_CHECKS}.text_content_check:CapitalizationCheck',
+        default_level='slide',
+        params={'check_titles': 'boolean', 'check_sentences': 'boolean'},
+        reads={'text'}
+    )
+)}
+
 class CheckRegistry:
     
-    PRESENTATION_CHECKS = {
-        'slides_count': {
-            'class': SlidesCountCheck,
-            'available_levels': ['presentation'],
-            'default_level': 'presentation'
-        },
-        'font_count': {
-            'class': FontCountPresentationCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'font_sizes_count': {
-            'class': FontSizesCountPresentationCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'list_consistency': {
-            'class': ListConsistencyPresentationCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'font_min_size': {
-            'class': FontMinSizePresentationCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'uppercase_percent': {
-            'class': UppercasePercentPresentationCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'slide_numbers': {
-            'class': SlideNumbersPresentationCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        }
-    }
+    BUILTIN = BUILTIN_CHECKS
+    _plugins: Optional[PluginLoader] = None
+    
+    @classmethod
+    def get_spec(cls, check_type: str) -> CheckSpec:
+        spec = cls.BUILTIN.get(check_type)
+        if spec is not None:
+            return spec
+        
+        try:
+            spec = cls.plugins().load(check_type)
+        except PluginError as e:
+            raise DSLParseError(str(e))
+        if spec is None:
+            raise DSLParseError(f"Неизвестный тип проверки: {check_type}")
+        return spec
     
-    SLIDE_CHECKS = {
-        'font_count': {
-            'class': FontCountSlideCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'heading_presence': {
-            'class': HeadingPresenceCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'font_sizes_count': {
-            'class': FontSizesCountSlideCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'sentence_length': {
-            'class': SentenceLengthCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'list_nesting': {
-            'class': ListNestingCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'list_consistency': {
-            'class': ListConsistencySlideCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'font_min_size': {
-            'class': FontMinSizeSlideCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'uppercase_percent': {
-            'class': UppercasePercentSlideCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'elements_count': {
-            'class': ElementsCountCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'spelling': {
-            'class': SpellingCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'bullet_consistency': {
-            'class': BulletConsistencyCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'list_items_count': {
-            'class': ListItemsCountCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'nested_lists_depth': {
-            'class': NestedListsDepthCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'mixed_lists': {
-            'class': MixedListsCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'slide_numbers': {
-            'class': SlideNumbersSlideCheck,
-            'available_levels': ['presentation', 'slide'],
-            'default_level': None
-        },
-        'long_phrases': {
-            'class': LongPhrasesCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'paragraph_length': {
-            'class': ParagraphLengthCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'sentence_count': {
-            'class': SentenceCountCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'text_density': {
-            'class': TextDensityCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        },
-        'capitalization': {
-            'class': CapitalizationCheck,
-            'available_levels': ['slide'],
-            'default_level': 'slide'
-        }
-    }
+    @classmethod
+    def load_class(cls, check_type: str, level: str) -> Type[Union[PresentationCheck, SlideCheck]]:
+        spec = cls.get_spec(check_type)
+        check_class = _import_check(spec.class_path(level))
+        if spec.deterministic is not None and isinstance(getattr(check_class, 'deterministic', None), property):
+            raise DSLParseError(
+                f"Проверка {check_type}: признак deterministic задан и в CheckSpec, "
+                f"и свойством класса {check_class.__name__}"
+            )
+        return check_class
+    
+    @classmethod
+    def plugins(cls) -> PluginLoader:
+        if cls._plugins is None:
+            from app.core.config import get_settings
+            try:
+                cls._plugins = PluginLoader(get_settings().CHECK_PLUGINS)
+            except PluginError as e:
+                raise DSLParseError(str(e))
+        return cls._plugins
+    
+    @classmethod
+    def use_plugins(cls, loader: Optional[PluginLoader]) -> None:
+        cls._plugins = loader
     
     @classmethod
-    def get_check_info(cls, check_type: str) -> Dict[str, Any]:
-        if check_type in cls.PRESENTATION_CHECKS:
-            return cls.PRESENTATION_CHECKS[check_type]
-        if check_type in cls.SLIDE_CHECKS:
-            return cls.SLIDE_CHECKS[check_type]
-        raise DSLParseError(f"Неизвестный тип проверки: {check_type}")
+    def available(cls) -> List[str]:
+        return sorted(set(cls.BUILTIN) | set(cls.plugins().names()))
+
+@lru_cache(maxsize=None)
+def _import_check(path: str) -> Type[Union[PresentationCheck, SlideCheck]]:
+    module_name, _, class_name = path.partition(':')
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        raise DSLParseError(f"Не удалось загрузить проверку {path}: {e}")
 
 class ScopeParser:
     
@@ -231,8 +277,9 @@ class ScopeParser:
 
 class RuleParser:
     
-    def __init__(self, rule_data: Dict[str, Any]):
+    def __init__(self, rule_data: Dict[str, Any], slide_tags: Optional[Dict[str, Set[int]]] = None):
         self.rule_data = rule_data
+        self.slide_tags = slide_tags or {}
         self._validate_rule_structure()
     
     def _validate_rule_structure(self):
@@ -247,20 +294,26 @@ class RuleParser:
     
     def parse(self) -> Union[PresentationCheck, SlideCheck]:
         check_type = self.rule_data['check']
-        check_info = CheckRegistry.get_check_info(check_type)
+        spec = CheckRegistry.get_spec(check_type)
+        
+        errors = spec.validate_params(self.rule_data['params'])
+        if errors:
+            raise DSLParseError(f"Проверка {check_type}: " + "; ".join(errors))
         
-        level = self._determine_level(check_info)
+        level = self._determine_level(spec)
         
         if level == 'presentation':
-            return self._create_presentation_check(check_type, check_info)
+            if 'when' in self.rule_data:
+                raise DSLParseError("Условие 'when' поддерживается только для проверок уровня slide")
+            return self._apply_spec(self._create_presentation_check(check_type), spec)
         elif level == 'slide':
-            return self._create_slide_check(check_type, check_info)
+            return self._apply_spec(self._create_slide_check(check_type), spec)
         else:
             raise DSLParseError(f"Некорректный level: {level}")
     
-    def _determine_level(self, check_info: Dict[str, Any]) -> str:
-        available_levels = check_info['available_levels']
-        default_level = check_info['default_level']
+    def _determine_level(self, spec: CheckSpec) -> str:
+        available_levels = spec.available_levels
+        default_level = spec.default_level
         specified_level = self.rule_data.get('level')
         
         if specified_level:
@@ -274,13 +327,24 @@ class RuleParser:
         if default_level:
             return default_level
         
+        if len(available_levels) == 1:
+            return available_levels[0]
+        
         raise DSLParseError(
             f"Для проверки {self.rule_data['check']} необходимо указать level. "
             f"Доступные уровни: {available_levels}"
         )
     
-    def _create_presentation_check(self, check_type: str, check_info: Dict[str, Any]) -> PresentationCheck:
-        check_class = CheckRegistry.PRESENTATION_CHECKS[check_type]['class']
+    @staticmethod
+    def _apply_spec(check: Union[PresentationCheck, SlideCheck], spec: CheckSpec) -> Union[PresentationCheck, SlideCheck]:
+        check.cost = spec.cost
+        check.reads = spec.reads
+        if spec.deterministic is not None:
+            check.deterministic = spec.deterministic
+        return check
+    
+    def _create_presentation_check(self, check_type: str) -> PresentationCheck:
+        check_class = CheckRegistry.load_class(check_type, 'presentation')
         
         return check_class(
             rule_name=self.rule_data['name'],
@@ -288,18 +352,29 @@ class RuleParser:
             severity=self.rule_data['severity']
         )
     
-    def _create_slide_check(self, check_type: str, check_info: Dict[str, Any]) -> SlideCheck:
-        check_class = CheckRegistry.SLIDE_CHECKS[check_type]['class']
+    def _create_slide_check(self, check_type: str) -> SlideCheck:
+        check_class = CheckRegistry.load_class(check_type, 'slide')
         
         scope_raw = self.rule_data.get('scope', 'all')
         scope = ScopeParser.parse(scope_raw)
+        condition = self._parse_condition()
         
         return check_class(
             rule_name=self.rule_data['name'],
             params=self.rule_data['params'],
             severity=self.rule_data['severity'],
-            scope=scope
+            scope=scope,
+            condition=condition
         )
+    
+    def _parse_condition(self):
+        if 'when' not in self.rule_data:
+            return None
+        
+        try:
+            return ConditionParser.parse(self.rule_data['when'], self.slide_tags.keys())
+        except ConditionError as e:
+            raise DSLParseError(str(e))
 
 class DSLParser:
     
@@ -307,7 +382,7 @@ class DSLParser:
     def parse_yaml_file(file_path: str) -> ValidationEngine:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlLoader)
         except FileNotFoundError:
             raise DSLParseError(f"Файл не найден: {file_path}")
         except yaml.YAMLError as e:
@@ -318,7 +393,7 @@ class DSLParser:
     @staticmethod
     def parse_yaml_string(yaml_string: str) -> ValidationEngine:
         try:
-            data = yaml.safe_load(yaml_string)
+            data = yaml.load(yaml_string, Loader=YamlLoader)
         except yaml.YAMLError as e:
             raise DSLParseError(f"Ошибка парсинга YAML: {e}")
         
@@ -333,6 +408,8 @@ class DSLParser:
         if not isinstance(rules, list):
             raise DSLParseError("'rules' должен быть списком")
         
+        slide_tags = DSLParser._parse_slide_tags(data.get('slide_tags', {}))
+        
         presentation_checks = []
         slide_checks = []
         
@@ -341,7 +418,7 @@ class DSLParser:
                 raise DSLParseError(f"Правило #{i+1}: должно содержать ключ 'rule'")
             
             try:
-                rule_parser = RuleParser(rule_data['rule'])
+                rule_parser = RuleParser(rule_data['rule'], slide_tags)
                 check = rule_parser.parse()
                 
                 if isinstance(check, PresentationCheck):
@@ -353,8 +430,23 @@ class DSLParser:
         
         return ValidationEngine(
             presentation_checks=presentation_checks,
-            slide_checks=slide_checks
+            slide_checks=slide_checks,
+            slide_tags=slide_tags
         )
+    
+    @staticmethod
+    def _parse_slide_tags(slide_tags: Any) -> Dict[str, Set[int]]:
+        if not isinstance(slide_tags, dict):
+            raise DSLParseError("'slide_tags' должен быть словарем вида тег: scope")
+        
+        result = {}
+        for tag, scope in slide_tags.items():
+            parsed = ScopeParser.parse(scope)
+            if parsed == 'all':
+                raise DSLParseError(f"Тег слайдов '{tag}' должен ссылаться на конкретные слайды")
+            result[str(tag)] = parsed
+        
+        return result
 
 def load_validation_engine(file_path: str) -> ValidationEngine:
     return DSLParser.parse_yaml_file(file_path)
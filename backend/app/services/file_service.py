@@ -1,47 +1,55 @@
+import shutil
 import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any, List
-from fastapi import UploadFile, HTTPException
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
+from app.core.tracing import span
 from app.domain.entities import Presentation
 from app.services.pdf.pdf_processing import PdfProcessingService
-from app.services.dsl import load_validation_engine_from_string, DSLParseError
+from app.services.dsl import get_engine_cache, DSLParseError
+from app.services.kernel.slide_cache import get_slide_result_cache
+from app.services.kernel.validation_engine import SlideOutcome, ValidationEngine
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
+from app.services.uploads import CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from fastapi import UploadFile
 
 class FileService:
     
     def __init__(self):
         self.pdf_processor = PdfProcessingService()
     
-    def process_uploaded_files(self, pdf_file: UploadFile, yaml_file: UploadFile) -> Dict[str, Any]:
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as pdf_temp:
-            pdf_content = pdf_file.file.read()
-            pdf_temp.write(pdf_content)
-            pdf_temp_path = pdf_temp.name
+    def process_uploaded_files(self, pdf_file: "UploadFile", yaml_file: "UploadFile") -> Dict[str, Any]:
+        from fastapi import HTTPException
         
         try:
             yaml_content = yaml_file.file.read().decode('utf-8')
             validation_engine = self._load_validation_rules(yaml_content)
-            
-            presentation = self.pdf_processor.process_pdf(Path(pdf_temp_path))
-            
-            validation_results = validation_engine.validate(presentation)
-            
-            result = self._format_results(
-                presentation=presentation,
-                validation_results=validation_results,
-                pdf_filename=pdf_file.filename,
-                yaml_filename=yaml_file.filename
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=400,
+                detail="Файл правил должен быть в кодировке UTF-8"
             )
-            
-            return result
-            
         except DSLParseError as e:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Ошибка парсинга правил валидации: {str(e)}"
             )
+        
+        return self.process_with_engine(pdf_file, validation_engine, yaml_file.filename)
+    
+    def process_with_engine(self, pdf_file: "UploadFile", validation_engine: ValidationEngine, rules_name: str) -> Dict[str, Any]:
+        from fastapi import HTTPException
+        
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as pdf_temp:
+            shutil.copyfileobj(pdf_file.file, pdf_temp, CHUNK_SIZE)
+            pdf_temp_path = pdf_temp.name
+        
+        try:
+            return self.process_file(Path(pdf_temp_path), validation_engine, pdf_file.filename, rules_name)
+            
         except Exception as e:
             raise HTTPException(
                 status_code=500, 
@@ -50,8 +58,75 @@ class FileService:
         finally:
             Path(pdf_temp_path).unlink(missing_ok=True)
     
+    def process_file(self, pdf_path: Path, validation_engine: ValidationEngine, pdf_filename: str, rules_name: str,
+                     previous_slides: Optional[List[SlideOutcome]] = None) -> Dict[str, Any]:
+        stages: Dict[str, float] = {}
+        checks: Dict[str, float] = {}
+        
+        with span("file_service.process_file", "pipeline", file=pdf_filename, rules=rules_name):
+            started = time.perf_counter()
+            with span("pdf.process", "pdf"):
+                presentation = self.pdf_processor.process_pdf(pdf_path, stages)
+            processed = time.perf_counter()
+            
+            slide_cache = get_slide_result_cache()
+            session = slide_cache.session() if slide_cache is not None else None
+            try:
+                with span("engine.validate", "engine", slides=len(presentation.slides)):
+                    validation_results, slide_outcomes = validation_engine.validate_slides(
+                        presentation, previous_slides, slide_cache=session, timings=checks
+                    )
+            finally:
+                if session is not None:
+                    session.close()
+            validated = time.perf_counter()
+            
+            with span("format_results", "pipeline"):
+                result = self._format_results(
+                    presentation=presentation,
+                    validation_results=validation_results,
+                    pdf_filename=pdf_filename,
+                    yaml_filename=rules_name
+                )
+            formatted = time.perf_counter()
+        stages["engine"] = validated - processed
+        stages["formatting"] = formatted - validated
+        
+        result["deterministic"] = validation_engine.deterministic and result["validation"]["skipped"] == 0
+        result["timing"] = {
+            "processing_ms": round((processed - started) * 1000, 2),
+            "validation_ms": round((validated - processed) * 1000, 2),
+            "text_pool": presentation.text_pool.stats() if presentation.text_pool else None,
+            "stages": {stage: round(seconds * 1000, 3) for stage, seconds in stages.items()},
+            "checks": {check: round(seconds * 1000, 3) for check, seconds in checks.items()},
+            "slide_cache": session.stats() if session is not None else None
+        }
+        result["slides"] = [outcome.to_dict() for outcome in slide_outcomes]
+        if previous_slides is not None:
+            reused = sum(1 for outcome in slide_outcomes if outcome.reused)
+            result["incremental"] = {
+                "reused_slides": reused,
+                "revalidated_slides": len(slide_outcomes) - reused
+            }
+        
+        return result
+    
+    @staticmethod
+    def to_response(result: Dict[str, Any]) -> Dict[str, Any]:
+        response = {
+            "status": "success" if result["success"] else "failed",
+            "files": result["files"],
+            "validation": result["validation"],
+            "presentation": result["presentation"],
+            "detailed_results": result["detailed_results"],
+            "timing": result.get("timing")
+        }
+        if "incremental" in result:
+            response["incremental"] = result["incremental"]
+        return response
+    
     def _load_validation_rules(self, yaml_content: str):
-        return load_validation_engine_from_string(yaml_content)
+        return get_engine_cache().get_or_compile(yaml_content)
     
     def _format_results(
         self,
@@ -75,6 +150,8 @@ class FileService:
         for result in validation_results:
             if result.status == ValidationStatus.PASSED:
                 prefix = "[SUCCESS]"
+            elif result.status == ValidationStatus.SKIPPED:
+                prefix = "[SKIPPED]"
             else:
                 prefix = f"[{result.severity.value.upper()}]"
             
@@ -91,8 +168,12 @@ class FileService:
             
         passed_checks = sum(1 for r in validation_results if r.status == ValidationStatus.PASSED)
         failed_checks = sum(1 for r in validation_results if r.status == ValidationStatus.FAILED)
+        skipped_checks = sum(1 for r in validation_results if r.status == ValidationStatus.SKIPPED)
         
-        logs.append(f"[INFO] Проверка завершена. Пройдено: {passed_checks}, провалено: {failed_checks}")
+        logs.append(
+            f"[INFO] Проверка завершена. Пройдено: {passed_checks}, провалено: {failed_checks}, "
+            f"пропущено: {skipped_checks}"
+        )
         logs.append(f"[INFO] Обнаружено: {errors} ошибок, {warnings} предупреждений, {infos} информационных сообщений")
         infos += 2
         
@@ -108,6 +189,7 @@ class FileService:
                 "total_checks": len(validation_results),
                 "passed": passed_checks,
                 "failed": failed_checks,
+                "skipped": skipped_checks,
                 "logs": logs,
                 "summary": {
                     "errors": errors,
@@ -181,7 +263,8 @@ class FileService:
             "page_numbers": {
                 "slides_with_numbers": slides_with_page_numbers,
                 "coverage": round(page_number_coverage * 100, 1),
-                "coverage_percent": f"{page_number_coverage:.1%}"
+                "coverage_percent": f"{page_number_coverage:.1%}",
+                "slot": presentation.page_number_slot.to_dict() if presentation.page_number_slot else None
             },
             "text": {
                 "total_characters": total_text_length,
@@ -0,0 +1,24 @@
+from app.services.jobs.queue import InProcessJobQueue, Job, JobQueue, SqliteJobQueue
+from app.services.jobs.service import (
+    QUEUE_BACKENDS,
+    JobError,
+    JobNotFoundError,
+    JobNotReadyError,
+    JobQueueFullError,
+    JobService,
+    get_job_service
+)
+
+__all__ = [
+    'InProcessJobQueue',
+    'Job',
+    'JobQueue',
+    'SqliteJobQueue',
+    'QUEUE_BACKENDS',
+    'JobError',
+    'JobNotFoundError',
+    'JobNotReadyError',
+    'JobQueueFullError',
+    'JobService',
+    'get_job_service'
+]
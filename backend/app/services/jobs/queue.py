@@ -0,0 +1,223 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, asdict, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.web.models.models import ProcessingStatus
+
+FINISHED_STATUSES = (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED)
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+@dataclass(frozen=True)
+class Job:
+    job_id: str
+    filename: str
+    rules_name: str
+    status: ProcessingStatus = ProcessingStatus.PENDING
+    created_at: str = ""
+    profile_id: Optional[str] = None
+    profile_version: Optional[int] = None
+    pdf_sha256: Optional[str] = None
+    previous_job_id: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    processing_time: Optional[float] = None
+    slides_count: int = 0
+    page_number_analysis: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["status"] = self.status.value
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        return cls(**{**data, "status": ProcessingStatus(data["status"])})
+
+class JobQueue(ABC):
+    
+    @abstractmethod
+    def put(self, job: Job) -> None:
+        pass
+    
+    @abstractmethod
+    def claim(self, timeout: float) -> Optional[Job]:
+        pass
+    
+    @abstractmethod
+    def update(self, job: Job) -> None:
+        pass
+    
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        pass
+    
+    @abstractmethod
+    def pending_count(self) -> int:
+        pass
+    
+    @abstractmethod
+    def delete_finished(self, before: str) -> List[str]:
+        pass
+    
+    def close(self) -> None:
+        pass
+
+class InProcessJobQueue(JobQueue):
+    
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._pending: Deque[str] = deque()
+        self._condition = threading.Condition()
+    
+    def put(self, job: Job) -> None:
+        with self._condition:
+            self._jobs[job.job_id] = job
+            self._pending.append(job.job_id)
+            self._condition.notify()
+    
+    def claim(self, timeout: float) -> Optional[Job]:
+        with self._condition:
+            if not self._pending:
+                self._condition.wait(timeout)
+            if not self._pending:
+                return None
+            
+            job_id = self._pending.popleft()
+            job = replace(self._jobs[job_id], status=ProcessingStatus.PROCESSING, started_at=utc_now())
+            self._jobs[job_id] = job
+            return job
+    
+    def update(self, job: Job) -> None:
+        with self._condition:
+            self._jobs[job.job_id] = job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+    
+    def pending_count(self) -> int:
+        return len(self._pending)
+    
+    def delete_finished(self, before: str) -> List[str]:
+        with self._condition:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.status in FINISHED_STATUSES and job.finished_at and job.finished_at < before
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return expired
+
+class SqliteJobQueue(JobQueue):
+    
+    def __init__(self, path: Path, poll_interval: float = 0.5):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, created_at TEXT NOT NULL, data TEXT NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._connection.commit()
+        self._requeue_interrupted()
+    
+    def put(self, job: Job) -> None:
+        self._write(job, insert=True)
+        with self._condition:
+            self._condition.notify()
+    
+    def claim(self, timeout: float) -> Optional[Job]:
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self._claim_next()
+            remaining = deadline - time.monotonic()
+            if job is not None or remaining <= 0:
+                return job
+            with self._condition:
+                self._condition.wait(min(self.poll_interval, remaining))
+    
+    def update(self, job: Job) -> None:
+        self._write(job)
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return Job.from_dict(json.loads(row[0])) if row else None
+    
+    def pending_count(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (ProcessingStatus.PENDING.value,)
+            ).fetchone()
+        return row[0]
+    
+    def delete_finished(self, before: str) -> List[str]:
+        statuses = [status.value for status in FINISHED_STATUSES]
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) AND json_extract(data, '$.finished_at') < ?",
+                (*statuses, before)
+            ).fetchall()
+            expired = [row[0] for row in rows]
+            self._connection.executemany("DELETE FROM jobs WHERE job_id = ?", [(job_id,) for job_id in expired])
+            self._connection.commit()
+        return expired
+    
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+    
+    def _claim_next(self) -> Optional[Job]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM jobs WHERE status = ? ORDER BY created_at, rowid LIMIT 1",
+                (ProcessingStatus.PENDING.value,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            job = replace(Job.from_dict(json.loads(row[0])), status=ProcessingStatus.PROCESSING, started_at=utc_now())
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, data = ? WHERE job_id = ?",
+                (job.status.value, json.dumps(job.to_dict(), ensure_ascii=False), job.job_id)
+            )
+            self._connection.commit()
+            return job
+    
+    def _write(self, job: Job, insert: bool = False) -> None:
+        data = json.dumps(job.to_dict(), ensure_ascii=False)
+        with self._lock:
+            if insert:
+                self._connection.execute(
+                    "INSERT INTO jobs (job_id, status, created_at, data) VALUES (?, ?, ?, ?)",
+                    (job.job_id, job.status.value, job.created_at, data)
+                )
+            else:
+                self._connection.execute(
+                    "UPDATE jobs SET status = ?, data = ? WHERE job_id = ?",
+                    (job.status.value, data, job.job_id)
+                )
+            self._connection.commit()
+    
+    def _requeue_interrupted(self) -> None:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM jobs WHERE status = ?", (ProcessingStatus.PROCESSING.value,)
+            ).fetchall()
+        
+        for (data,) in rows:
+            job = replace(Job.from_dict(json.loads(data)), status=ProcessingStatus.PENDING, started_at=None)
+            self._write(job)
@@ -0,0 +1,278 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import Settings, get_settings
+from app.core.logging import get_logger
+from app.core.web.models.models import ProcessingStatus
+from app.services.dsl import CompiledEngineCache, get_engine_cache, rules_hash
+from app.services.file_service import FileService
+from app.services.jobs.queue import InProcessJobQueue, Job, JobQueue, SqliteJobQueue, utc_now
+from app.services.kernel.validation_engine import SlideOutcome
+from app.services.pipeline_executor import PipelineExecutor, get_pipeline_executor
+from app.services.profile_service import RuleProfileStore, get_profile_store
+from app.services.result_cache import engine_version
+
+logger = get_logger(__name__)
+
+class JobError(Exception):
+    pass
+
+class JobNotFoundError(JobError):
+    pass
+
+class JobNotReadyError(JobError):
+    pass
+
+class JobQueueFullError(JobError):
+    pass
+
+class JobService:
+    
+    PDF_NAME = "presentation.pdf"
+    RULES_NAME = "rules.yaml"
+    RESULT_NAME = "result.json"
+    SLIDES_NAME = "slides.json"
+    
+    def __init__(self, root: Path, queue: JobQueue, workers: int = 2, max_pending: int = 100,
+                 executor: Optional[PipelineExecutor] = None, engine_cache: Optional[CompiledEngineCache] = None,
+                 profile_store: Optional[RuleProfileStore] = None, retention_ttl: float = 0.0):
+        self.root = Path(root)
+        self.queue = queue
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.executor = executor or get_pipeline_executor()
+        self.engine_cache = engine_cache or CompiledEngineCache()
+        self.profile_store = profile_store
+        self.retention_ttl = retention_ttl
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
+    
+    def submit(self, pdf_path: Path, pdf_filename: str, rules_name: str,
+               yaml_content: Optional[str] = None, profile_id: Optional[str] = None,
+               profile_version: Optional[int] = None, pdf_sha256: Optional[str] = None,
+               previous_job_id: Optional[str] = None) -> Job:
+        if yaml_content is not None:
+            self.engine_cache.get_or_compile(yaml_content)
+        
+        if self.queue.pending_count() >= self.max_pending:
+            raise JobQueueFullError("Очередь задач переполнена, повторите попытку позже")
+        
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            filename=pdf_filename,
+            rules_name=rules_name,
+            created_at=utc_now(),
+            profile_id=profile_id,
+            profile_version=profile_version,
+            pdf_sha256=pdf_sha256,
+            previous_job_id=previous_job_id
+        )
+        
+        job_dir = self.root / job.job_id
+        job_dir.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(pdf_path), job_dir / self.PDF_NAME)
+        if yaml_content is not None:
+            (job_dir / self.RULES_NAME).write_text(yaml_content, encoding='utf-8')
+        
+        self.queue.put(job)
+        logger.info("Задача %s поставлена в очередь", job.job_id)
+        return job
+    
+    def revalidate(self, previous_job_id: str, pdf_path: Path, pdf_filename: str,
+                   pdf_sha256: Optional[str] = None) -> Job:
+        previous = self.get(previous_job_id)
+        if previous.status != ProcessingStatus.COMPLETED:
+            raise JobNotReadyError(f"Предыдущая задача еще не завершена (статус: {previous.status.value})")
+        
+        yaml_content = None
+        if previous.profile_id is None:
+            yaml_content = (self.root / previous.job_id / self.RULES_NAME).read_text(encoding='utf-8')
+        
+        return self.submit(
+            pdf_path,
+            pdf_filename,
+            previous.rules_name,
+            yaml_content=yaml_content,
+            profile_id=previous.profile_id,
+            profile_version=previous.profile_version,
+            pdf_sha256=pdf_sha256,
+            previous_job_id=previous.job_id
+        )
+    
+    def get(self, job_id: str) -> Job:
+        job = self.queue.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Задача не найдена: {job_id}")
+        return job
+    
+    def result(self, job_id: str) -> Dict[str, Any]:
+        job = self.get(job_id)
+        if job.status == ProcessingStatus.FAILED:
+            raise JobNotReadyError(f"Задача завершилась с ошибкой: {job.error_message}")
+        if job.status != ProcessingStatus.COMPLETED:
+            raise JobNotReadyError(f"Задача еще не завершена (статус: {job.status.value})")
+        
+        return json.loads((self.root / job_id / self.RESULT_NAME).read_text(encoding='utf-8'))
+    
+    def start(self) -> None:
+        if self._threads:
+            return
+        
+        self._stopped.clear()
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if self.retention_ttl > 0:
+            thread = threading.Thread(target=self._purge_periodically, name="job-retention", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+    
+    def run_pending(self) -> int:
+        processed = 0
+        while True:
+            job = self.queue.claim(timeout=0)
+            if job is None:
+                return processed
+            self._run(job)
+            processed += 1
+    
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        if self.retention_ttl <= 0:
+            return 0
+        
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(seconds=self.retention_ttl)
+        expired = self.queue.delete_finished(cutoff.isoformat())
+        for job_id in expired:
+            shutil.rmtree(self.root / job_id, ignore_errors=True)
+        if expired:
+            logger.info("Удалено устаревших задач: %s", len(expired))
+        return len(expired)
+    
+    def _purge_periodically(self) -> None:
+        interval = min(self.retention_ttl, 3600.0)
+        while not self._stopped.wait(interval):
+            try:
+                self.purge_expired()
+            except Exception:
+                logger.exception("Не удалось удалить устаревшие задачи")
+    
+    def _work(self) -> None:
+        while not self._stopped.is_set():
+            job = self.queue.claim(timeout=0.5)
+            if job is not None:
+                self._run(job)
+    
+    def _run(self, job: Job) -> None:
+        job_dir = self.root / job.job_id
+        started = time.perf_counter()
+        
+        try:
+            yaml_content = self._rules_for(job)
+            content_hash = rules_hash(yaml_content)
+            result = asyncio.run(self._execute(
+                job, yaml_content, self._previous_slides(job, content_hash)
+            ))
+            
+            self._write_json(job_dir / self.SLIDES_NAME, {
+                "rules_hash": content_hash,
+                "engine_version": engine_version(),
+                "slides": result.get("slides", [])
+            })
+            self._write_json(job_dir / self.RESULT_NAME, FileService.to_response(result))
+            
+            presentation = result.get("presentation", {})
+            job = replace(
+                job,
+                status=ProcessingStatus.COMPLETED,
+                slides_count=presentation.get("total_slides", 0),
+                page_number_analysis=presentation.get("analysis", {}).get("page_numbers")
+            )
+        except Exception as e:
+            logger.exception("Ошибка обработки задачи %s", job.job_id)
+            job = replace(job, status=ProcessingStatus.FAILED, error_message=str(e))
+        
+        self.queue.update(replace(
+            job,
+            finished_at=utc_now(),
+            processing_time=round(time.perf_counter() - started, 3)
+        ))
+    
+    async def _execute(self, job: Job, yaml_content: str,
+                       previous_slides: Optional[List[SlideOutcome]]) -> Dict[str, Any]:
+        await self.executor.admit_when_free()
+        try:
+            return await self.executor.run(
+                self.root / job.job_id / self.PDF_NAME, yaml_content, job.filename, job.rules_name,
+                previous_slides=previous_slides
+            )
+        finally:
+            self.executor.release()
+    
+    def _previous_slides(self, job: Job, content_hash: str) -> Optional[List[SlideOutcome]]:
+        if job.previous_job_id is None:
+            return None
+        
+        path = self.root / job.previous_job_id / self.SLIDES_NAME
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            logger.warning("Результаты слайдов задачи %s недоступны, выполняется полная проверка", job.previous_job_id)
+            return []
+        
+        if data.get("rules_hash") != content_hash or data.get("engine_version") != engine_version():
+            return []
+        return [SlideOutcome.from_dict(item) for item in data["slides"]]
+    
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, path)
+    
+    def _rules_for(self, job: Job) -> str:
+        if job.profile_id is not None:
+            store = self.profile_store or get_profile_store()
+            return store.get_source(job.profile_id, job.profile_version)
+        
+        return (self.root / job.job_id / self.RULES_NAME).read_text(encoding='utf-8')
+
+QUEUE_BACKENDS: Dict[str, Callable[[Path], JobQueue]] = {
+    'memory': lambda root: InProcessJobQueue(),
+    'sqlite': lambda root: SqliteJobQueue(root / "jobs.sqlite3"),
+}
+
+@lru_cache(maxsize=1)
+def get_job_service() -> JobService:
+    settings: Settings = get_settings()
+    root = settings.upload_path / "jobs"
+    
+    if settings.JOB_QUEUE_BACKEND not in QUEUE_BACKENDS:
+        raise ValueError(f"Неизвестная очередь задач: {settings.JOB_QUEUE_BACKEND}")
+    
+    return JobService(
+        root=root,
+        queue=QUEUE_BACKENDS[settings.JOB_QUEUE_BACKEND](root),
+        workers=settings.JOB_WORKERS,
+        max_pending=settings.JOB_MAX_PENDING,
+        executor=get_pipeline_executor(),
+        engine_cache=get_engine_cache(),
+        profile_store=get_profile_store(),
+        retention_ttl=settings.JOB_RETENTION_TTL
+    )
@@ -0,0 +1,185 @@
+"""
+Тесты фоновых задач проверки презентаций
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.web.models.models import ProcessingStatus
+from app.services.jobs import (
+    InProcessJobQueue,
+    JobNotFoundError,
+    JobNotReadyError,
+    JobQueueFullError,
+    JobService,
+    SqliteJobQueue
+)
+from app.services.dsl import DSLParseError
+from app.services.pipeline_executor import PipelineExecutor
+from benchmarks.pdf_fixtures import build_pdf
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 10}
+      severity: error
+"""
+
+
+def make_pdf(tmp_path, content=None):
+    path = tmp_path / f"{uuid.uuid4().hex}.pdf"
+    path.write_bytes(build_pdf(3) if content is None else content)
+    return path
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def queue(request, tmp_path):
+    if request.param == "memory":
+        return InProcessJobQueue()
+    return SqliteJobQueue(tmp_path / "jobs.sqlite3", poll_interval=0.01)
+
+
+@pytest.fixture
+def service(tmp_path, queue):
+    return JobService(tmp_path / "jobs", queue, workers=2, max_pending=3, executor=PipelineExecutor(workers=0))
+
+
+class TestJobService:
+    """Тесты очереди и обработки задач"""
+
+    def test_job_completes_with_result(self, service, tmp_path):
+        job = service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+        assert service.get(job.job_id).status == ProcessingStatus.PENDING
+
+        with pytest.raises(JobNotReadyError):
+            service.result(job.job_id)
+
+        assert service.run_pending() == 1
+
+        done = service.get(job.job_id)
+        assert done.status == ProcessingStatus.COMPLETED
+        assert done.slides_count == 3
+        assert done.processing_time is not None
+        assert service.result(job.job_id)["validation"]["total_checks"] == 1
+        assert service.executor.in_flight == 0
+
+    def test_failed_job_keeps_error(self, service, tmp_path):
+        job = service.submit(make_pdf(tmp_path, b"broken"), "deck.pdf", "rules.yaml", yaml_content=RULES)
+        service.run_pending()
+
+        failed = service.get(job.job_id)
+        assert failed.status == ProcessingStatus.FAILED
+        assert failed.error_message
+        assert service.executor.in_flight == 0
+        with pytest.raises(JobNotReadyError):
+            service.result(job.job_id)
+
+    def test_invalid_rules_rejected_on_submit(self, service, tmp_path):
+        with pytest.raises(DSLParseError):
+            service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content="rules: 42")
+
+    def test_pending_limit(self, service, tmp_path):
+        for _ in range(3):
+            service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+
+        with pytest.raises(JobQueueFullError):
+            service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+
+    def test_workers_share_pipeline_admission(self, tmp_path, queue):
+        executor = PipelineExecutor(workers=0, queue_limit=0)
+        original = executor.run
+        observed = []
+
+        async def run(*args, **kwargs):
+            observed.append(executor.in_flight)
+            return await original(*args, **kwargs)
+
+        executor.run = run
+        service = JobService(tmp_path / "jobs", queue, workers=3, executor=executor)
+        service.start()
+        try:
+            jobs = [service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES) for _ in range(3)]
+
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                if all(service.get(job.job_id).status == ProcessingStatus.COMPLETED for job in jobs):
+                    break
+                time.sleep(0.01)
+        finally:
+            service.stop()
+
+        assert all(service.get(job.job_id).status == ProcessingStatus.COMPLETED for job in jobs)
+        assert observed == [1, 1, 1]
+        assert executor.in_flight == 0
+
+    def test_revalidate_passes_previous_slides(self, tmp_path, queue):
+        executor = PipelineExecutor(workers=0)
+        original = executor.run
+        seen = []
+
+        async def run(*args, previous_slides=None, **kwargs):
+            seen.append(previous_slides)
+            return await original(*args, previous_slides=previous_slides, **kwargs)
+
+        executor.run = run
+        service = JobService(tmp_path / "jobs", queue, executor=executor)
+        first = service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+
+        with pytest.raises(JobNotReadyError):
+            service.revalidate(first.job_id, make_pdf(tmp_path), "deck-v2.pdf")
+        service.run_pending()
+
+        second = service.revalidate(first.job_id, make_pdf(tmp_path), "deck-v2.pdf")
+        assert second.previous_job_id == first.job_id
+        assert second.rules_name == "rules.yaml"
+        service.run_pending()
+
+        assert seen[0] is None
+        assert len(seen[1]) == 3
+        assert service.result(second.job_id)["incremental"]["reused_slides"] == 3
+
+    def test_finished_jobs_expire(self, tmp_path, queue):
+        service = JobService(tmp_path / "jobs", queue, executor=PipelineExecutor(workers=0), retention_ttl=60)
+        done = service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+        service.run_pending()
+        pending = service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+
+        assert service.purge_expired() == 0
+        assert service.purge_expired(datetime.now(timezone.utc) + timedelta(seconds=61)) == 1
+
+        with pytest.raises(JobNotFoundError):
+            service.get(done.job_id)
+        assert not (tmp_path / "jobs" / done.job_id).exists()
+        assert service.get(pending.job_id).status == ProcessingStatus.PENDING
+
+    def test_unknown_job(self, service):
+        with pytest.raises(JobNotFoundError):
+            service.get("missing")
+
+
+class TestSqliteJobQueue:
+    """Тесты сохранения задач между перезапусками"""
+
+    def test_interrupted_jobs_are_requeued(self, tmp_path):
+        path = tmp_path / "jobs.sqlite3"
+        service = JobService(tmp_path / "jobs", SqliteJobQueue(path), executor=PipelineExecutor(workers=0))
+        job = service.submit(make_pdf(tmp_path), "deck.pdf", "rules.yaml", yaml_content=RULES)
+
+        claimed = service.queue.claim(timeout=0)
+        assert claimed.status == ProcessingStatus.PROCESSING
+        service.queue.close()
+
+        restarted = JobService(tmp_path / "jobs", SqliteJobQueue(path), executor=PipelineExecutor(workers=0))
+        assert restarted.get(job.job_id).status == ProcessingStatus.PENDING
+        assert restarted.run_pending() == 1
+        assert restarted.get(job.job_id).status == ProcessingStatus.COMPLETED
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
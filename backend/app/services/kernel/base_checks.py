@@ -1,28 +1,90 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Union, List, Set
+from types import MappingProxyType
+from typing import Dict, Any, Union, List, Set, Mapping, Hashable, Optional, FrozenSet
 from app.domain.entities import Presentation, Slide
+from app.services.kernel.slide_features import SlideFeatures
 from app.services.kernel.validation_result import ValidationResult
 
+def freeze_params(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_params(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_params(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+def params_key(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), params_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(params_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(params_key(item) for item in value))
+    return value
+
 class PresentationCheck(ABC):
+    deterministic: bool = True
+    cost: str = 'cpu'
+    reads: FrozenSet[str] = frozenset()
+    
     def __init__(self, rule_name: str, params: Dict[str, Any], severity: str):
         self.rule_name = rule_name
-        self.params = params
+        self.params: Mapping[str, Any] = freeze_params(params or {})
         self.severity = severity
     
+    def rule_key(self) -> Hashable:
+        return (type(self), self.rule_name, params_key(self.params), self.severity)
+    
+    def shared_input_key(self) -> Optional[Hashable]:
+        return None
+    
+    def compute(self, presentation: Presentation) -> Any:
+        raise NotImplementedError
+    
+    def evaluate(self, presentation: Presentation, computed: Any) -> ValidationResult:
+        raise NotImplementedError
+    
     @abstractmethod
     def validate(self, presentation: Presentation) -> ValidationResult:
         pass
 
 class SlideCheck(ABC):
-    def __init__(self, rule_name: str, params: Dict[str, Any], severity: str, scope: Union[str, List[int]]):
+    deterministic: bool = True
+    cost: str = 'cpu'
+    reads: FrozenSet[str] = frozenset()
+    
+    def __init__(self, rule_name: str, params: Dict[str, Any], severity: str, scope: Union[str, List[int]],
+                 condition: Optional[Any] = None):
         self.rule_name = rule_name
-        self.params = params
+        self.params: Mapping[str, Any] = freeze_params(params or {})
         self.severity = severity
-        self.scope: Union[str, Set[int]] = scope if scope == 'all' else set(scope)
+        self.scope: Union[str, Set[int]] = scope if scope == 'all' else frozenset(scope)
+        self.condition = condition
     
     def applies_to_slide(self, slide_number: int) -> bool:
         return self.scope == 'all' or slide_number in self.scope
     
+    def prepare(self, presentation: Presentation) -> None:
+        pass
+    
+    def matches_features(self, features: SlideFeatures) -> bool:
+        return self.condition is None or self.condition.matches(features)
+    
+    def rule_key(self) -> Hashable:
+        scope = self.scope if self.scope == 'all' else tuple(sorted(self.scope))
+        condition = self.condition.key if self.condition is not None else None
+        return (type(self), self.rule_name, params_key(self.params), self.severity, scope, condition)
+    
+    def shared_input_key(self) -> Optional[Hashable]:
+        return None
+    
+    def compute(self, slide: Slide) -> Any:
+        raise NotImplementedError
+    
+    def evaluate(self, slide: Slide, computed: Any) -> ValidationResult:
+        raise NotImplementedError
+    
     @abstractmethod
     def validate(self, slide: Slide) -> ValidationResult:
         pass
@@ -1,29 +1,29 @@
-from app.services.kernel.checks.slides_count_check import SlidesCountCheck
-from app.services.kernel.checks.font_count_check import (
-    FontCountPresentationCheck,
-    FontCountSlideCheck
-)
-from app.services.kernel.checks.heading_presence_check import HeadingPresenceCheck
-from app.services.kernel.checks.font_sizes_count_check import (
-    FontSizesCountPresentationCheck,
-    FontSizesCountSlideCheck
-)
-from app.services.kernel.checks.sentence_length_check import SentenceLengthCheck
-from app.services.kernel.checks.list_nesting_check import ListNestingCheck
-from app.services.kernel.checks.list_consistency_check import (
-    ListConsistencyPresentationCheck,
-    ListConsistencySlideCheck
-)
-from app.services.kernel.checks.font_min_size_check import (
-    FontMinSizePresentationCheck,
-    FontMinSizeSlideCheck
-)
-from app.services.kernel.checks.uppercase_percent_check import (
-    UppercasePercentPresentationCheck,
-    UppercasePercentSlideCheck
-)
-from app.services.kernel.checks.elements_count_check import ElementsCountCheck
-from app.services.kernel.checks.spelling_check import SpellingCheck
+import importlib
+
+_CHECK_MODULES = {
+    'SlidesCountCheck': 'slides_count_check',
+    'FontCountPresentationCheck': 'font_count_check',
+    'FontCountSlideCheck': 'font_count_check',
+    'HeadingPresenceCheck': 'heading_presence_check',
+    'FontSizesCountPresentationCheck': 'font_sizes_count_check',
+    'FontSizesCountSlideCheck': 'font_sizes_count_check',
+    'SentenceLengthCheck': 'sentence_length_check',
+    'ListNestingCheck': 'list_nesting_check',
+    'ListConsistencyPresentationCheck': 'list_consistency_check',
+    'ListConsistencySlideCheck': 'list_consistency_check',
+    'FontMinSizePresentationCheck': 'font_min_size_check',
+    'FontMinSizeSlideCheck': 'font_min_size_check',
+    'UppercasePercentPresentationCheck': 'uppercase_percent_check',
+    'UppercasePercentSlideCheck': 'uppercase_percent_check',
+    'ElementsCountCheck': 'elements_count_check',
+    'SpellingCheck': 'spelling_check',
+}
+
+def __getattr__(name: str):
+    module = _CHECK_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
 
 __all__ = [
     'SlidesCountCheck',
@@ -1,19 +1,27 @@
 from app.services.kernel.base_checks import PresentationCheck, SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Presentation, Slide
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Set, Hashable
 
 class FontCountPresentationCheck(PresentationCheck):
     
-    def validate(self, presentation: Presentation) -> ValidationResult:
+    def shared_input_key(self) -> Hashable:
+        return 'font_families'
+    
+    def compute(self, presentation: Presentation) -> Set[str]:
         fonts = set()
         for slide in presentation.slides:
             for block in slide.blocks:
                 for run in block.runs:
                     if run.font_family:
                         fonts.add(run.font_family)
-        
-        font_count = len(fonts)
+        return fonts
+    
+    def validate(self, presentation: Presentation) -> ValidationResult:
+        return self.evaluate(presentation, self.compute(presentation))
+    
+    def evaluate(self, presentation: Presentation, computed: Set[str]) -> ValidationResult:
+        font_count = len(computed)
         max_fonts = self.params.get('max')
         
         if max_fonts is not None and font_count > max_fonts:
@@ -33,14 +41,22 @@ class FontCountPresentationCheck(PresentationCheck):
 
 class FontCountSlideCheck(SlideCheck):
     
-    def validate(self, slide: Slide) -> ValidationResult:
+    def shared_input_key(self) -> Hashable:
+        return 'font_families'
+    
+    def compute(self, slide: Slide) -> Set[str]:
         fonts = set()
         for block in slide.blocks:
             for run in block.runs:
                 if run.font_family:
                     fonts.add(run.font_family)
-        
-        font_count = len(fonts)
+        return fonts
+    
+    def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: Set[str]) -> ValidationResult:
+        font_count = len(computed)
         max_fonts = self.params.get('max')
         
         if max_fonts is not None and font_count > max_fonts:
@@ -1,11 +1,29 @@
 from app.services.kernel.base_checks import PresentationCheck, SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Presentation, Slide
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Hashable
+
+def _slide_min_font_size(slide: Slide) -> Optional[float]:
+    sizes = [run.font_size for block in slide.blocks for run in block.runs if run.font_size]
+    return min(sizes) if sizes else None
 
 class FontMinSizePresentationCheck(PresentationCheck):
     
+    def shared_input_key(self) -> Hashable:
+        return 'slide_min_font_sizes'
+    
+    def compute(self, presentation: Presentation) -> List[Tuple[int, float]]:
+        slide_minimums = []
+        for slide in presentation.slides:
+            slide_min = _slide_min_font_size(slide)
+            if slide_min is not None:
+                slide_minimums.append((slide.page_number, slide_min))
+        return slide_minimums
+    
     def validate(self, presentation: Presentation) -> ValidationResult:
+        return self.evaluate(presentation, self.compute(presentation))
+    
+    def evaluate(self, presentation: Presentation, computed: List[Tuple[int, float]]) -> ValidationResult:
         min_size = self.params.get('min')
         unit = self.params.get('unit', 'pt')
         
@@ -17,12 +35,7 @@ class FontMinSizePresentationCheck(PresentationCheck):
                 message="Минимальный размер шрифта не указан"
             )
         
-        small_fonts = []
-        for slide in presentation.slides:
-            for block in slide.blocks:
-                for run in block.runs:
-                    if run.font_size and run.font_size < min_size:
-                        small_fonts.append((slide.page_number, run.font_size))
+        small_fonts = [(slide_num, size) for slide_num, size in computed if size < min_size]
         
         if small_fonts:
             min_found = min(size for _, size in small_fonts)
@@ -43,7 +56,16 @@ class FontMinSizePresentationCheck(PresentationCheck):
 
 class FontMinSizeSlideCheck(SlideCheck):
     
+    def shared_input_key(self) -> Hashable:
+        return 'min_font_size'
+    
+    def compute(self, slide: Slide) -> Optional[float]:
+        return _slide_min_font_size(slide)
+    
     def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: Optional[float]) -> ValidationResult:
         min_size = self.params.get('min')
         unit = self.params.get('unit', 'pt')
         
@@ -55,14 +77,8 @@ class FontMinSizeSlideCheck(SlideCheck):
                 message=f"Слайд {slide.page_number}: минимальный размер шрифта не указан"
             )
         
-        small_fonts = []
-        for block in slide.blocks:
-            for run in block.runs:
-                if run.font_size and run.font_size < min_size:
-                    small_fonts.append(run.font_size)
-        
-        if small_fonts:
-            min_found = min(small_fonts)
+        if computed is not None and computed < min_size:
+            min_found = computed
             return ValidationResult(
                 status=ValidationStatus.FAILED,
                 severity=Severity[self.severity.upper()],
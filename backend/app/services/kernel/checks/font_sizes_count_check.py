@@ -1,19 +1,27 @@
 from app.services.kernel.base_checks import PresentationCheck, SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Presentation, Slide
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Set, Hashable
 
 class FontSizesCountPresentationCheck(PresentationCheck):
     
-    def validate(self, presentation: Presentation) -> ValidationResult:
+    def shared_input_key(self) -> Hashable:
+        return 'font_sizes'
+    
+    def compute(self, presentation: Presentation) -> Set[float]:
         font_sizes = set()
         for slide in presentation.slides:
             for block in slide.blocks:
                 for run in block.runs:
                     if run.font_size:
                         font_sizes.add(run.font_size)
-        
-        sizes_count = len(font_sizes)
+        return font_sizes
+    
+    def validate(self, presentation: Presentation) -> ValidationResult:
+        return self.evaluate(presentation, self.compute(presentation))
+    
+    def evaluate(self, presentation: Presentation, computed: Set[float]) -> ValidationResult:
+        sizes_count = len(computed)
         max_sizes = self.params.get('max')
         
         if max_sizes is not None and sizes_count > max_sizes:
@@ -33,14 +41,22 @@ class FontSizesCountPresentationCheck(PresentationCheck):
 
 class FontSizesCountSlideCheck(SlideCheck):
     
-    def validate(self, slide: Slide) -> ValidationResult:
+    def shared_input_key(self) -> Hashable:
+        return 'font_sizes'
+    
+    def compute(self, slide: Slide) -> Set[float]:
         font_sizes = set()
         for block in slide.blocks:
             for run in block.runs:
                 if run.font_size:
                     font_sizes.add(run.font_size)
-        
-        sizes_count = len(font_sizes)
+        return font_sizes
+    
+    def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: Set[float]) -> ValidationResult:
+        sizes_count = len(computed)
         max_sizes = self.params.get('max')
         
         if max_sizes is not None and sizes_count > max_sizes:
@@ -1,18 +1,30 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Hashable
 from app.services.kernel.base_checks import SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Slide, Paragraph, ListType
 
 class ListItemsCountCheck(SlideCheck):
     
+    def shared_input_key(self) -> Hashable:
+        return (
+            'lists',
+            self.params.get('check_bullet', True),
+            self.params.get('check_numbered', True),
+            self.params.get('check_nested', False)
+        )
+    
+    def compute(self, slide: Slide) -> List[Tuple[str, int, int]]:
+        _, check_bullet, check_numbered, check_nested = self.shared_input_key()
+        return self._find_lists_on_slide(slide, check_bullet, check_numbered, check_nested)
+    
     def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: List[Tuple[str, int, int]]) -> ValidationResult:
         min_items = self.params.get('min_items', 1)      
         max_items = self.params.get('max_items', 8)      
-        check_bullet = self.params.get('check_bullet', True)
-        check_numbered = self.params.get('check_numbered', True)
-        check_nested = self.params.get('check_nested', False)   
         
-        lists_info = self._find_lists_on_slide(slide, check_bullet, check_numbered, check_nested)
+        lists_info = computed
         
         if not lists_info:
             return ValidationResult(
@@ -107,13 +119,16 @@ class ListItemsCountCheck(SlideCheck):
 
 class NestedListsDepthCheck(SlideCheck):
     
-    def validate(self, slide: Slide) -> ValidationResult:
-        max_depth = self.params.get('max_depth', 2)  
-        check_bullet = self.params.get('check_bullet', True)
-        check_numbered = self.params.get('check_numbered', True)
-        
-        max_found_depth = 0
-        deep_lists = []
+    def shared_input_key(self) -> Hashable:
+        return (
+            'list_levels',
+            self.params.get('check_bullet', True),
+            self.params.get('check_numbered', True)
+        )
+    
+    def compute(self, slide: Slide) -> List[Tuple[int, ListType, int]]:
+        _, check_bullet, check_numbered = self.shared_input_key()
+        list_levels = []
         
         for i, block in enumerate(slide.blocks, 1):
             if block.list_type == ListType.NONE:
@@ -123,12 +138,26 @@ class NestedListsDepthCheck(SlideCheck):
                (block.list_type in [ListType.NUMBERED, ListType.ALPHA, ListType.ROMAN] and not check_numbered):
                 continue
             
-            if block.level > max_found_depth:
-                max_found_depth = block.level
+            list_levels.append((i, block.list_type, block.level))
+        
+        return list_levels
+    
+    def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: List[Tuple[int, ListType, int]]) -> ValidationResult:
+        max_depth = self.params.get('max_depth', 2)  
+        
+        max_found_depth = 0
+        deep_lists = []
+        
+        for i, list_type, level in computed:
+            if level > max_found_depth:
+                max_found_depth = level
             
-            if block.level > max_depth:
-                list_type_name = self._get_list_type_name(block.list_type)
-                deep_lists.append(f"{list_type_name} список (позиция {i}, уровень {block.level})")
+            if level > max_depth:
+                list_type_name = self._get_list_type_name(list_type)
+                deep_lists.append(f"{list_type_name} список (позиция {i}, уровень {level})")
         
         if deep_lists:
             return ValidationResult(
@@ -2,12 +2,14 @@ import re
 from app.services.kernel.base_checks import SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Slide
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple, Hashable
 
 class SentenceLengthCheck(SlideCheck):
     
-    def validate(self, slide: Slide) -> ValidationResult:
-        max_length = self.params.get('max')
+    def shared_input_key(self) -> Hashable:
+        return ('sentence_lengths', self.params.get('unit', 'words'))
+    
+    def compute(self, slide: Slide) -> List[Tuple[int, str]]:
         unit = self.params.get('unit', 'words')
         
         slide_text = ' '.join(block.text for block in slide.blocks)
@@ -15,7 +17,19 @@ class SentenceLengthCheck(SlideCheck):
         sentences = re.split(r'[.!?]+', slide_text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
-        if not sentences:
+        if unit == 'words':
+            return [(len(sentence.split()), sentence) for sentence in sentences]
+        return [(len(sentence), sentence) for sentence in sentences]
+    
+    def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: List[Tuple[int, str]]) -> ValidationResult:
+        max_length = self.params.get('max')
+        unit = self.params.get('unit', 'words')
+        unit_name = "слов" if unit == 'words' else "символов"
+        
+        if not computed:
             return ValidationResult(
                 status=ValidationStatus.PASSED,
                 severity=Severity[self.severity.upper()],
@@ -25,14 +39,7 @@ class SentenceLengthCheck(SlideCheck):
         
         long_sentences = []
         
-        for sentence in sentences:
-            if unit == 'words':
-                length = len(sentence.split())
-                unit_name = "слов"
-            else:
-                length = len(sentence)
-                unit_name = "символов"
-            
+        for length, sentence in computed:
             if max_length is not None and length > max_length:
                 preview = sentence[:50] + "..." if len(sentence) > 50 else sentence
                 long_sentences.append((length, preview))
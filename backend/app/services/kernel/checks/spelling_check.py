@@ -1,12 +1,33 @@
-import requests
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from app.services.kernel.base_checks import SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
-from app.domain.entities import Slide
+from app.domain.entities import Presentation, Slide
+
+if TYPE_CHECKING:
+    from app.services.spelling import AsyncSpellingClient
 
 class SpellingCheck(SlideCheck):
     
-    YANDEX_SPELLER_API = "https://speller.yandex.net/services/spellservice.json/checkText"
+    @property
+    def deterministic(self) -> bool:
+        if not self.params.get('enabled', True):
+            return True
+        from app.services.spelling.service import backend_is_deterministic
+        return backend_is_deterministic(self.params.get('backend', 'yandex'))
+    
+    def prepare(self, presentation: Presentation) -> None:
+        if not self.params.get('enabled', True):
+            return
+        
+        from app.services.spelling.backends import SpellingConfigurationError
+        
+        slides = [slide for slide in presentation.slides if self.applies_to_slide(slide.page_number)]
+        texts = [text for text in presentation.distinct_texts(slides) if text.strip()]
+        
+        try:
+            self._client().check_texts_sync(texts)
+        except SpellingConfigurationError:
+            pass
     
     def validate(self, slide: Slide) -> ValidationResult:
         enabled = self.params.get('enabled', True)
@@ -19,7 +40,7 @@ class SpellingCheck(SlideCheck):
                 message=f"Слайд {slide.page_number}: проверка орфографии отключена"
             )
         
-        slide_text = ' '.join(block.text for block in slide.blocks)
+        slide_text = self._slide_text(slide)
         
         if not slide_text.strip():
             return ValidationResult(
@@ -30,69 +51,68 @@ class SpellingCheck(SlideCheck):
             )
         
         try:
-            errors = self._check_spelling(slide_text)
+            errors = self._slide_errors(slide)
+        except Exception as e:
+            return self._skipped(slide, str(e))
+        
+        if errors is None:
+            return self._skipped(slide, self._client().last_error or "сервис недоступен")
+        
+        if errors:
+            error_count = len(errors)
+            preview_errors = errors[:3]
             
-            if errors:
-                error_count = len(errors)
-                preview_errors = errors[:3]
-                
-                error_examples = []
-                for err in preview_errors:
-                    word = err.get('word', '')
-                    suggestions = err.get('s', [])
-                    if suggestions:
-                        suggestion_str = f" (возможно: {', '.join(suggestions[:2])})"
-                    else:
-                        suggestion_str = ""
-                    error_examples.append(f"'{word}'{suggestion_str}")
-                
-                examples_str = ', '.join(error_examples)
-                more_str = f" и еще {error_count - 3}" if error_count > 3 else ""
-                
-                return ValidationResult(
-                    status=ValidationStatus.FAILED,
-                    severity=Severity[self.severity.upper()],
-                    rule_name=self.rule_name,
-                    message=f"Слайд {slide.page_number}: найдено {error_count} орфографических ошибок: {examples_str}{more_str}"
-                )
+            error_examples = []
+            for err in preview_errors:
+                word = err.get('word', '')
+                suggestions = err.get('s', [])
+                if suggestions:
+                    suggestion_str = f" (возможно: {', '.join(suggestions[:2])})"
+                else:
+                    suggestion_str = ""
+                error_examples.append(f"'{word}'{suggestion_str}")
             
-            return ValidationResult(
-                status=ValidationStatus.PASSED,
-                severity=Severity[self.severity.upper()],
-                rule_name=self.rule_name,
-                message=f"Слайд {slide.page_number}: орфографических ошибок не найдено"
-            )
+            examples_str = ', '.join(error_examples)
+            more_str = f" и еще {error_count - 3}" if error_count > 3 else ""
             
-        except Exception as e:
             return ValidationResult(
-                status=ValidationStatus.PASSED,
+                status=ValidationStatus.FAILED,
                 severity=Severity[self.severity.upper()],
                 rule_name=self.rule_name,
-                message=f"Слайд {slide.page_number}: не удалось проверить орфографию ({str(e)})"
+                message=f"Слайд {slide.page_number}: найдено {error_count} орфографических ошибок: {examples_str}{more_str}"
             )
+        
+        return ValidationResult(
+            status=ValidationStatus.PASSED,
+            severity=Severity[self.severity.upper()],
+            rule_name=self.rule_name,
+            message=f"Слайд {slide.page_number}: орфографических ошибок не найдено"
+        )
     
-    def _check_spelling(self, text: str) -> List[Dict[str, Any]]:
-        try:
-            params = {
-                'text': text,
-                'options': 0
-            }
-            
-            response = requests.get(
-                self.YANDEX_SPELLER_API,
-                params=params,
-                timeout=5
-            )
-            
-            response.raise_for_status()
-            
-            errors = response.json()
-            
-            return errors if isinstance(errors, list) else []
-            
-        except requests.exceptions.Timeout:
-            raise Exception("Превышено время ожидания ответа от API")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Ошибка запроса к API: {str(e)}")
-        except ValueError as e:
-            raise Exception(f"Ошибка парсинга ответа API: {str(e)}")
+    def _slide_text(self, slide: Slide) -> str:
+        return ' '.join(block.text for block in slide.blocks)
+    
+    def _client(self) -> "AsyncSpellingClient":
+        from app.services.spelling import get_spelling_client
+        return get_spelling_client(self.params.get('backend', 'yandex'))
+    
+    def _slide_errors(self, slide: Slide) -> Optional[List[Dict[str, Any]]]:
+        client = self._client()
+        namespace = ('spelling', self.params.get('backend', 'yandex'))
+        
+        errors = []
+        for block in slide.blocks:
+            block_errors = slide.memoize_text(namespace, block, lambda text: client.check_texts_sync([text])[0])
+            if block_errors is None:
+                return None
+            errors.extend(block_errors)
+        
+        return errors
+    
+    def _skipped(self, slide: Slide, reason: str) -> ValidationResult:
+        return ValidationResult(
+            status=ValidationStatus.SKIPPED,
+            severity=Severity[self.severity.upper()],
+            rule_name=self.rule_name,
+            message=f"Слайд {slide.page_number}: проверка орфографии пропущена ({reason})"
+        )
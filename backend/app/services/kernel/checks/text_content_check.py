@@ -1,23 +1,39 @@
 import re
-from typing import List
+from typing import List, Hashable
 from app.services.kernel.base_checks import  SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Slide
 
 class LongPhrasesCheck(SlideCheck):
     
+    def shared_input_key(self) -> Hashable:
+        return 'phrases'
+    
+    def compute(self, slide: Slide) -> List[str]:
+        all_phrases = []
+        
+        for block in slide.blocks:
+            all_phrases.extend(slide.memoize_text('phrases', block, self._text_phrases))
+        
+        return all_phrases
+    
+    def _text_phrases(self, text: str) -> List[str]:
+        text_phrases = []
+        for sentence in self._split_into_sentences(text):
+            for phrase in self._split_into_phrases(sentence):
+                text_phrases.append(phrase.strip())
+        return text_phrases
+    
     def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: List[str]) -> ValidationResult:
         max_phrase_length = self.params.get('max_length', 80)
         long_phrases = []
         
-        for block in slide.blocks:
-            sentences = self._split_into_sentences(block.text)
-            for sentence in sentences:
-                phrases = self._split_into_phrases(sentence)
-                for phrase in phrases:
-                    clean_phrase = phrase.strip()
-                    if len(clean_phrase) > max_phrase_length:
-                        long_phrases.append(clean_phrase[:50] + "..." if len(clean_phrase) > 50 else clean_phrase)
+        for clean_phrase in computed:
+            if len(clean_phrase) > max_phrase_length:
+                long_phrases.append(clean_phrase[:50] + "..." if len(clean_phrase) > 50 else clean_phrase)
         
         if long_phrases:
             return ValidationResult(
@@ -182,8 +198,11 @@ class CapitalizationCheck(SlideCheck):
                 issues.append(f"абзац {i}: заголовок должен начинаться с заглавной буквы")
             
             if check_sentences:
-                sentence_issues = self._check_sentence_capitalization(text, i)
-                issues.extend(sentence_issues)
+                previews = slide.memoize_text('capitalization', block, self._lowercase_sentences)
+                issues.extend(
+                    f"абзац {i}: предложение '{preview}' должно начинаться с заглавной буквы"
+                    for preview in previews
+                )
         
         if issues:
             return ValidationResult(
@@ -200,9 +219,9 @@ class CapitalizationCheck(SlideCheck):
             message=f"Слайд {slide.page_number}: капитализация в норме"
         )
     
-    def _check_sentence_capitalization(self, text: str, paragraph_num: int) -> List[str]:
-        issues = []
-        sentences = re.split(r'[.!?]+', text)
+    def _lowercase_sentences(self, text: str) -> List[str]:
+        previews = []
+        sentences = re.split(r'[.!?]+', text.strip())
         
         for j, sentence in enumerate(sentences):
             clean_sentence = sentence.strip()
@@ -214,6 +233,6 @@ class CapitalizationCheck(SlideCheck):
             
             if not clean_sentence[0].isupper():
                 preview = clean_sentence[:20] + "..." if len(clean_sentence) > 20 else clean_sentence
-                issues.append(f"абзац {paragraph_num}: предложение '{preview}' должно начинаться с заглавной буквы")
+                previews.append(preview)
         
-        return issues
+        return previews
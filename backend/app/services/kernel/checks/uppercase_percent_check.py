@@ -1,11 +1,25 @@
 from app.services.kernel.base_checks import PresentationCheck, SlideCheck
 from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
 from app.domain.entities import Presentation, Slide
-from typing import Dict, Any
+from typing import Dict, Any, Tuple, Hashable
+
+def _letter_counts(text: str) -> Tuple[bool, int, int]:
+    letters = [c for c in text if c.isalpha()]
+    uppercase_count = sum(1 for c in letters if c.isupper())
+    return bool(text), len(letters), uppercase_count
 
 class UppercasePercentPresentationCheck(PresentationCheck):
     
+    def shared_input_key(self) -> Hashable:
+        return 'letter_counts'
+    
+    def compute(self, presentation: Presentation) -> Tuple[bool, int, int]:
+        return _letter_counts(presentation.get_all_text())
+    
     def validate(self, presentation: Presentation) -> ValidationResult:
+        return self.evaluate(presentation, self.compute(presentation))
+    
+    def evaluate(self, presentation: Presentation, computed: Tuple[bool, int, int]) -> ValidationResult:
         max_percent = self.params.get('max')
         
         if max_percent is None:
@@ -16,9 +30,9 @@ class UppercasePercentPresentationCheck(PresentationCheck):
                 message="Максимальный процент заглавных букв не указан"
             )
         
-        all_text = presentation.get_all_text()
+        has_text, letters_count, uppercase_count = computed
         
-        if not all_text:
+        if not has_text:
             return ValidationResult(
                 status=ValidationStatus.PASSED,
                 severity=Severity[self.severity.upper()],
@@ -26,8 +40,7 @@ class UppercasePercentPresentationCheck(PresentationCheck):
                 message="Нет текста для проверки"
             )
         
-        letters = [c for c in all_text if c.isalpha()]
-        if not letters:
+        if not letters_count:
             return ValidationResult(
                 status=ValidationStatus.PASSED,
                 severity=Severity[self.severity.upper()],
@@ -35,8 +48,7 @@ class UppercasePercentPresentationCheck(PresentationCheck):
                 message="Нет букв для проверки"
             )
         
-        uppercase_count = sum(1 for c in letters if c.isupper())
-        percent = (uppercase_count / len(letters)) * 100
+        percent = (uppercase_count / letters_count) * 100
         
         if percent > max_percent:
             return ValidationResult(
@@ -55,7 +67,16 @@ class UppercasePercentPresentationCheck(PresentationCheck):
 
 class UppercasePercentSlideCheck(SlideCheck):
     
+    def shared_input_key(self) -> Hashable:
+        return 'letter_counts'
+    
+    def compute(self, slide: Slide) -> Tuple[bool, int, int]:
+        return _letter_counts(' '.join(block.text for block in slide.blocks))
+    
     def validate(self, slide: Slide) -> ValidationResult:
+        return self.evaluate(slide, self.compute(slide))
+    
+    def evaluate(self, slide: Slide, computed: Tuple[bool, int, int]) -> ValidationResult:
         max_percent = self.params.get('max')
         
         if max_percent is None:
@@ -66,9 +87,9 @@ class UppercasePercentSlideCheck(SlideCheck):
                 message=f"Слайд {slide.page_number}: максимальный процент заглавных букв не указан"
             )
         
-        slide_text = ' '.join(block.text for block in slide.blocks)
+        has_text, letters_count, uppercase_count = computed
         
-        if not slide_text:
+        if not has_text:
             return ValidationResult(
                 status=ValidationStatus.PASSED,
                 severity=Severity[self.severity.upper()],
@@ -76,8 +97,7 @@ class UppercasePercentSlideCheck(SlideCheck):
                 message=f"Слайд {slide.page_number}: нет текста для проверки"
             )
         
-        letters = [c for c in slide_text if c.isalpha()]
-        if not letters:
+        if not letters_count:
             return ValidationResult(
                 status=ValidationStatus.PASSED,
                 severity=Severity[self.severity.upper()],
@@ -85,8 +105,7 @@ class UppercasePercentSlideCheck(SlideCheck):
                 message=f"Слайд {slide.page_number}: нет букв для проверки"
             )
         
-        uppercase_count = sum(1 for c in letters if c.isupper())
-        percent = (uppercase_count / len(letters)) * 100
+        percent = (uppercase_count / letters_count) * 100
         
         if percent > max_percent:
             return ValidationResult(
@@ -0,0 +1,164 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, replace
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+from app.core.tracing import current_trace
+from app.domain.entities import Presentation, Slide
+from app.services.kernel.base_checks import PresentationCheck, SlideCheck
+from app.services.kernel.slide_features import SlideFeatures
+from app.services.kernel.validation_result import ValidationResult
+
+if TYPE_CHECKING:
+    from app.services.kernel.slide_cache import SlideCacheSession
+
+_MISSING = object()
+
+@dataclass(frozen=True)
+class PlanStep:
+    index: int
+    check: Union[PresentationCheck, SlideCheck]
+    shared_key: Optional[Hashable] = None
+    duplicate_of: Optional[int] = None
+    
+    def run(self, target: Any, computed: Dict[Hashable, Any], results: Dict[int, ValidationResult]) -> ValidationResult:
+        if self.duplicate_of is not None and self.duplicate_of in results:
+            result = replace(results[self.duplicate_of])
+        elif self.shared_key is not None:
+            value = computed.get(self.shared_key, _MISSING)
+            if value is _MISSING:
+                value = self.check.compute(target)
+                computed[self.shared_key] = value
+            result = self.check.evaluate(target, value)
+        else:
+            result = self.check.validate(target)
+        
+        results[self.index] = result
+        return result
+
+def _span_args(step: PlanStep, result: ValidationResult, cached: bool) -> Dict[str, Any]:
+    return {
+        "check": type(step.check).__name__,
+        "status": result.status.value,
+        "cached": cached,
+        "duplicate": step.duplicate_of is not None
+    }
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    presentation_steps: Tuple[PlanStep, ...]
+    slide_steps: Tuple[PlanStep, ...]
+    
+    def run_presentation(self, presentation: Presentation,
+                         timings: Optional[List[float]] = None) -> List[ValidationResult]:
+        computed: Dict[Hashable, Any] = {}
+        results: Dict[int, ValidationResult] = {}
+        trace = current_trace()
+        if timings is None and trace is None:
+            return [step.run(presentation, computed, results) for step in self.presentation_steps]
+        
+        output = []
+        for step in self.presentation_steps:
+            begun = trace.begin() if trace is not None else 0
+            started = perf_counter()
+            result = step.run(presentation, computed, results)
+            if timings is not None:
+                timings[step.index] += perf_counter() - started
+            if trace is not None:
+                trace.end(step.check.rule_name, "check", begun, _span_args(step, result, False))
+            output.append(result)
+        return output
+    
+    def prepare(self, presentation: Presentation) -> None:
+        checks = [step.check for step in self.slide_steps if step.duplicate_of is None]
+        blocking = [check for check in checks if check.cost != 'cpu']
+        if len(blocking) < 2:
+            for check in checks:
+                check.prepare(presentation)
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(blocking), thread_name_prefix="prepare") as pool:
+            futures = [pool.submit(copy_context().run, check.prepare, presentation) for check in blocking]
+            for check in checks:
+                if check.cost == 'cpu':
+                    check.prepare(presentation)
+            for future in futures:
+                future.result()
+    
+    @property
+    def has_conditions(self) -> bool:
+        return any(step.check.condition is not None for step in self.slide_steps)
+    
+    def run_slide(self, slide: Slide, features: Optional[SlideFeatures] = None,
+                  cache: Optional["SlideCacheSession"] = None,
+                  timings: Optional[List[float]] = None) -> List[ValidationResult]:
+        computed: Dict[Hashable, Any] = {}
+        results: Dict[int, ValidationResult] = {}
+        output = []
+        trace = current_trace()
+        for step in self.slide_steps:
+            if not step.check.applies_to_slide(slide.page_number):
+                continue
+            if features is not None and not step.check.matches_features(features):
+                continue
+            
+            begun = trace.begin() if trace is not None else 0
+            started = perf_counter() if timings is not None else 0.0
+            result = cache.lookup(slide, step.check) if cache is not None else None
+            cached = result is not None
+            if result is None:
+                result = step.run(slide, computed, results)
+                if cache is not None:
+                    cache.store(slide, step.check, result)
+            else:
+                results[step.index] = result
+            output.append(result)
+            if timings is not None:
+                timings[step.index] += perf_counter() - started
+            if trace is not None:
+                trace.end(step.check.rule_name, "check", begun, _span_args(step, result, cached))
+        
+        return output
+    
+    def stats(self) -> Dict[str, int]:
+        steps = self.presentation_steps + self.slide_steps
+        group_sizes: Dict[Hashable, int] = {}
+        for step in steps:
+            if step.shared_key is not None and step.duplicate_of is None:
+                group_sizes[step.shared_key] = group_sizes.get(step.shared_key, 0) + 1
+        
+        return {
+            "rules": len(steps),
+            "duplicates": sum(1 for step in steps if step.duplicate_of is not None),
+            "shared_groups": sum(1 for size in group_sizes.values() if size > 1),
+            "shared_rules": sum(size for size in group_sizes.values() if size > 1)
+        }
+
+class RulePlanner:
+    
+    def plan(self, presentation_checks: Sequence[PresentationCheck],
+             slide_checks: Sequence[SlideCheck]) -> ExecutionPlan:
+        return ExecutionPlan(
+            presentation_steps=self._plan_steps(presentation_checks),
+            slide_steps=self._plan_steps(slide_checks)
+        )
+    
+    def _plan_steps(self, checks: Sequence[Union[PresentationCheck, SlideCheck]]) -> Tuple[PlanStep, ...]:
+        steps = []
+        first_by_rule: Dict[Hashable, int] = {}
+        
+        for index, check in enumerate(checks):
+            rule_key = check.rule_key()
+            duplicate_of = first_by_rule.setdefault(rule_key, index)
+            
+            input_key = check.shared_input_key()
+            shared_key = (type(check), input_key) if input_key is not None else None
+            
+            steps.append(PlanStep(
+                index=index,
+                check=check,
+                shared_key=shared_key,
+                duplicate_of=duplicate_of if duplicate_of != index else None
+            ))
+        
+        return tuple(steps)
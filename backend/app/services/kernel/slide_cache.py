@@ -0,0 +1,252 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import get_settings
+from app.domain.entities import Slide
+from app.services.kernel.base_checks import SlideCheck, params_key
+from app.services.kernel.slide_features import feature_fingerprint
+from app.services.kernel.validation_result import ValidationResult, ValidationStatus, Severity
+
+CachedOutcome = Tuple[str, str]
+CheckEntry = Tuple[str, bool, FrozenSet[str]]
+
+SLIDE_CACHE_VERSION = 2
+
+def check_content_key(check: SlideCheck) -> str:
+    return f"{type(check).__module__}.{type(check).__qualname__}|{params_key(check.params)!r}|{sorted(check.reads)}"
+
+def slide_message_prefix(page_number: int) -> str:
+    return f"Слайд {page_number}"
+
+class SqliteSlideResultStore:
+
+    def __init__(self, path: Path, namespace: str, max_rows: int = 200000):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.max_rows = max_rows
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS slide_results ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, status TEXT NOT NULL, message TEXT NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._connection.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, CachedOutcome]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, status, message FROM slide_results WHERE namespace = ? AND key IN ({placeholders})",
+                    [self.namespace, *chunk]
+                )
+                for key, status, message in rows:
+                    found[key] = (status, message)
+        return found
+
+    def put_many(self, outcomes: Dict[str, CachedOutcome]) -> None:
+        if not outcomes:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO slide_results (namespace, key, status, message) VALUES (?, ?, ?, ?)",
+                [(self.namespace, key, status, message) for key, (status, message) in outcomes.items()]
+            )
+            (rows,) = self._connection.execute("SELECT COUNT(*) FROM slide_results").fetchone()
+            if rows > self.max_rows:
+                self._connection.execute(
+                    "DELETE FROM slide_results WHERE rowid IN "
+                    "(SELECT rowid FROM slide_results ORDER BY rowid LIMIT ?)",
+                    (rows - self.max_rows,)
+                )
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+class SlideResultCache:
+
+    def __init__(self, maxsize: int = 20000, namespace: str = "", store: Optional[SqliteSlideResultStore] = None):
+        self.maxsize = maxsize
+        self.namespace = namespace
+        self.store = store
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._outcomes: "OrderedDict[str, CachedOutcome]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_digest(self, check: SlideCheck) -> str:
+        raw = f"{self.namespace}|{check_content_key(check)}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+    def key(self, fingerprint: str, check: SlideCheck) -> str:
+        return f"{fingerprint}:{self.check_digest(check)}"
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CachedOutcome]:
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                outcome = self._outcomes.get(key)
+                if outcome is None:
+                    missing.append(key)
+                    continue
+                self._outcomes.move_to_end(key)
+                found[key] = outcome
+
+        if missing and self.store is not None:
+            stored = self.store.get_many(missing)
+            self._remember(stored)
+            found.update(stored)
+        return found
+
+    def put_many(self, outcomes: Dict[str, CachedOutcome]) -> None:
+        self._remember(outcomes)
+        if self.store is not None:
+            self.store.put_many(outcomes)
+
+    def record(self, hits: Dict[str, int], misses: Dict[str, int]) -> None:
+        with self._lock:
+            for name, count in hits.items():
+                self.hits[name] = self.hits.get(name, 0) + count
+            for name, count in misses.items():
+                self.misses[name] = self.misses.get(name, 0) + count
+
+    def session(self) -> "SlideCacheSession":
+        return SlideCacheSession(self)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._outcomes.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "size": len(self._outcomes),
+                "maxsize": self.maxsize,
+                "checks": hit_rates(self.hits, self.misses)
+            }
+
+    def _remember(self, outcomes: Dict[str, CachedOutcome]) -> None:
+        with self._lock:
+            for key, outcome in outcomes.items():
+                self._outcomes[key] = outcome
+                self._outcomes.move_to_end(key)
+            while len(self._outcomes) > self.maxsize:
+                self._outcomes.popitem(last=False)
+
+class SlideCacheSession:
+
+    def __init__(self, cache: SlideResultCache):
+        self.cache = cache
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._found: Dict[str, CachedOutcome] = {}
+        self._pending: Dict[str, CachedOutcome] = {}
+        self._checks: Dict[int, CheckEntry] = {}
+        self._fingerprints: Dict[Tuple[int, FrozenSet[str]], str] = {}
+        self._preloaded = False
+
+    def preload(self, slides: Sequence[Slide], checks: Sequence[SlideCheck]) -> None:
+        digests = [self._check(check) for check in checks]
+        keys = [
+            f"{self._fingerprint(slide, reads)}:{digest}"
+            for slide in slides if slide.fingerprint is not None
+            for digest, cacheable, reads in digests if cacheable
+        ]
+        self._found.update(self.cache.get_many(keys))
+        self._preloaded = True
+
+    def lookup(self, slide: Slide, check: SlideCheck) -> Optional[ValidationResult]:
+        digest, cacheable, reads = self._check(check)
+        if slide.fingerprint is None or not cacheable:
+            return None
+
+        name = type(check).__name__
+        key = f"{self._fingerprint(slide, reads)}:{digest}"
+        outcome = self._found.get(key)
+        if outcome is None and not self._preloaded:
+            outcome = self.cache.get_many([key]).get(key)
+        if outcome is None:
+            self.misses[name] = self.misses.get(name, 0) + 1
+            return None
+
+        self.hits[name] = self.hits.get(name, 0) + 1
+        status, message = outcome
+        return ValidationResult(
+            status=ValidationStatus(status),
+            severity=Severity[check.severity.upper()],
+            rule_name=check.rule_name,
+            message=slide_message_prefix(slide.page_number) + message
+        )
+
+    def store(self, slide: Slide, check: SlideCheck, result: ValidationResult) -> None:
+        digest, cacheable, reads = self._check(check)
+        if slide.fingerprint is None or not cacheable or result.status == ValidationStatus.SKIPPED:
+            return
+
+        prefix = slide_message_prefix(slide.page_number)
+        tail = result.message[len(prefix):]
+        if not result.message.startswith(prefix) or tail[:1].isdigit():
+            return
+
+        key = f"{self._fingerprint(slide, reads)}:{digest}"
+        self._pending[key] = (result.status.value, tail)
+        self._found[key] = self._pending[key]
+
+    def close(self) -> None:
+        self.cache.put_many(self._pending)
+        self.cache.record(self.hits, self.misses)
+        self._pending = {}
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return hit_rates(self.hits, self.misses)
+
+    def _check(self, check: SlideCheck) -> CheckEntry:
+        entry = self._checks.get(id(check))
+        if entry is None:
+            entry = (self.cache.check_digest(check), check.deterministic, check.reads)
+            self._checks[id(check)] = entry
+        return entry
+
+    def _fingerprint(self, slide: Slide, reads: FrozenSet[str]) -> str:
+        if not reads:
+            return slide.fingerprint
+        key = (id(slide), reads)
+        fingerprint = self._fingerprints.get(key)
+        if fingerprint is None:
+            fingerprint = feature_fingerprint(slide, reads)
+            self._fingerprints[key] = fingerprint
+        return fingerprint
+
+def hit_rates(hits: Dict[str, int], misses: Dict[str, int]) -> Dict[str, Dict[str, float]]:
+    rates = {}
+    for name in sorted(set(hits) | set(misses)):
+        found = hits.get(name, 0)
+        missed = misses.get(name, 0)
+        rates[name] = {"hits": found, "misses": missed, "hit_rate": round(found / (found + missed), 3)}
+    return rates
+
+@lru_cache(maxsize=1)
+def get_slide_result_cache() -> Optional[SlideResultCache]:
+    settings = get_settings()
+    if settings.SLIDE_CACHE_SIZE <= 0:
+        return None
+
+    namespace = f"{settings.APP_VERSION}/{SLIDE_CACHE_VERSION}"
+    store = None
+    if settings.SLIDE_CACHE_PATH:
+        store = SqliteSlideResultStore(settings.SLIDE_CACHE_PATH, namespace, max_rows=settings.SLIDE_CACHE_MAX_ROWS)
+    return SlideResultCache(maxsize=settings.SLIDE_CACHE_SIZE, namespace=namespace, store=store)
@@ -0,0 +1,55 @@
+import hashlib
+from dataclasses import dataclass
+from typing import FrozenSet, Mapping, Set
+from app.domain.entities import Slide, ListType
+from app.services.pdf.fingerprint import bbox_key
+
+SLIDE_FEATURES: FrozenSet[str] = frozenset({'text', 'fonts', 'lists', 'layout', 'numbering'})
+
+@dataclass(frozen=True)
+class SlideFeatures:
+    page_number: int
+    blocks_count: int
+    has_lists: bool
+    title: str
+    tags: FrozenSet[str]
+
+    @classmethod
+    def from_slide(cls, slide: Slide, slide_tags: Mapping[str, Set[int]]) -> "SlideFeatures":
+        return cls(
+            page_number=slide.page_number,
+            blocks_count=len(slide.blocks),
+            has_lists=any(block.list_type != ListType.NONE for block in slide.blocks),
+            title=slide.blocks[0].text.strip() if slide.blocks else "",
+            tags=frozenset(tag for tag, pages in slide_tags.items() if slide.page_number in pages)
+        )
+
+def feature_fingerprint(slide: Slide, features: FrozenSet[str]) -> str:
+    text, fonts, lists, layout = ('text' in features, 'fonts' in features, 'lists' in features, 'layout' in features)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{','.join(sorted(features))}\n".encode("utf-8"))
+    if layout:
+        digest.update(f"{slide.width:.1f}x{slide.height:.1f}\n".encode("utf-8"))
+    if 'numbering' in features:
+        digest.update(
+            f"{slide.page_number}|{slide.detected_page_number}|{slide.page_number_position.value}\n".encode("utf-8")
+        )
+    
+    for block in slide.blocks:
+        line = "P"
+        if text:
+            line += f"|{block.text}"
+        if lists:
+            line += f"|{block.list_type.value}|{block.level}|{block.list_number}|{block.list_prefix}"
+        if layout:
+            line += f"|{bbox_key(block.bbox)}"
+        digest.update(f"{line}\n".encode("utf-8"))
+        if fonts or layout:
+            for run in block.runs:
+                line = "R"
+                if fonts:
+                    line += f"|{run.font_family}|{run.font_size}|{int(run.is_bold)}{int(run.is_italic)}"
+                if layout:
+                    line += f"|{bbox_key(run.bbox)}"
+                digest.update(f"{line}\n".encode("utf-8"))
+    return digest.hexdigest()
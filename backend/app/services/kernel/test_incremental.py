@@ -0,0 +1,89 @@
+"""
+Тесты повторной проверки только измененных слайдов
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun
+from app.services.dsl.yaml_parser import load_validation_engine_from_string
+from app.services.kernel.checks.font_min_size_check import FontMinSizeSlideCheck
+from app.services.kernel.validation_engine import SlideOutcome
+from app.services.pdf.fingerprint import slide_fingerprint
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 10}
+      severity: error
+  - rule:
+      name: "Шрифт"
+      level: slide
+      check: font_min_size
+      params: {min: 12}
+      severity: warning
+"""
+
+
+def make_slide(number, size, text="Текст"):
+    run = TextRun(text=text, font_family="Arial", font_size=size, bbox=(0, 0, 10, 10))
+    slide = Slide(page_number=number, width=960, height=540,
+                  blocks=[Paragraph(text=text, runs=[run], bbox=(0, 0, 10, 10))])
+    slide.fingerprint = slide_fingerprint(slide)
+    return slide
+
+
+def make_presentation(*sizes):
+    return Presentation(file_path="deck.pdf", slides=[make_slide(number, size) for number, size in enumerate(sizes, 1)])
+
+
+class TestSlideFingerprint:
+    """Тесты отпечатков содержимого слайда"""
+
+    def test_depends_on_content_not_position(self):
+        base = make_slide(1, 14)
+
+        assert slide_fingerprint(make_slide(5, 14)) == base.fingerprint
+        assert slide_fingerprint(make_slide(1, 16)) != base.fingerprint
+        assert slide_fingerprint(make_slide(1, 14, text="Другой")) != base.fingerprint
+
+        moved = make_slide(1, 14)
+        moved.blocks[0].runs[0].bbox = (5, 0, 15, 10)
+        assert slide_fingerprint(moved) != base.fingerprint
+
+
+class TestIncrementalValidation:
+    """Тесты повторного использования результатов слайдов"""
+
+    def test_only_changed_slides_are_checked(self):
+        engine = load_validation_engine_from_string(RULES)
+        full, outcomes = engine.validate_slides(make_presentation(14, 10, 14))
+
+        revision = make_presentation(14, 16, 14)
+        with patch.object(FontMinSizeSlideCheck, "compute", autospec=True,
+                          side_effect=FontMinSizeSlideCheck.compute) as compute:
+            results, revised = engine.validate_slides(revision, outcomes)
+
+        assert [call.args[1].page_number for call in compute.call_args_list] == [2]
+        assert [outcome.reused for outcome in revised] == [True, False, True]
+        assert results[0].rule_name == "Количество слайдов"
+        assert [result.status for result in results] == [result.status for result in engine.validate(revision)]
+        assert full[2].status != results[2].status
+
+    def test_outcomes_round_trip(self):
+        engine = load_validation_engine_from_string(RULES)
+        _, outcomes = engine.validate_slides(make_presentation(14, 10))
+
+        restored = [SlideOutcome.from_dict(outcome.to_dict()) for outcome in outcomes]
+        _, revised = engine.validate_slides(make_presentation(14, 10), restored)
+
+        assert all(outcome.reused for outcome in revised)
+        assert [outcome.results for outcome in revised] == [outcome.results for outcome in outcomes]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
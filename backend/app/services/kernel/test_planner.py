@@ -0,0 +1,83 @@
+"""
+Тесты планировщика правил
+"""
+
+import pytest
+
+from app.domain.entities import Slide, Paragraph, TextRun
+from app.services.dsl.yaml_parser import load_validation_engine_from_string
+from app.services.kernel.checks.font_min_size_check import FontMinSizeSlideCheck
+
+RULES = """
+rules:
+  - rule:
+      name: "Шрифт 1-2"
+      level: slide
+      scope: 1-2
+      check: font_min_size
+      params: {min: 12}
+      severity: warning
+  - rule:
+      name: "Шрифт 2-3"
+      level: slide
+      scope: 2-3
+      check: font_min_size
+      params: {min: 16}
+      severity: error
+  - rule:
+      name: "Шрифт 1-2"
+      level: slide
+      scope: 1-2
+      check: font_min_size
+      params: {min: 12}
+      severity: warning
+"""
+
+
+def make_slide(number, size):
+    run = TextRun(text="Текст", font_family="Arial", font_size=size, bbox=(0, 0, 10, 10))
+    return Slide(page_number=number, width=960, height=540,
+                 blocks=[Paragraph(text="Текст", runs=[run], bbox=(0, 0, 10, 10))])
+
+
+class TestRulePlanner:
+    """Тесты объединения и дедупликации проверок"""
+
+    def test_plan_groups_and_deduplicates(self):
+        engine = load_validation_engine_from_string(RULES)
+        steps = engine.plan.slide_steps
+
+        assert steps[0].shared_key == steps[1].shared_key
+        assert steps[2].duplicate_of == 0
+        assert engine.plan.stats()["duplicates"] == 1
+
+    def test_results_match_sequential_validation(self):
+        engine = load_validation_engine_from_string(RULES)
+        slides = [make_slide(1, 10), make_slide(2, 14), make_slide(3, 18)]
+
+        planned = engine.plan.run_slide(slides[1])
+        sequential = [
+            check.validate(slides[1]) for check in engine.slide_checks
+            if check.applies_to_slide(2)
+        ]
+
+        assert planned == sequential
+        assert planned[0] is not planned[2]
+
+    def test_shared_input_computed_once_per_slide(self, monkeypatch):
+        engine = load_validation_engine_from_string(RULES)
+        calls = []
+        original = FontMinSizeSlideCheck.compute
+
+        def counting_compute(self, slide):
+            calls.append(slide.page_number)
+            return original(self, slide)
+
+        monkeypatch.setattr(FontMinSizeSlideCheck, "compute", counting_compute)
+        engine.plan.run_slide(make_slide(2, 14))
+
+        assert calls == [2]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,107 @@
+"""
+Тесты кэша результатов проверок слайдов между запросами
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun
+from app.services.dsl.yaml_parser import load_validation_engine_from_string
+from app.services.kernel.checks.font_min_size_check import FontMinSizeSlideCheck
+from app.services.kernel.slide_cache import SlideResultCache, SqliteSlideResultStore
+from app.services.pdf.fingerprint import slide_fingerprint
+
+RULES = """
+rules:
+  - rule:
+      name: "Шрифт"
+      level: slide
+      check: font_min_size
+      params: {min: 12}
+      severity: warning
+"""
+
+SCOPED_RULES = """
+rules:
+  - rule:
+      name: "Шрифт титула"
+      level: slide
+      scope: 3
+      check: font_min_size
+      params: {min: 12}
+      severity: error
+"""
+
+
+def make_slide(number, size, text="Текст"):
+    run = TextRun(text=text, font_family="Arial", font_size=size, bbox=(0, 0, 10, 10))
+    slide = Slide(page_number=number, width=960, height=540,
+                  blocks=[Paragraph(text=text, runs=[run], bbox=(0, 0, 10, 10))])
+    slide.fingerprint = slide_fingerprint(slide)
+    return slide
+
+
+def validate(engine, cache, slides):
+    session = cache.session()
+    results, _ = engine.validate_slides(Presentation(file_path="deck.pdf", slides=slides), slide_cache=session)
+    session.close()
+    return results, session
+
+
+class TestSlideResultCache:
+    """Тесты повторного использования результатов одинаковых слайдов"""
+
+    def test_template_slide_hits_at_other_position(self):
+        engine = load_validation_engine_from_string(RULES)
+        cache = SlideResultCache()
+
+        first, _ = validate(engine, cache, [make_slide(1, 10), make_slide(2, 14)])
+
+        with patch.object(FontMinSizeSlideCheck, "compute", autospec=True,
+                          side_effect=FontMinSizeSlideCheck.compute) as compute:
+            second, session = validate(engine, cache, [make_slide(1, 20, "Новый"), make_slide(5, 10)])
+
+        assert [call.args[1].page_number for call in compute.call_args_list] == [1]
+        assert second[1].message == first[0].message.replace("Слайд 1", "Слайд 5")
+        assert second == engine.validate(Presentation(file_path="deck.pdf", slides=[make_slide(1, 20, "Новый"), make_slide(5, 10)]))
+        assert session.stats() == {"FontMinSizeSlideCheck": {"hits": 1, "misses": 1, "hit_rate": 0.5}}
+
+    def test_key_ignores_scope_and_rule_name(self):
+        cache = SlideResultCache()
+        validate(load_validation_engine_from_string(RULES), cache, [make_slide(1, 10)])
+
+        results, session = validate(load_validation_engine_from_string(SCOPED_RULES), cache, [make_slide(3, 10)])
+
+        assert session.stats()["FontMinSizeSlideCheck"]["hits"] == 1
+        assert results[0].rule_name == "Шрифт титула"
+        assert results[0].severity.value == "error"
+        assert results[0].message.startswith("Слайд 3:")
+
+    def test_key_covers_only_features_the_check_reads(self):
+        engine = load_validation_engine_from_string(RULES)
+        cache = SlideResultCache()
+        validate(engine, cache, [make_slide(1, 10)])
+
+        edited = make_slide(2, 10, "Совсем другой текст")
+        edited.blocks[0].bbox = (40, 40, 200, 60)
+        _, session = validate(engine, cache, [edited, make_slide(3, 11)])
+
+        assert engine.slide_checks[0].reads == frozenset({"fonts"})
+        assert session.stats()["FontMinSizeSlideCheck"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_sqlite_store_is_shared_and_bounded(self, tmp_path):
+        engine = load_validation_engine_from_string(RULES)
+        path = tmp_path / "slides.sqlite3"
+        validate(engine, SlideResultCache(store=SqliteSlideResultStore(path, "v1")), [make_slide(1, 10)])
+
+        _, session = validate(engine, SlideResultCache(store=SqliteSlideResultStore(path, "v1")), [make_slide(2, 10)])
+        assert session.stats()["FontMinSizeSlideCheck"]["hits"] == 1
+
+        store = SqliteSlideResultStore(path, "v1", max_rows=2)
+        store.put_many({f"key{i}": ("passed", ": ok") for i in range(5)})
+        assert sorted(store.get_many([f"key{i}" for i in range(5)])) == ["key3", "key4"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,79 @@
+"""
+Тесты дедупликации повторяющегося текста между слайдами
+"""
+
+import pytest
+
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun, TextPool
+from app.services.kernel.checks.text_content_check import CapitalizationCheck, LongPhrasesCheck
+
+FOOTER = "конфиденциально, только для внутреннего использования"
+
+
+def make_block(text):
+    return Paragraph(text=text, runs=[TextRun(text=text)])
+
+
+def make_presentation(slides=5):
+    return Presentation(
+        file_path="deck.pdf",
+        slides=[
+            Slide(page_number=i, width=960, height=540,
+                  blocks=[make_block(f"Слайд {i}"), make_block(FOOTER)])
+            for i in range(1, slides + 1)
+        ]
+    )
+
+
+class TestTextPool:
+    """Тесты интернирования и мемоизации текста"""
+
+    def test_intern_assigns_shared_ids(self):
+        presentation = make_presentation()
+        pool = presentation.intern_texts()
+
+        footer_ids = {slide.blocks[1].text_id for slide in presentation.slides}
+        assert len(footer_ids) == 1
+        assert pool.stats()["distinct_texts"] == 6
+        assert pool.stats()["references"] == 10
+
+    def test_memoize_computes_once_per_text(self):
+        pool = TextPool()
+        text_id = pool.intern("текст")
+        calls = []
+
+        for _ in range(3):
+            pool.memoize('len', text_id, lambda text: calls.append(text) or len(text))
+
+        assert calls == ["текст"]
+        assert pool.stats()["memo"]["len"] == {"hits": 2, "misses": 1, "hit_rate": 0.667}
+
+    def test_checks_reuse_results_for_repeated_text(self):
+        presentation = make_presentation()
+        pool = presentation.intern_texts()
+
+        capitalization = CapitalizationCheck("Капитализация", {}, "warning", "all")
+        phrases = LongPhrasesCheck("Фразы", {'max_length': 20}, "warning", "all")
+
+        results = [
+            (capitalization.validate(slide), phrases.validate(slide))
+            for slide in presentation.slides
+        ]
+
+        memo = pool.stats()["memo"]
+        assert memo["capitalization"]["misses"] == 6
+        assert memo["capitalization"]["hits"] == 4
+        assert memo["phrases"]["hits"] == 4
+        assert "абзац 2" in results[0][0].message
+        assert "только для внутреннего" in results[-1][1].message
+
+    def test_checks_work_without_pool(self):
+        slide = make_presentation(1).slides[0]
+
+        result = CapitalizationCheck("Капитализация", {}, "warning", "all").validate(slide)
+
+        assert "абзац 2" in result.message
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,25 +1,101 @@
-from typing import List
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from app.core.tracing import span
 from app.domain.entities import Presentation
 from app.services.kernel.base_checks import PresentationCheck, SlideCheck
-from app.services.kernel.validation_result import ValidationResult
+from app.services.kernel.planner import RulePlanner, ExecutionPlan
+from app.services.kernel.slide_cache import SlideCacheSession
+from app.services.kernel.slide_features import SlideFeatures
+from app.services.kernel.validation_result import ValidationResult, ValidationStatus
+
+@dataclass
+class SlideOutcome:
+    page_number: int
+    fingerprint: Optional[str]
+    results: List[ValidationResult] = field(default_factory=list)
+    reused: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "fingerprint": self.fingerprint,
+            "results": [result.to_dict() for result in self.results]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SlideOutcome":
+        return cls(
+            page_number=data["page_number"],
+            fingerprint=data["fingerprint"],
+            results=[ValidationResult.from_dict(item) for item in data["results"]]
+        )
 
 class ValidationEngine:
     def __init__(self, presentation_checks: List[PresentationCheck] = None, 
-                 slide_checks: List[SlideCheck] = None):
-        self.presentation_checks = presentation_checks or []
-        self.slide_checks = slide_checks or []
+                 slide_checks: List[SlideCheck] = None,
+                 rules_hash: Optional[str] = None,
+                 slide_tags: Optional[Dict[str, Set[int]]] = None):
+        self.presentation_checks: Tuple[PresentationCheck, ...] = tuple(presentation_checks or [])
+        self.slide_checks: Tuple[SlideCheck, ...] = tuple(slide_checks or [])
+        self.rules_hash = rules_hash
+        self.slide_tags: Dict[str, frozenset] = {tag: frozenset(pages) for tag, pages in (slide_tags or {}).items()}
+        self.plan: ExecutionPlan = RulePlanner().plan(self.presentation_checks, self.slide_checks)
+    
+    @property
+    def deterministic(self) -> bool:
+        return all(check.deterministic for check in (*self.presentation_checks, *self.slide_checks))
     
     def validate(self, presentation: Presentation) -> List[ValidationResult]:
-        results = []
+        results, _ = self.validate_slides(presentation)
+        return results
+    
+    def validate_slides(
+        self,
+        presentation: Presentation,
+        previous: Optional[Sequence[SlideOutcome]] = None,
+        slide_cache: Optional[SlideCacheSession] = None,
+        timings: Optional[Dict[str, float]] = None
+    ) -> Tuple[List[ValidationResult], List[SlideOutcome]]:
+        known = {outcome.page_number: outcome for outcome in previous or ()}
+        reusable = {
+            slide.page_number: known[slide.page_number]
+            for slide in presentation.slides
+            if slide.fingerprint is not None
+            and slide.page_number in known
+            and known[slide.page_number].fingerprint == slide.fingerprint
+            and all(result.status != ValidationStatus.SKIPPED for result in known[slide.page_number].results)
+        }
+        
+        changed = [slide for slide in presentation.slides if slide.page_number not in reusable]
+        if slide_cache is not None:
+            with span("engine.slide_cache_preload", "engine", slides=len(changed)):
+                slide_cache.preload(changed, [step.check for step in self.plan.slide_steps])
         
-        for check in self.presentation_checks:
-            result = check.validate(presentation)
-            results.append(result)
+        with span("engine.prepare", "engine", slides=len(changed)):
+            self.plan.prepare(replace(presentation, slides=changed) if reusable else presentation)
+        presentation_timings = [0.0] * len(self.plan.presentation_steps) if timings is not None else None
+        slide_timings = [0.0] * len(self.plan.slide_steps) if timings is not None else None
+        with span("engine.presentation", "engine"):
+            results = self.plan.run_presentation(presentation, presentation_timings)
         
+        outcomes = []
+        use_features = self.plan.has_conditions
         for slide in presentation.slides:
-            for check in self.slide_checks:
-                if check.applies_to_slide(slide.page_number):
-                    result = check.validate(slide)
-                    results.append(result)
+            cached = reusable.get(slide.page_number)
+            if cached is not None:
+                outcome = SlideOutcome(slide.page_number, slide.fingerprint, [replace(r) for r in cached.results], True)
+            else:
+                with span("engine.slide", "engine", page=slide.page_number):
+                    features = SlideFeatures.from_slide(slide, self.slide_tags) if use_features else None
+                    outcome = SlideOutcome(slide.page_number, slide.fingerprint, self.plan.run_slide(slide, features, slide_cache, slide_timings))
+            outcomes.append(outcome)
+            results.extend(outcome.results)
         
-        return results
+        if timings is not None:
+            for steps, spent in ((self.plan.presentation_steps, presentation_timings),
+                                 (self.plan.slide_steps, slide_timings)):
+                for step, seconds in zip(steps, spent):
+                    name = type(step.check).__name__
+                    timings[name] = timings.get(name, 0.0) + seconds
+        
+        return results, outcomes
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Dict
 
 class ValidationStatus(Enum):
     PASSED = "passed"
     FAILED = "failed"
+    SKIPPED = "skipped"
 
 class Severity(Enum):
     ERROR = "error"
@@ -16,3 +18,20 @@ class ValidationResult:
     severity: Severity
     rule_name: str
     message: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rule_name": self.rule_name,
+            "status": self.status.value,
+            "severity": self.severity.value,
+            "message": self.message
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
+        return cls(
+            status=ValidationStatus(data["status"]),
+            severity=Severity(data["severity"]),
+            rule_name=data["rule_name"],
+            message=data["message"]
+        )
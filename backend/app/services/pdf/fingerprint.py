@@ -0,0 +1,28 @@
+import hashlib
+from typing import Optional, Tuple
+
+from app.domain.entities import Slide
+
+FINGERPRINT_VERSION = 1
+
+def bbox_key(bbox: Optional[Tuple[float, float, float, float]]) -> str:
+    if bbox is None:
+        return "-"
+    return ",".join(f"{value:.1f}" for value in bbox)
+
+def slide_fingerprint(slide: Slide) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"v{FINGERPRINT_VERSION}|{slide.width:.1f}x{slide.height:.1f}|"
+        f"{slide.detected_page_number}|{slide.page_number_position.value}\n".encode("utf-8")
+    )
+    for block in slide.blocks:
+        digest.update(
+            f"P|{block.list_type.value}|{block.level}|{block.list_number}|{block.list_prefix}|{bbox_key(block.bbox)}\n".encode("utf-8")
+        )
+        for run in block.runs:
+            digest.update(
+                f"R|{run.text}|{run.font_family}|{run.font_size}|{int(run.is_bold)}{int(run.is_italic)}|"
+                f"{bbox_key(run.bbox)}\n".encode("utf-8")
+            )
+    return digest.hexdigest()
@@ -1,15 +1,69 @@
 import re
-from typing import List, Tuple, Dict, Any
-from app.domain.entities import Slide, PageNumberPosition
+from dataclasses import dataclass
+from typing import List, Tuple, Dict, Any, FrozenSet, Optional, Set
+from app.domain.entities import Slide, Paragraph, PageNumberPosition, PageNumberSlot
+
+Cell = Tuple[int, int]
+
+@dataclass(frozen=True)
+class SlotIndex:
+    cells: FrozenSet[Cell]
+    bounds: Tuple[float, float, float, float]
+
+class PageNumberStream:
+    
+    def __init__(self, detector: "PageNumberDetector", learn_pages: int):
+        self.detector = detector
+        self.learn_pages = max(1, learn_pages)
+        self.slot: Optional[PageNumberSlot] = None
+        self.slot_index: Optional[SlotIndex] = None
+        self.slides: List[Slide] = []
+        self._pending: List[Slide] = []
+        self._learned = False
+    
+    def feed(self, slide: Slide) -> List[Slide]:
+        self.slides.append(slide)
+        
+        if self._learned:
+            self.detector.resolve_slide(slide, self.slot, self.slot_index)
+            return [slide]
+        
+        self._pending.append(slide)
+        if len(self._pending) >= self.learn_pages:
+            return self._flush()
+        
+        return []
+    
+    def finish(self) -> List[Slide]:
+        resolved = [] if self._learned else self._flush()
+        self.detector._validate_page_number_sequence(self.slides)
+        return resolved
+    
+    def _flush(self) -> List[Slide]:
+        self.slot = self.detector.infer_slot(self._pending)
+        self.slot_index = self.detector.index_slot(self.slot) if self.slot is not None else None
+        self._learned = True
+        
+        resolved = self._pending
+        self._pending = []
+        for slide in resolved:
+            self.detector.resolve_slide(slide, self.slot, self.slot_index)
+        
+        return resolved
 
 class PageNumberDetector:
     
-    def __init__(self):
+    def __init__(self, learn_pages: int = 8, grid_size: float = 0.04, min_support: float = 0.5):
         self.page_number_patterns = [
             r'^\d{1,3}$',
             r'^\d{1,3}\s*[/\\\-]\s*\d{1,3}$',
             r'^\d{1,3}\s+из\s+\d{1,3}$',
         ]
+        self._compiled_patterns = [re.compile(p, re.IGNORECASE) for p in self.page_number_patterns]
+        
+        self.learn_pages = learn_pages
+        self.grid_size = grid_size
+        self.min_support = min_support
         
         self.positions = {
             PageNumberPosition.BOTTOM_RIGHT: (0.7, 0.9, 0.9, 1.0),  
@@ -22,15 +76,193 @@ class PageNumberDetector:
         }
     
     def detect_page_numbers(self, slides: List[Slide]) -> List[Slide]:
+        slides, _ = self.detect_page_numbers_with_slot(slides)
+        return slides
+    
+    def detect_page_numbers_with_slot(self, slides: List[Slide]) -> Tuple[List[Slide], Optional[PageNumberSlot]]:
+        stream = self.stream()
         for slide in slides:
+            stream.feed(slide)
+        stream.finish()
+        
+        return slides, stream.slot
+    
+    def stream(self) -> PageNumberStream:
+        return PageNumberStream(self, self.learn_pages)
+    
+    def infer_slot(self, slides: List[Slide]) -> Optional[PageNumberSlot]:
+        observed = 0
+        hits_by_cell: Dict[Cell, List[Tuple[Slide, Paragraph]]] = {}
+        
+        for slide in slides:
+            if not slide.blocks:
+                continue
+            observed += 1
+            
+            seen_cells: Set[Cell] = set()
+            for block in slide.blocks:
+                if not self._is_slot_candidate(block, slide.width, slide.height):
+                    continue
+                cell = self._cell(block.bbox, slide.width, slide.height)
+                if cell is None or cell in seen_cells:
+                    continue
+                seen_cells.add(cell)
+                hits_by_cell.setdefault(cell, []).append((slide, block))
+        
+        if observed < 2 or not hits_by_cell:
+            return None
+        
+        best = None
+        best_score = (0, 0)
+        
+        for cell in hits_by_cell:
+            members: Dict[int, Tuple[Slide, Paragraph]] = {}
+            for neighbour in self._neighbourhood(cell):
+                for slide, block in hits_by_cell.get(neighbour, []):
+                    members.setdefault(slide.page_number, (slide, block))
+            
+            offset, consistent = self._modal_offset(members.values())
+            score = (consistent, len(members))
+            if score > best_score:
+                best_score = score
+                best = (members, offset)
+        
+        if best is None:
+            return None
+        
+        members, offset = best
+        consistent, support = best_score
+        
+        if consistent < 2 or consistent < support * 0.5 or support < observed * self.min_support:
+            return None
+        
+        slot_members = [
+            (slide, block) for slide, block in members.values()
+            if self._number_offset(block.text, slide.page_number) == offset
+        ]
+        
+        normalized = [self._normalize_bbox(block.bbox, slide.width, slide.height) for slide, block in slot_members]
+        bbox = (
+            min(b[0] for b in normalized),
+            min(b[1] for b in normalized),
+            max(b[2] for b in normalized),
+            max(b[3] for b in normalized),
+        )
+        
+        cells: Set[Cell] = set()
+        for slide, block in slot_members:
+            cells.update(self._neighbourhood(self._cell(block.bbox, slide.width, slide.height)))
+        
+        return PageNumberSlot(
+            bbox=bbox,
+            cells=tuple(sorted(cells)),
+            position=self._detect_position(bbox, 1.0, 1.0),
+            support=consistent,
+            observed=observed,
+            offset=offset
+        )
+    
+    def index_slot(self, slot: PageNumberSlot) -> SlotIndex:
+        columns = [cell[0] for cell in slot.cells]
+        rows = [cell[1] for cell in slot.cells]
+        margin = self.grid_size / 2
+        return SlotIndex(
+            cells=frozenset(slot.cells),
+            bounds=(
+                min(columns) * self.grid_size - margin,
+                min(rows) * self.grid_size - margin,
+                (max(columns) + 1) * self.grid_size + margin,
+                (max(rows) + 1) * self.grid_size + margin,
+            )
+        )
+    
+    def resolve_slide(self, slide: Slide, slot: Optional[PageNumberSlot],
+                      index: Optional[SlotIndex] = None) -> None:
+        if not slide.width or not slide.height:
+            return
+        
+        if slot is None:
             self._detect_slide_page_number(slide)
+            return
         
-        self._validate_page_number_sequence(slides)
+        in_slot = self._blocks_in_slot(slide, index or self.index_slot(slot))
         
-        return slides
+        if not in_slot:
+            self._detect_slide_page_number(slide)
+            return
+        
+        chosen = next(
+            (block for block in in_slot if self._number_offset(block.text, slide.page_number) == slot.offset),
+            in_slot[0]
+        )
+        
+        slide.detected_page_number = chosen.text
+        slide.page_number_position = slot.position
+        slide.page_number_bbox = chosen.bbox
+    
+    def _blocks_in_slot(self, slide: Slide, index: SlotIndex) -> List[Paragraph]:
+        left, top, right, bottom = index.bounds
+        left, right = left * 2 * slide.width, right * 2 * slide.width
+        top, bottom = top * 2 * slide.height, bottom * 2 * slide.height
+        
+        in_slot = []
+        for block in slide.blocks:
+            bbox = block.bbox
+            if not bbox or not (left <= bbox[0] + bbox[2] <= right and top <= bbox[1] + bbox[3] <= bottom):
+                continue
+            if self._cell(bbox, slide.width, slide.height) not in index.cells:
+                continue
+            if self._matches_page_number_pattern(block.text):
+                in_slot.append(block)
+        return in_slot
+    
+    def _is_slot_candidate(self, block: Paragraph, page_width: float, page_height: float) -> bool:
+        if not block.bbox or not page_width or not page_height:
+            return False
+        
+        if not self._matches_page_number_pattern(block.text):
+            return False
+        
+        bbox_width = block.bbox[2] - block.bbox[0]
+        bbox_height = block.bbox[3] - block.bbox[1]
+        
+        return bbox_width <= page_width * 0.2 and bbox_height <= page_height * 0.1
+    
+    def _cell(self, bbox: Tuple[float, float, float, float], page_width: float, page_height: float) -> Optional[Cell]:
+        if not page_width or not page_height:
+            return None
+        x_center = (bbox[0] + bbox[2]) / 2 / page_width
+        y_center = (bbox[1] + bbox[3]) / 2 / page_height
+        return (int(x_center / self.grid_size), int(y_center / self.grid_size))
+    
+    def _neighbourhood(self, cell: Cell) -> List[Cell]:
+        return [(cell[0] + dx, cell[1] + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+    
+    def _normalize_bbox(self, bbox: Tuple[float, float, float, float],
+                        page_width: float, page_height: float) -> Tuple[float, float, float, float]:
+        return (bbox[0] / page_width, bbox[1] / page_height, bbox[2] / page_width, bbox[3] / page_height)
+    
+    def _number_offset(self, text: str, slide_number: int) -> Optional[int]:
+        numbers = re.findall(r'\d+', text)
+        if not numbers:
+            return None
+        return int(numbers[0]) - slide_number
+    
+    def _modal_offset(self, members) -> Tuple[Optional[int], int]:
+        counts: Dict[int, int] = {}
+        for slide, block in members:
+            offset = self._number_offset(block.text, slide.page_number)
+            if offset is not None:
+                counts[offset] = counts.get(offset, 0) + 1
+        
+        if not counts:
+            return None, 0
+        
+        offset = max(counts, key=lambda o: (counts[o], -abs(o)))
+        return offset, counts[offset]
     
     def _detect_slide_page_number(self, slide: Slide) -> None:
-        if not slide.blocks:
+        if not slide.blocks or not slide.width or not slide.height:
             return
         
         page_number_candidates = []
@@ -72,8 +304,8 @@ class PageNumberDetector:
     def _matches_page_number_pattern(self, text: str) -> bool:
         clean_text = text.strip()
         
-        for pattern in self.page_number_patterns:
-            if re.match(pattern, clean_text, re.IGNORECASE):
+        for pattern in self._compiled_patterns:
+            if pattern.match(clean_text):
                 return True
         
         return False
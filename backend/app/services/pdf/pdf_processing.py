@@ -1,9 +1,14 @@
+import time
+from dataclasses import replace
 from pathlib import Path
-from app.adapters.pdf.pdfplumber_extractor import PdfPlumberExtractor
+from typing import Dict, Optional
+from app.core.tracing import span
+from app.adapters.pdf.pdfplumber_extractor import PdfPlumberExtractor, collect_fonts
 from app.services.pdf.normalization import TextNormalizer
 from app.services.pdf.layout import LayoutAnalyzer
 from app.services.pdf.page_number import PageNumberDetector
-from app.domain.entities import Presentation
+from app.services.pdf.fingerprint import slide_fingerprint
+from app.domain.entities import PageNumberPosition, Presentation
 
 class PdfProcessingService:
     
@@ -13,27 +18,86 @@ class PdfProcessingService:
         self.layout_analyzer = LayoutAnalyzer()
         self.page_number_detector = PageNumberDetector()
     
-    def process_pdf(self, file_path: Path) -> Presentation:
-
-        raw_presentation = self.extractor.extract(file_path)
+    def process_pdf(self, file_path: Path, timings: Optional[Dict[str, float]] = None,
+                    previous: Optional[Presentation] = None, content_keys: bool = False) -> Presentation:
+        clock = time.perf_counter
+        started = clock()
+        known = {} if content_keys else None
+        if previous is not None:
+            known = {slide.content_key: slide for slide in previous.slides if slide.content_key is not None}
+        with span("pdf.extract", "pdf"):
+            raw_presentation = self.extractor.extract(file_path, known)
+        extracted = clock()
         
+        normalize = layout = numbering = 0.0
         processed_slides = []
+        page_numbers = self.page_number_detector.stream()
         for raw_slide in raw_presentation.slides:
-            text_runs = self.normalizer.normalize_symbols(raw_slide.raw_chars)
+            reused = known.get(raw_slide.content_key) if known else None
+            if reused is not None:
+                step = clock()
+                processed_slide = replace(
+                    reused,
+                    blocks=[replace(block) for block in reused.blocks],
+                    page_number=raw_slide.page_number,
+                    detected_page_number=None,
+                    page_number_position=PageNumberPosition.NONE,
+                    page_number_bbox=None,
+                    fingerprint=None,
+                    text_pool=None
+                )
+                processed_slides.append(processed_slide)
+                page_numbers.feed(processed_slide)
+                numbering += clock() - step
+                continue
             
-            paragraphs = self.layout_analyzer.build_paragraphs(
-                text_runs, raw_slide.width, raw_slide.height
-            )
+            with span("pdf.slide", "pdf", page=raw_slide.page_number):
+                step = clock()
+                with span("pdf.normalize", "pdf"):
+                    text_runs = self.normalizer.normalize_symbols(raw_slide.raw_chars)
+                raw_slide.raw_chars = []
+                normalized = clock()
+                
+                with span("pdf.layout", "pdf"):
+                    paragraphs = self.layout_analyzer.build_paragraphs(
+                        text_runs, raw_slide.width, raw_slide.height
+                    )
+                laid_out = clock()
+                
+                processed_slide = raw_slide
+                processed_slide.blocks = paragraphs
+                processed_slides.append(processed_slide)
+                page_numbers.feed(processed_slide)
+            
+            normalize += normalized - step
+            layout += laid_out - normalized
+            numbering += clock() - laid_out
+        
+        step = clock()
+        with span("pdf.page_numbers", "pdf"):
+            page_numbers.finish()
+        numbering += clock() - step
+        
+        step = clock()
+        with span("pdf.fingerprint", "pdf"):
+            for slide in processed_slides:
+                slide.fingerprint = slide_fingerprint(slide)
             
-            processed_slide = raw_slide
-            processed_slide.blocks = paragraphs
-            processed_slides.append(processed_slide)
+            presentation = Presentation(
+                file_path=raw_presentation.file_path,
+                slides=processed_slides,
+                metadata=raw_presentation.metadata,
+                fonts_used=collect_fonts(processed_slides) if known else raw_presentation.fonts_used,
+                page_number_slot=page_numbers.slot
+            )
+            presentation.intern_texts()
+        fingerprint = clock() - step
         
-        processed_slides = self.page_number_detector.detect_page_numbers(processed_slides)
+        if timings is not None:
+            timings["extract"] = extracted - started
+            timings["normalize"] = normalize
+            timings["layout"] = layout
+            timings["page_numbers"] = numbering
+            timings["fingerprint"] = fingerprint
         
-        return Presentation(
-            file_path=raw_presentation.file_path,
-            slides=processed_slides,
-            metadata=raw_presentation.metadata,
-            fonts_used=raw_presentation.fonts_used
-        )
+        return presentation
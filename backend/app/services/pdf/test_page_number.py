@@ -0,0 +1,111 @@
+"""
+Тесты определения номеров страниц по шаблону презентации
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.entities import Slide, Paragraph, TextRun, PageNumberPosition
+from app.services.pdf.page_number import PageNumberDetector
+
+
+def make_block(text, bbox):
+    return Paragraph(text=text, runs=[TextRun(text=text, font_size=10, bbox=bbox)], bbox=bbox)
+
+
+def make_slide(page_number, number_text=None, number_bbox=(930, 280, 945, 292)):
+    blocks = [make_block("Заголовок слайда", (50, 40, 500, 80))]
+    if number_text is not None:
+        blocks.append(make_block(number_text, number_bbox))
+    return Slide(page_number=page_number, width=960, height=540, blocks=blocks)
+
+
+class TestPageNumberSlot:
+    """Тесты обучения позиции номера страницы"""
+
+    def test_learns_slot_outside_default_zones(self):
+        slides = [make_slide(i, str(i)) for i in range(1, 11)]
+
+        detector = PageNumberDetector(learn_pages=4)
+        slides, slot = detector.detect_page_numbers_with_slot(slides)
+
+        assert slot is not None
+        assert slot.offset == 0
+        assert slot.position == PageNumberPosition.TOP_RIGHT
+        assert [s.detected_page_number for s in slides] == [str(i) for i in range(1, 11)]
+
+    def test_offset_between_slide_and_number(self):
+        slides = [make_slide(1)] + [make_slide(i, str(i - 1)) for i in range(2, 8)]
+
+        detector = PageNumberDetector(learn_pages=4)
+        slides, slot = detector.detect_page_numbers_with_slot(slides)
+
+        assert slot is not None
+        assert slot.offset == -1
+        assert slides[0].detected_page_number is None
+        assert slides[-1].detected_page_number == "6"
+
+    def test_static_number_is_not_learned_as_slot(self):
+        slides = [make_slide(i, "42") for i in range(1, 8)]
+
+        detector = PageNumberDetector(learn_pages=4)
+        _, slot = detector.detect_page_numbers_with_slot(slides)
+
+        assert slot is None
+
+    def test_streaming_resolves_after_learning(self):
+        detector = PageNumberDetector(learn_pages=3)
+        stream = detector.stream()
+
+        assert stream.feed(make_slide(1, "1")) == []
+        assert stream.feed(make_slide(2, "2")) == []
+        assert len(stream.feed(make_slide(3, "3"))) == 3
+        assert stream.slot is not None
+
+        resolved = stream.feed(make_slide(4, "4"))
+        assert resolved[0].detected_page_number == "4"
+        assert stream.finish() == []
+
+    def test_falls_back_to_zones_without_slot(self):
+        slide = make_slide(1, "1", number_bbox=(900, 515, 915, 527))
+
+        detector = PageNumberDetector()
+        slides, slot = detector.detect_page_numbers_with_slot([slide])
+
+        assert slot is None
+        assert slides[0].detected_page_number == "1"
+        assert slides[0].page_number_position == PageNumberPosition.BOTTOM_RIGHT
+
+    def test_zero_size_page_is_skipped(self):
+        slides = [make_slide(i, str(i)) for i in range(1, 6)]
+        slides.insert(2, Slide(page_number=3, width=0, height=0, blocks=[make_block("3", (0, 0, 0, 0))]))
+
+        detector = PageNumberDetector(learn_pages=4)
+        slides, slot = detector.detect_page_numbers_with_slot(slides)
+        detector.resolve_slide(slides[2], None)
+
+        assert slot is not None
+        assert slides[2].detected_page_number is None
+        assert slides[5].detected_page_number == "5"
+
+    def test_only_blocks_near_slot_are_matched(self):
+        slides = [make_slide(i, str(i)) for i in range(1, 5)]
+        detector = PageNumberDetector(learn_pages=4)
+        stream = detector.stream()
+        for slide in slides:
+            stream.feed(slide)
+
+        dense = make_slide(5, "5")
+        dense.blocks[1:1] = [make_block(str(i), (50, 100 + i, 500, 110 + i)) for i in range(200)]
+        with patch.object(PageNumberDetector, "_matches_page_number_pattern", autospec=True,
+                          side_effect=PageNumberDetector._matches_page_number_pattern) as matches:
+            stream.feed(dense)
+
+        assert matches.call_count == 1
+        assert dense.detected_page_number == "5"
+        assert stream.slot_index.cells == frozenset(stream.slot.cells)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,79 @@
+"""
+Тесты повторной обработки PDF с переиспользованием неизмененных страниц
+"""
+
+from unittest.mock import patch
+
+from app.adapters.pdf.pdfplumber_extractor import PdfPlumberExtractor
+from app.services.pdf.pdf_processing import PdfProcessingService
+from benchmarks.pdf_fixtures import build_pages, write_pages
+
+
+def shrink_fonts(items):
+    return [(x, y, 11 if size == 16 else size, font, text) for x, y, size, font, text in items]
+
+
+def summary(presentation):
+    return (
+        [slide.fingerprint for slide in presentation.slides],
+        presentation.fonts_used,
+        presentation.page_number_slot
+    )
+
+
+class TestIncrementalProcessing:
+    """Тесты извлечения только измененных страниц"""
+
+    def test_unchanged_pages_are_reused(self, tmp_path):
+        pages = build_pages(6)
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(write_pages(pages))
+        service = PdfProcessingService()
+        previous = service.process_pdf(pdf_path, content_keys=True)
+
+        pages[2] = shrink_fonts(pages[2])
+        pdf_path.write_bytes(write_pages(pages))
+        with patch.object(PdfPlumberExtractor, "_parse_page", autospec=True,
+                          side_effect=PdfPlumberExtractor._parse_page) as parse_page:
+            presentation = service.process_pdf(pdf_path, previous=previous)
+
+        assert [call.args[2] for call in parse_page.call_args_list] == [3]
+        assert summary(presentation) == summary(PdfProcessingService().process_pdf(pdf_path))
+        assert presentation.slides[2].fingerprint != previous.slides[2].fingerprint
+        assert presentation.slides[0].blocks[0] is not previous.slides[0].blocks[0]
+        assert all(
+            previous.text_pool.text(block.text_id) == block.text
+            for slide in previous.slides for block in slide.blocks
+        )
+
+    def test_fingerprint_has_its_own_stage(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(write_pages(build_pages(2)))
+        timings = {}
+
+        PdfProcessingService().process_pdf(pdf_path, timings)
+
+        assert list(timings) == ["extract", "normalize", "layout", "page_numbers", "fingerprint"]
+
+    def test_appended_slide_is_the_only_one_extracted(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(write_pages(build_pages(4)))
+        service = PdfProcessingService()
+        previous = service.process_pdf(pdf_path, content_keys=True)
+
+        pdf_path.write_bytes(write_pages(build_pages(5)))
+        with patch.object(PdfPlumberExtractor, "_parse_page", autospec=True,
+                          side_effect=PdfPlumberExtractor._parse_page) as parse_page:
+            presentation = service.process_pdf(pdf_path, previous=previous)
+
+        assert parse_page.call_count == 1
+        assert [slide.page_number for slide in presentation.slides] == [1, 2, 3, 4, 5]
+        assert summary(presentation) == summary(PdfProcessingService().process_pdf(pdf_path))
+
+    def test_content_keys_are_off_by_default(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(write_pages(build_pages(2)))
+
+        presentation = PdfProcessingService().process_pdf(pdf_path)
+
+        assert all(slide.content_key is None for slide in presentation.slides)
@@ -0,0 +1,218 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.logging import get_logger, setup_logging
+from app.core.metrics import PIPELINE_ERRORS, observe_pipeline
+from app.core.tracing import should_sample, span, traced, write_trace
+from app.services.dsl import get_engine_cache
+from app.services.file_service import FileService
+from app.services.kernel.slide_cache import get_slide_result_cache
+from app.services.kernel.validation_engine import SlideOutcome
+from app.services.profile_service import get_profile_store
+from app.services.spelling import spelling_services_stats
+
+logger = get_logger(__name__)
+
+CacheCounters = Dict[str, Tuple[int, int]]
+
+class PipelineSaturatedError(Exception):
+
+    def __init__(self, retry_after: int):
+        super().__init__("Сервис перегружен, повторите попытку позже")
+        self.retry_after = retry_after
+
+@lru_cache(maxsize=1)
+def _worker_file_service() -> FileService:
+    return FileService()
+
+def _init_worker() -> None:
+    setup_logging()
+    _worker_file_service().pdf_processor.extractor.preload()
+    get_profile_store().warm()
+
+def process_cache_counters() -> CacheCounters:
+    engines = get_engine_cache().stats()
+    counters = {"engines": (engines["hits"], engines["misses"])}
+
+    slide_cache = get_slide_result_cache()
+    if slide_cache is not None:
+        checks = slide_cache.stats()["checks"].values()
+        counters["slides"] = (sum(check["hits"] for check in checks), sum(check["misses"] for check in checks))
+
+    for backend, stats in spelling_services_stats().items():
+        counters[f"spelling:{backend}"] = (stats["words"]["hits"], stats["words"]["misses"])
+    return counters
+
+def hit_ratios(counters: CacheCounters) -> Dict[str, Dict[str, Any]]:
+    return {
+        name: {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0}
+        for name, (hits, misses) in sorted(counters.items())
+    }
+
+def run_pipeline(pdf_path: str, yaml_content: str, pdf_filename: str, rules_name: str,
+                 trace: bool = False, report_caches: bool = False,
+                 previous_slides: Optional[List[SlideOutcome]] = None) -> Dict[str, Any]:
+    before = process_cache_counters() if report_caches else None
+    with traced(trace) as active:
+        with span("engine.compile", "engine"):
+            engine = get_engine_cache().get_or_compile(yaml_content)
+        result = _worker_file_service().process_file(
+            Path(pdf_path), engine, pdf_filename, rules_name, previous_slides=previous_slides
+        )
+    if active is not None:
+        result["trace"] = active.to_chrome()
+    if before is not None:
+        after = process_cache_counters()
+        result["cache_counters"] = {
+            name: (hits - before.get(name, (0, 0))[0], misses - before.get(name, (0, 0))[1])
+            for name, (hits, misses) in after.items()
+        }
+    return result
+
+class PipelineExecutor:
+
+    def __init__(self, workers: int = 2, queue_limit: int = 8, retry_after: int = 5,
+                 trace_sample_rate: float = 0.0, trace_dir: Optional[Path] = None):
+        self.workers = max(0, workers)
+        self.capacity = max(1, self.workers) + max(0, queue_limit)
+        self.retry_after = retry_after
+        self.trace_sample_rate = trace_sample_rate
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._worker_caches: Dict[str, Tuple[int, int]] = {}
+
+    def admit(self) -> None:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise PipelineSaturatedError(self.retry_after)
+            self.in_flight += 1
+
+    async def admit_when_free(self, poll_interval: float = 0.05) -> None:
+        while True:
+            with self._lock:
+                if self.in_flight < self.capacity:
+                    self.in_flight += 1
+                    return
+            await asyncio.sleep(poll_interval)
+
+    def ensure_capacity(self) -> None:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise PipelineSaturatedError(self.retry_after)
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    async def run(self, pdf_path: Path, yaml_content: str, pdf_filename: str, rules_name: str,
+                  trace: bool = False, previous_slides: Optional[List[SlideOutcome]] = None) -> Dict[str, Any]:
+        sampled = self.trace_dir is not None and should_sample(self.trace_sample_rate)
+        try:
+            result = await self._execute(
+                pdf_path, yaml_content, pdf_filename, rules_name, trace or sampled, previous_slides
+            )
+        except Exception:
+            PIPELINE_ERRORS.inc()
+            raise
+        observe_pipeline(result)
+        if self.trace_dir is not None and "trace" in result:
+            await asyncio.to_thread(write_trace, self.trace_dir, result["trace"])
+        return result
+
+    async def _execute(self, pdf_path: Path, yaml_content: str, pdf_filename: str, rules_name: str,
+                       trace: bool, previous_slides: Optional[List[SlideOutcome]]) -> Dict[str, Any]:
+        pipeline = partial(
+            run_pipeline, str(pdf_path), yaml_content, pdf_filename, rules_name, trace,
+            previous_slides=previous_slides
+        )
+        if self.workers == 0:
+            return await asyncio.to_thread(pipeline)
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._get_pool(), partial(pipeline, report_caches=True))
+        except BrokenProcessPool:
+            logger.error("Пул процессов обработки аварийно завершился, будет создан заново")
+            self._reset_pool()
+            raise
+        self._record_worker_caches(result.pop("cache_counters", {}))
+        return result
+
+    def _record_worker_caches(self, counters: CacheCounters) -> None:
+        with self._lock:
+            for name, (hits, misses) in counters.items():
+                found, missed = self._worker_caches.get(name, (0, 0))
+                self._worker_caches[name] = (found + hits, missed + misses)
+
+    def cache_counters(self) -> CacheCounters:
+        counters = process_cache_counters()
+        with self._lock:
+            for name, (hits, misses) in self._worker_caches.items():
+                found, missed = counters.get(name, (0, 0))
+                counters[name] = (found + hits, missed + misses)
+        return counters
+
+    def worker_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return hit_ratios(self._worker_caches)
+
+    def start(self) -> None:
+        if self.workers:
+            pool = self._get_pool()
+            for future in [pool.submit(os.getpid) for _ in range(self.workers)]:
+                future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - max(1, self.workers)),
+            "rejected": self.rejected
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+@lru_cache(maxsize=1)
+def get_pipeline_executor() -> PipelineExecutor:
+    settings = get_settings()
+    return PipelineExecutor(
+        workers=settings.PIPELINE_WORKERS,
+        queue_limit=settings.PIPELINE_QUEUE_LIMIT,
+        retry_after=settings.PIPELINE_RETRY_AFTER,
+        trace_sample_rate=settings.TRACE_SAMPLE_RATE,
+        trace_dir=settings.TRACE_DIR or None
+    )
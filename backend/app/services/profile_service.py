@@ -0,0 +1,182 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.services.dsl import CompiledEngineCache, get_engine_cache, rules_hash, DSLParseError
+from app.services.kernel.validation_engine import ValidationEngine
+
+logger = get_logger(__name__)
+
+PROFILE_ID_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_\-]{0,63}$')
+
+class ProfileError(Exception):
+    pass
+
+class ProfileNotFoundError(ProfileError):
+    pass
+
+@dataclass(frozen=True)
+class RuleProfile:
+    profile_id: str
+    version: int
+    rules_hash: str
+    filename: str
+    rules_count: int
+    created_at: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class RuleProfileStore:
+
+    def __init__(self, root: Path, engine_cache: Optional[CompiledEngineCache] = None):
+        self.root = Path(root)
+        self.engine_cache = engine_cache or CompiledEngineCache()
+        self._engines: Dict[Tuple[str, int], ValidationEngine] = {}
+        self._lock = threading.Lock()
+
+    def create_version(self, profile_id: str, yaml_content: str, filename: str) -> RuleProfile:
+        self._validate_profile_id(profile_id)
+
+        engine = self.engine_cache.get_or_compile(yaml_content)
+        content_hash = rules_hash(yaml_content)
+
+        with self._lock:
+            latest = self._latest_version(profile_id)
+            if latest is not None:
+                current = self._read_meta(profile_id, latest)
+                if current.rules_hash == content_hash:
+                    return current
+
+            version = (latest or 0) + 1
+            profile = RuleProfile(
+                profile_id=profile_id,
+                version=version,
+                rules_hash=content_hash,
+                filename=filename,
+                rules_count=len(engine.presentation_checks) + len(engine.slide_checks),
+                created_at=datetime.now(timezone.utc).isoformat()
+            )
+
+            profile_dir = self.root / profile_id
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(profile_dir / f"v{version}.yaml", yaml_content)
+            self._write_atomic(profile_dir / f"v{version}.json", json.dumps(profile.to_dict(), ensure_ascii=False))
+
+            self._engines[(profile_id, version)] = engine
+
+        logger.info("Профиль правил %s сохранен, версия %s", profile_id, version)
+        return profile
+
+    def get(self, profile_id: str, version: Optional[int] = None) -> RuleProfile:
+        version = self._resolve_version(profile_id, version)
+        return self._read_meta(profile_id, version)
+
+    def get_source(self, profile_id: str, version: Optional[int] = None) -> str:
+        version = self._resolve_version(profile_id, version)
+        return (self.root / profile_id / f"v{version}.yaml").read_text(encoding='utf-8')
+
+    def get_engine(self, profile_id: str, version: Optional[int] = None) -> Tuple[RuleProfile, ValidationEngine]:
+        profile = self.get(profile_id, version)
+        key = (profile.profile_id, profile.version)
+
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = self.engine_cache.get_or_compile(self.get_source(profile.profile_id, profile.version))
+            with self._lock:
+                engine = self._engines.setdefault(key, engine)
+
+        return profile, engine
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        if not self.root.exists():
+            return []
+
+        profiles = []
+        for profile_dir in sorted(p for p in self.root.iterdir() if p.is_dir()):
+            versions = self._versions(profile_dir.name)
+            if not versions:
+                continue
+            latest = self._read_meta(profile_dir.name, versions[-1])
+            profiles.append({
+                **latest.to_dict(),
+                "versions": versions
+            })
+
+        return profiles
+
+    def list_versions(self, profile_id: str) -> List[RuleProfile]:
+        self._validate_profile_id(profile_id)
+        versions = self._versions(profile_id)
+        if not versions:
+            raise ProfileNotFoundError(f"Профиль правил не найден: {profile_id}")
+        return [self._read_meta(profile_id, v) for v in versions]
+
+    def warm(self) -> int:
+        warmed = 0
+        for profile in self.list_profiles():
+            try:
+                self.get_engine(profile["profile_id"], profile["version"])
+                warmed += 1
+            except (DSLParseError, OSError, ProfileError) as e:
+                logger.warning("Не удалось загрузить профиль %s: %s", profile["profile_id"], e)
+        return warmed
+
+    def _resolve_version(self, profile_id: str, version: Optional[int]) -> int:
+        self._validate_profile_id(profile_id)
+
+        if version is None:
+            version = self._latest_version(profile_id)
+
+        if version is None or not (self.root / profile_id / f"v{version}.json").exists():
+            suffix = f" (версия {version})" if version is not None else ""
+            raise ProfileNotFoundError(f"Профиль правил не найден: {profile_id}{suffix}")
+
+        return version
+
+    def _versions(self, profile_id: str) -> List[int]:
+        profile_dir = self.root / profile_id
+        if not profile_dir.is_dir():
+            return []
+
+        versions = []
+        for meta in profile_dir.glob("v*.json"):
+            try:
+                versions.append(int(meta.stem[1:]))
+            except ValueError:
+                continue
+
+        return sorted(versions)
+
+    def _latest_version(self, profile_id: str) -> Optional[int]:
+        versions = self._versions(profile_id)
+        return versions[-1] if versions else None
+
+    def _read_meta(self, profile_id: str, version: int) -> RuleProfile:
+        meta_path = self.root / profile_id / f"v{version}.json"
+        data = json.loads(meta_path.read_text(encoding='utf-8'))
+        return RuleProfile(**data)
+
+    def _validate_profile_id(self, profile_id: str) -> None:
+        if not PROFILE_ID_PATTERN.match(profile_id or ""):
+            raise ProfileError(
+                f"Некорректный идентификатор профиля: {profile_id}. "
+                "Допустимы латинские буквы, цифры, '_' и '-'"
+            )
+
+    def _write_atomic(self, path: Path, content: str) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(content, encoding='utf-8')
+        os.replace(tmp_path, path)
+
+@lru_cache(maxsize=1)
+def get_profile_store() -> RuleProfileStore:
+    return RuleProfileStore(get_settings().upload_path / "profiles", get_engine_cache())
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+RESULT_CACHE_VERSION = 1
+
+def engine_version() -> str:
+    return f"{get_settings().APP_VERSION}/{RESULT_CACHE_VERSION}"
+
+def result_cache_key(pdf_sha256: str, rules_sha256: str, pdf_filename: str, rules_name: str,
+                     version: Optional[str] = None) -> str:
+    raw = f"{version or engine_version()}\n{pdf_sha256}\n{rules_sha256}\n{pdf_filename}\n{rules_name}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def response_etag(response: Dict[str, Any]) -> str:
+    content = {field: value for field, value in response.items() if field != "timing"}
+    body = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+@dataclass(frozen=True)
+class CachedResult:
+    response: Dict[str, Any]
+    etag: str
+    expires_at: float
+
+class ResultCache:
+
+    def __init__(self, maxsize: int = 128, ttl: float = 86400.0, nondeterministic_ttl: float = 600.0,
+                 directory: Optional[Path] = None, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.nondeterministic_ttl = nondeterministic_ttl
+        self.directory = Path(directory) if directory else None
+        self.clock = clock
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, response: Dict[str, Any], deterministic: bool = True) -> CachedResult:
+        ttl = self.ttl if deterministic else self.nondeterministic_ttl
+        entry = CachedResult(response=response, etag=response_etag(response), expires_at=self.clock() + ttl)
+        if ttl <= 0:
+            return entry
+
+        with self._lock:
+            self._remember(key, entry)
+        self._store(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "disk": str(self.directory) if self.directory is not None else None,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0
+            }
+
+    def _remember(self, key: str, entry: CachedResult) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load(self, key: str, now: float) -> Optional[CachedResult]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Не удалось прочитать кэш результата %s: %s", key[:12], e)
+            return None
+
+        if data["expires_at"] <= now:
+            path.unlink(missing_ok=True)
+            return None
+        return CachedResult(response=data["response"], etag=data["etag"], expires_at=data["expires_at"])
+
+    def _store(self, key: str, entry: CachedResult) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as target:
+                json.dump(
+                    {"etag": entry.etag, "expires_at": entry.expires_at, "response": entry.response},
+                    target, ensure_ascii=False
+                )
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning("Не удалось сохранить кэш результата %s: %s", key[:12], e)
+
+@lru_cache(maxsize=1)
+def get_result_cache() -> ResultCache:
+    settings = get_settings()
+    return ResultCache(
+        maxsize=settings.RESULT_CACHE_SIZE,
+        ttl=settings.RESULT_CACHE_TTL,
+        nondeterministic_ttl=settings.RESULT_CACHE_NONDETERMINISTIC_TTL,
+        directory=Path(settings.RESULT_CACHE_DIR) if settings.RESULT_CACHE_DIR else None
+    )
@@ -0,0 +1,50 @@
+from app.services.spelling.backends import (
+    SpellingBackend,
+    SpellingBackendError,
+    SpellingConfigurationError,
+    YandexSpellerBackend
+)
+from app.services.spelling.async_client import (
+    AsyncSpellingClient,
+    CircuitBreaker,
+    RateLimiter,
+    get_spelling_client,
+    spelling_clients_stats
+)
+from app.services.spelling.cache import SqliteVerdictStore, WordVerdictCache
+from app.services.spelling.service import (
+    SpellingService,
+    backend_is_deterministic,
+    get_spelling_service,
+    register_spelling_backend,
+    spelling_services_stats
+)
+from app.services.spelling.symspell import (
+    LocalSpellerBackend,
+    MappedSymSpellIndex,
+    SymSpellIndex,
+    build_local_index
+)
+
+__all__ = [
+    'SpellingBackend',
+    'SpellingBackendError',
+    'SpellingConfigurationError',
+    'YandexSpellerBackend',
+    'AsyncSpellingClient',
+    'CircuitBreaker',
+    'RateLimiter',
+    'get_spelling_client',
+    'spelling_clients_stats',
+    'SqliteVerdictStore',
+    'WordVerdictCache',
+    'SpellingService',
+    'backend_is_deterministic',
+    'get_spelling_service',
+    'register_spelling_backend',
+    'spelling_services_stats',
+    'LocalSpellerBackend',
+    'MappedSymSpellIndex',
+    'SymSpellIndex',
+    'build_local_index'
+]
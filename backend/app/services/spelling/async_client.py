@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.services.spelling.backends import BatchChecker, SpellingBackendError
+from app.services.spelling.cache import Verdict
+from app.services.spelling.service import SpellingService, get_spelling_service
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+class CircuitBreaker:
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self.clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial = False
+            if self._opened_at is not None or self.failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected
+        }
+
+class RateLimiter:
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class AsyncSpellingClient:
+
+    def __init__(self, service: SpellingService, concurrency: int = 4, rate_limit: float = 0.0,
+                 breaker: Optional[CircuitBreaker] = None, timeout: Optional[float] = None):
+        self.service = service
+        self.concurrency = max(1, concurrency)
+        self.limiter = RateLimiter(rate_limit, burst=self.concurrency)
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout = timeout
+        self.skipped = 0
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    async def check_texts(self, texts: List[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        tokenized, verdicts, missing = self._prepare(texts)
+        if missing:
+            verdicts.update(await self._fetch_all(missing))
+        return self._outcomes(tokenized, verdicts)
+
+    def check_texts_sync(self, texts: List[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        tokenized, verdicts, missing = self._prepare(texts)
+        if missing:
+            verdicts.update(run_coroutine(self._fetch_all(missing)))
+        return self._outcomes(tokenized, verdicts)
+
+    def _prepare(self, texts: List[str]) -> Tuple[List[List[str]], Dict[str, Verdict], List[str]]:
+        tokenized = [self.service.tokenize(text) for text in texts]
+        unique_words = list(dict.fromkeys(word for words in tokenized for word in words))
+        verdicts, missing = self.service.cached(unique_words)
+        return tokenized, verdicts, missing
+
+    def _outcomes(self, tokenized: List[List[str]],
+                  verdicts: Dict[str, Verdict]) -> List[Optional[List[Dict[str, Any]]]]:
+        outcomes: List[Optional[List[Dict[str, Any]]]] = []
+        for words in tokenized:
+            if all(word in verdicts for word in words):
+                outcomes.append(self.service.errors_for(words, verdicts))
+            else:
+                outcomes.append(None)
+
+        skipped = outcomes.count(None)
+        if skipped:
+            with self._lock:
+                self.skipped += skipped
+
+        return outcomes
+
+    async def _fetch_all(self, words: List[str]) -> Dict[str, Verdict]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batches = self.service.batches(words)
+
+        verdicts: Dict[str, Verdict] = {}
+        async with self.service.backend.async_session() as check_batch:
+            for fetched in await asyncio.gather(*(self._fetch(batch, semaphore, check_batch) for batch in batches)):
+                verdicts.update(fetched)
+        return verdicts
+
+    async def _fetch(self, batch: List[str], semaphore: asyncio.Semaphore,
+                     check_batch: BatchChecker) -> Dict[str, Verdict]:
+        async with semaphore:
+            if not self.breaker.allow():
+                return {}
+
+            await self.limiter.acquire()
+
+            try:
+                results = await asyncio.wait_for(check_batch(batch), self.timeout)
+            except asyncio.TimeoutError:
+                self._record_failure("Превышено время ожидания ответа от API")
+                return {}
+            except SpellingBackendError as e:
+                self._record_failure(str(e))
+                return {}
+
+            self.breaker.record_success()
+            return self.service.record_batch(batch, results)
+
+    def _record_failure(self, message: str) -> None:
+        self.breaker.record_failure()
+        self.last_error = message
+        logger.warning("Ошибка сервиса проверки орфографии %s: %s", self.service.backend.name, message)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "rate_limit": self.limiter.rate,
+            "skipped_texts": self.skipped,
+            "breaker": self.breaker.stats()
+        }
+
+_clients: Dict[str, AsyncSpellingClient] = {}
+_clients_lock = threading.Lock()
+
+def get_spelling_client(backend: str = 'yandex') -> AsyncSpellingClient:
+    client = _clients.get(backend)
+    if client is not None:
+        return client
+
+    service = get_spelling_service(backend)
+
+    with _clients_lock:
+        client = _clients.get(backend)
+        if client is None:
+            settings = get_settings()
+            client = AsyncSpellingClient(
+                service,
+                concurrency=settings.SPELLER_CONCURRENCY,
+                rate_limit=settings.SPELLER_RATE_LIMIT,
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.SPELLER_BREAKER_THRESHOLD,
+                    reset_timeout=settings.SPELLER_BREAKER_RESET
+                ),
+                timeout=settings.SPELLER_TIMEOUT
+            )
+            _clients[backend] = client
+
+    return client
+
+def spelling_clients_stats() -> Dict[str, Any]:
+    return {name: client.stats() for name, client in list(_clients.items())}
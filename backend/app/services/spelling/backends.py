@@ -0,0 +1,116 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+BatchChecker = Callable[[List[str]], Awaitable[List[List[Dict[str, Any]]]]]
+
+class SpellingBackendError(Exception):
+    pass
+
+class SpellingConfigurationError(ValueError):
+    pass
+
+class SpellingBackend(ABC):
+    
+    name: str = "base"
+    max_batch_chars: int = 10000
+    max_batch_texts: int = 100
+    deterministic: bool = True
+    
+    @abstractmethod
+    def check_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        pass
+    
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[BatchChecker]:
+        async def check(texts: List[str]) -> List[List[Dict[str, Any]]]:
+            return await asyncio.to_thread(self.check_batch, texts)
+        yield check
+    
+    def close(self) -> None:
+        pass
+
+class YandexSpellerBackend(SpellingBackend):
+    
+    name = "yandex"
+    deterministic = False
+    
+    def __init__(self, api_url: str = "https://speller.yandex.net/services/spellservice.json",
+                 timeout: float = 5.0, pool_size: int = 8, options: int = 0):
+        self.api_url = api_url.rstrip('/')
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.options = options
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def check_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        if not texts:
+            return []
+        
+        import requests
+        
+        data = [('text', text) for text in texts]
+        data.append(('options', str(self.options)))
+        
+        try:
+            response = self.session.post(
+                f"{self.api_url}/checkTexts",
+                data=data,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except requests.exceptions.Timeout:
+            raise SpellingBackendError("Превышено время ожидания ответа от API")
+        except requests.exceptions.RequestException as e:
+            raise SpellingBackendError(f"Ошибка запроса к API: {str(e)}")
+        except ValueError as e:
+            raise SpellingBackendError(f"Ошибка парсинга ответа API: {str(e)}")
+        
+        return self._parse(payload, texts)
+    
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[BatchChecker]:
+        import httpx
+        
+        limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            async def check(texts: List[str]) -> List[List[Dict[str, Any]]]:
+                if not texts:
+                    return []
+                
+                try:
+                    response = await client.post(
+                        f"{self.api_url}/checkTexts",
+                        data={'text': texts, 'options': str(self.options)}
+                    )
+                    response.raise_for_status()
+                    payload = response.json()
+                except httpx.TimeoutException:
+                    raise SpellingBackendError("Превышено время ожидания ответа от API")
+                except httpx.HTTPError as e:
+                    raise SpellingBackendError(f"Ошибка запроса к API: {str(e)}")
+                except ValueError as e:
+                    raise SpellingBackendError(f"Ошибка парсинга ответа API: {str(e)}")
+                
+                return self._parse(payload, texts)
+            
+            yield check
+    
+    @staticmethod
+    def _parse(payload: Any, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        if not isinstance(payload, list) or len(payload) != len(texts):
+            raise SpellingBackendError("Ошибка парсинга ответа API: неожиданный формат")
+        
+        return [errors if isinstance(errors, list) else [] for errors in payload]
+    
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,94 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Verdict = Optional[Tuple[str, ...]]
+
+class WordVerdictCache:
+    
+    def __init__(self, maxsize: int = 50000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._verdicts: "OrderedDict[str, Verdict]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_many(self, words: Iterable[str]) -> Dict[str, Verdict]:
+        found = {}
+        with self._lock:
+            for word in words:
+                if word not in self._verdicts:
+                    self.misses += 1
+                    continue
+                self._verdicts.move_to_end(word)
+                self.hits += 1
+                found[word] = self._verdicts[word]
+        return found
+    
+    def put_many(self, verdicts: Dict[str, Verdict]) -> None:
+        with self._lock:
+            for word, verdict in verdicts.items():
+                self._verdicts[word] = verdict
+                self._verdicts.move_to_end(word)
+            while len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+    
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._verdicts),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+class SqliteVerdictStore:
+    
+    def __init__(self, path: Path, namespace: str):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS spelling_verdicts ("
+            "namespace TEXT NOT NULL, word TEXT NOT NULL, suggestions TEXT, "
+            "PRIMARY KEY (namespace, word))"
+        )
+        self._connection.commit()
+    
+    def get_many(self, words: List[str]) -> Dict[str, Verdict]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(words), 500):
+                chunk = words[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT word, suggestions FROM spelling_verdicts WHERE namespace = ? AND word IN ({placeholders})",
+                    [self.namespace, *chunk]
+                )
+                for word, suggestions in rows:
+                    found[word] = tuple(json.loads(suggestions)) if suggestions is not None else None
+        return found
+    
+    def put_many(self, verdicts: Dict[str, Verdict]) -> None:
+        if not verdicts:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO spelling_verdicts (namespace, word, suggestions) VALUES (?, ?, ?)",
+                [
+                    (self.namespace, word, json.dumps(list(verdict), ensure_ascii=False) if verdict is not None else None)
+                    for word, verdict in verdicts.items()
+                ]
+            )
+            self._connection.commit()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,172 @@
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import Settings, get_settings
+from app.core.logging import get_logger
+from app.services.spelling.backends import SpellingBackend, SpellingConfigurationError, YandexSpellerBackend
+from app.services.spelling.cache import SqliteVerdictStore, Verdict, WordVerdictCache
+
+logger = get_logger(__name__)
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:[-'’][^\W\d_]+)*")
+
+class SpellingService:
+    
+    def __init__(self, backend: SpellingBackend, cache: Optional[WordVerdictCache] = None,
+                 store: Optional[SqliteVerdictStore] = None):
+        self.backend = backend
+        self.cache = cache or WordVerdictCache()
+        self.store = store
+        self.requests = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        return WORD_PATTERN.findall(text)
+    
+    def check_texts(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        tokenized = [self.tokenize(text) for text in texts]
+        unique_words = list(dict.fromkeys(word for words in tokenized for word in words))
+        
+        verdicts = self.lookup(unique_words)
+        
+        return [self.errors_for(words, verdicts) for words in tokenized]
+    
+    @staticmethod
+    def errors_for(words: List[str], verdicts: Dict[str, Verdict]) -> List[Dict[str, Any]]:
+        return [{'word': word, 's': list(verdicts[word])} for word in words if verdicts.get(word) is not None]
+    
+    def lookup(self, words: List[str]) -> Dict[str, Verdict]:
+        verdicts, missing = self.cached(words)
+        
+        for batch in self.batches(missing):
+            verdicts.update(self.fetch_batch(batch))
+        
+        return verdicts
+    
+    def cached(self, words: List[str]) -> Tuple[Dict[str, Verdict], List[str]]:
+        verdicts = self.cache.get_many(words)
+        missing = [word for word in words if word not in verdicts]
+        
+        if missing and self.store is not None:
+            stored = self.store.get_many(missing)
+            self.cache.put_many(stored)
+            verdicts.update(stored)
+            missing = [word for word in missing if word not in stored]
+        
+        return verdicts, missing
+    
+    def fetch_batch(self, batch: List[str]) -> Dict[str, Verdict]:
+        return self.record_batch(batch, self.backend.check_batch(batch))
+    
+    def record_batch(self, batch: List[str], results: List[List[Dict[str, Any]]]) -> Dict[str, Verdict]:
+        with self._lock:
+            self.requests += 1
+        
+        fetched: Dict[str, Verdict] = {
+            word: tuple(errors[0].get('s', [])) if errors else None
+            for word, errors in zip(batch, results)
+        }
+        
+        self.cache.put_many(fetched)
+        if self.store is not None:
+            self.store.put_many(fetched)
+        
+        return fetched
+    
+    def batches(self, words: List[str]) -> List[List[str]]:
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_chars = 0
+        
+        for word in words:
+            if current and (current_chars + len(word) > self.backend.max_batch_chars
+                            or len(current) >= self.backend.max_batch_texts):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(word)
+            current_chars += len(word)
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "requests": self.requests,
+            "words": self.cache.stats()
+        }
+
+BackendFactory = Callable[[Settings], SpellingBackend]
+
+def _local_backend(settings: Settings) -> SpellingBackend:
+    from app.services.spelling.symspell import LocalSpellerBackend, build_local_index
+    
+    index = build_local_index(
+        settings.SPELLING_DICTIONARIES,
+        index_path=settings.SPELLING_INDEX_PATH or None,
+        max_edit_distance=settings.SPELLING_MAX_EDIT_DISTANCE
+    )
+    return LocalSpellerBackend(index)
+
+BACKEND_FACTORIES: Dict[str, BackendFactory] = {
+    'yandex': lambda s: YandexSpellerBackend(
+        api_url=s.SPELLER_API_URL,
+        timeout=s.SPELLER_TIMEOUT,
+        pool_size=s.SPELLER_POOL_SIZE
+    ),
+    'local': _local_backend,
+}
+
+BACKEND_DETERMINISTIC: Dict[str, bool] = {
+    'yandex': False,
+    'local': True,
+}
+
+_services: Dict[str, SpellingService] = {}
+_services_lock = threading.Lock()
+
+def register_spelling_backend(name: str, factory: BackendFactory, deterministic: bool = False) -> None:
+    BACKEND_FACTORIES[name] = factory
+    BACKEND_DETERMINISTIC[name] = deterministic
+
+def backend_is_deterministic(backend: str) -> bool:
+    return BACKEND_DETERMINISTIC.get(backend, False)
+
+def get_spelling_service(backend: str = 'yandex') -> SpellingService:
+    service = _services.get(backend)
+    if service is not None:
+        return service
+    
+    if backend not in BACKEND_FACTORIES:
+        raise SpellingConfigurationError(f"Неизвестный сервис проверки орфографии: {backend}")
+    
+    with _services_lock:
+        service = _services.get(backend)
+        if service is None:
+            settings = get_settings()
+            store = None
+            if settings.SPELLING_CACHE_PATH:
+                store = SqliteVerdictStore(settings.SPELLING_CACHE_PATH, namespace=backend)
+            
+            try:
+                instance = BACKEND_FACTORIES[backend](settings)
+            except (OSError, ValueError) as e:
+                logger.warning("Сервис проверки орфографии %s не настроен: %s", backend, e)
+                raise SpellingConfigurationError(f"Сервис проверки орфографии {backend} не настроен: {e}") from e
+            
+            service = SpellingService(
+                backend=instance,
+                cache=WordVerdictCache(maxsize=settings.SPELLING_CACHE_SIZE),
+                store=store
+            )
+            _services[backend] = service
+    
+    return service
+
+def spelling_services_stats() -> Dict[str, Any]:
+    return {name: service.stats() for name, service in list(_services.items())}
@@ -0,0 +1,157 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from app.services.spelling.service import WORD_PATTERN
+
+DEFAULT_MISSPELLINGS: Dict[str, List[str]] = {
+    "превед": ["привет"],
+    "ошибко": ["ошибка", "ошибки"],
+    "презинтация": ["презентация"],
+    "teh": ["the"],
+    "recieve": ["receive"],
+}
+
+class _SpellerHandler(BaseHTTPRequestHandler):
+    
+    server: "_StubHTTPServer"
+    
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self._respond(parsed.path, parse_qs(parsed.query))
+    
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ""
+        params = parse_qs(parsed.query)
+        params.update(parse_qs(body))
+        self._respond(parsed.path, params)
+    
+    def _respond(self, path: str, params: Dict[str, List[str]]) -> None:
+        stub = self.server.stub
+        stub._record_request(params.get('text', []))
+        
+        if stub.latency:
+            time.sleep(stub.latency)
+        
+        if stub.mode == "error":
+            self.send_error(stub.error_status)
+            return
+        
+        if stub.mode == "hang":
+            stub._released.wait(stub.hang_timeout)
+            self.close_connection = True
+            return
+        
+        texts = params.get('text', [])
+        if path.endswith('/checkTexts'):
+            payload = [stub.check(text) for text in texts]
+        elif path.endswith('/checkText'):
+            payload = stub.check(texts[0] if texts else "")
+        else:
+            self.send_error(404)
+            return
+        
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "SpellerStubServer"
+
+class SpellerStubServer:
+    
+    MODES = ("ok", "error", "hang")
+    
+    def __init__(self, misspellings: Optional[Dict[str, List[str]]] = None, latency: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0, mode: str = "ok", error_status: int = 503,
+                 hang_timeout: float = 60.0):
+        self.misspellings = {k.lower(): v for k, v in (misspellings or DEFAULT_MISSPELLINGS).items()}
+        self.latency = latency
+        self.mode = mode
+        self.error_status = error_status
+        self.hang_timeout = hang_timeout
+        self._released = threading.Event()
+        self.requests = 0
+        self.texts = 0
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer((host, port), _SpellerHandler)
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/services/spellservice.json"
+    
+    def check(self, text: str) -> List[Dict]:
+        errors = []
+        for match in WORD_PATTERN.finditer(text):
+            suggestions = self.misspellings.get(match.group(0).lower())
+            if suggestions is not None:
+                errors.append({
+                    "code": 1,
+                    "pos": match.start(),
+                    "row": 0,
+                    "col": match.start(),
+                    "len": len(match.group(0)),
+                    "word": match.group(0),
+                    "s": suggestions
+                })
+        return errors
+    
+    def _record_request(self, texts: List[str]) -> None:
+        with self._lock:
+            self.requests += 1
+            self.texts += len(texts)
+    
+    def start(self) -> "SpellerStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._released.set()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def __enter__(self) -> "SpellerStubServer":
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Локальная заглушка сервиса проверки орфографии")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа в секундах")
+    parser.add_argument("--mode", choices=SpellerStubServer.MODES, default="ok",
+                        help="ok - обычные ответы, error - ответы 5xx, hang - зависание без ответа")
+    args = parser.parse_args()
+    
+    server = SpellerStubServer(latency=args.latency, host=args.host, port=args.port, mode=args.mode)
+    print(f"SPELLER_API_URL={server.url}", flush=True)
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+if __name__ == "__main__":
+    main()
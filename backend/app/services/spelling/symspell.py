@@ -0,0 +1,291 @@
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from app.services.spelling.backends import SpellingBackend
+from app.services.spelling.service import WORD_PATTERN
+
+MAGIC = b"SYMSPEL1"
+HEADER = struct.Struct("<8sIIQQQQQQ")
+
+def damerau_distance(source: str, target: str, max_distance: int) -> Optional[int]:
+    if source == target:
+        return 0
+    if abs(len(source) - len(target)) > max_distance:
+        return None
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_min = current[0]
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and source[i - 1] == target[j - 2]
+                    and source[i - 2] == target[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return None
+        previous_previous, previous = previous, current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+class _SymSpellLookup:
+
+    max_edit_distance: int
+    prefix_length: int
+
+    def word_count(self, word: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def delete_candidates(self, delete: str) -> List[str]:
+        raise NotImplementedError
+
+    def lookup(self, word: str, limit: int = 5) -> Optional[List[str]]:
+        if self.word_count(word) is not None:
+            return None
+
+        max_distance = self.max_edit_distance
+        input_prefix = word[:self.prefix_length]
+
+        queue = [input_prefix]
+        considered_deletes: Set[str] = {input_prefix}
+        considered_words: Set[str] = set()
+        found: Dict[str, Tuple[int, int]] = {}
+
+        position = 0
+        while position < len(queue):
+            candidate = queue[position]
+            position += 1
+
+            if len(input_prefix) - len(candidate) > max_distance:
+                break
+
+            for suggestion in self.delete_candidates(candidate):
+                if suggestion in considered_words:
+                    continue
+                considered_words.add(suggestion)
+
+                distance = damerau_distance(word, suggestion, max_distance)
+                if distance is not None:
+                    found[suggestion] = (distance, self.word_count(suggestion) or 0)
+
+            if len(input_prefix) - len(candidate) < max_distance:
+                for i in range(len(candidate)):
+                    delete = candidate[:i] + candidate[i + 1:]
+                    if delete not in considered_deletes:
+                        considered_deletes.add(delete)
+                        queue.append(delete)
+
+        ranked = sorted(found.items(), key=lambda item: (item[1][0], -item[1][1], item[0]))
+        return [suggestion for suggestion, _ in ranked[:limit]]
+
+    def _edits(self, word: str) -> Set[str]:
+        prefix = word[:self.prefix_length]
+        edits = {prefix}
+        frontier = {prefix}
+        for _ in range(self.max_edit_distance):
+            next_frontier = set()
+            for item in frontier:
+                for i in range(len(item)):
+                    delete = item[:i] + item[i + 1:]
+                    if delete not in edits:
+                        next_frontier.add(delete)
+            edits.update(next_frontier)
+            frontier = next_frontier
+        return edits
+
+class SymSpellIndex(_SymSpellLookup):
+
+    def __init__(self, max_edit_distance: int = 2, prefix_length: int = 7):
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.words: Dict[str, int] = {}
+        self.deletes: Dict[str, List[str]] = {}
+
+    def add_word(self, word: str, count: int = 1) -> None:
+        word = word.lower()
+        if word in self.words:
+            self.words[word] += count
+            return
+
+        self.words[word] = count
+        for delete in self._edits(word):
+            self.deletes.setdefault(delete, []).append(word)
+
+    def load_dictionary(self, path: Union[str, Path]) -> int:
+        loaded = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if not parts:
+                    continue
+                try:
+                    count = int(parts[1]) if len(parts) > 1 else 1
+                except ValueError:
+                    count = 1
+                self.add_word(parts[0], count)
+                loaded += 1
+        return loaded
+
+    def word_count(self, word: str) -> Optional[int]:
+        return self.words.get(word)
+
+    def delete_candidates(self, delete: str) -> List[str]:
+        return self.deletes.get(delete, [])
+
+    def save(self, path: Union[str, Path]) -> None:
+        words = sorted(self.words, key=lambda w: w.encode('utf-8'))
+        word_index = {word: i for i, word in enumerate(words)}
+        deletes = sorted(self.deletes, key=lambda d: d.encode('utf-8'))
+
+        words_data = bytearray()
+        words_offsets = array('Q')
+        for word in words:
+            words_offsets.append(len(words_data))
+            words_data += f"{word}\t{self.words[word]}\n".encode('utf-8')
+
+        deletes_data = bytearray()
+        deletes_offsets = array('Q')
+        for delete in deletes:
+            deletes_offsets.append(len(deletes_data))
+            indices = ",".join(str(word_index[word]) for word in self.deletes[delete])
+            deletes_data += f"{delete}\t{indices}\n".encode('utf-8')
+
+        def aligned(size: int) -> int:
+            return (size + 7) // 8 * 8
+
+        words_offsets_pos = aligned(HEADER.size)
+        deletes_offsets_pos = words_offsets_pos + len(words_offsets) * 8
+        words_data_pos = deletes_offsets_pos + len(deletes_offsets) * 8
+        deletes_data_pos = aligned(words_data_pos + len(words_data))
+
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(
+                MAGIC, self.max_edit_distance, self.prefix_length,
+                len(words), len(deletes),
+                words_offsets_pos, deletes_offsets_pos, words_data_pos, deletes_data_pos
+            ))
+            f.write(b"\0" * (words_offsets_pos - HEADER.size))
+            f.write(words_offsets.tobytes())
+            f.write(deletes_offsets.tobytes())
+            f.write(words_data)
+            f.write(b"\0" * (deletes_data_pos - words_data_pos - len(words_data)))
+            f.write(deletes_data)
+
+class MappedSymSpellIndex(_SymSpellLookup):
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, self.max_edit_distance, self.prefix_length, self.words_count, self.deletes_count,
+         words_offsets_pos, deletes_offsets_pos, words_data_pos, deletes_data_pos) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Файл не является индексом орфографии: {self.path}")
+
+        view = memoryview(self._map)
+        self._words_offsets = view[words_offsets_pos:words_offsets_pos + self.words_count * 8].cast('Q')
+        self._deletes_offsets = view[deletes_offsets_pos:deletes_offsets_pos + self.deletes_count * 8].cast('Q')
+        self._words_data_pos = words_data_pos
+        self._deletes_data_pos = deletes_data_pos
+
+    def _record(self, data_pos: int, offset: int) -> Tuple[bytes, bytes]:
+        start = data_pos + offset
+        end = self._map.find(b"\n", start)
+        key, _, value = self._map[start:end].partition(b"\t")
+        return key, value
+
+    def _search(self, offsets, data_pos: int, key: bytes) -> Optional[Tuple[int, bytes]]:
+        low, high = 0, len(offsets)
+        while low < high:
+            middle = (low + high) // 2
+            current, value = self._record(data_pos, offsets[middle])
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return middle, value
+        return None
+
+    def word_count(self, word: str) -> Optional[int]:
+        found = self._search(self._words_offsets, self._words_data_pos, word.encode('utf-8'))
+        return int(found[1]) if found else None
+
+    def delete_candidates(self, delete: str) -> List[str]:
+        found = self._search(self._deletes_offsets, self._deletes_data_pos, delete.encode('utf-8'))
+        if not found:
+            return []
+        return [
+            self._record(self._words_data_pos, self._words_offsets[int(index)])[0].decode('utf-8')
+            for index in found[1].split(b",")
+        ]
+
+    def close(self) -> None:
+        self._words_offsets.release()
+        self._deletes_offsets.release()
+        self._map.close()
+        self._file.close()
+
+class LocalSpellerBackend(SpellingBackend):
+
+    name = "local"
+    deterministic = True
+    max_batch_chars = 1_000_000
+    max_batch_texts = 100_000
+
+    def __init__(self, index: _SymSpellLookup, max_suggestions: int = 5):
+        self.index = index
+        self.max_suggestions = max_suggestions
+
+    def check_batch(self, texts: List[str]) -> List[List[Dict]]:
+        return [self._check_text(text) for text in texts]
+
+    def _check_text(self, text: str) -> List[Dict]:
+        errors = []
+        for match in WORD_PATTERN.finditer(text):
+            word = match.group(0)
+            if len(word) < 2 or word.isupper():
+                continue
+
+            suggestions = self.index.lookup(word.lower(), self.max_suggestions)
+            if suggestions is None:
+                continue
+
+            if word[0].isupper():
+                suggestions = [s[:1].upper() + s[1:] for s in suggestions]
+            errors.append({'word': word, 's': suggestions})
+        return errors
+
+    def close(self) -> None:
+        if isinstance(self.index, MappedSymSpellIndex):
+            self.index.close()
+
+def build_local_index(dictionaries: Iterable[Union[str, Path]], index_path: Optional[Union[str, Path]] = None,
+                      max_edit_distance: int = 2, prefix_length: int = 7) -> _SymSpellLookup:
+    if index_path and Path(index_path).exists():
+        return MappedSymSpellIndex(index_path)
+
+    index = SymSpellIndex(max_edit_distance=max_edit_distance, prefix_length=prefix_length)
+    loaded = 0
+    for dictionary in dictionaries:
+        loaded += index.load_dictionary(dictionary)
+
+    if not loaded:
+        raise ValueError("Для локальной проверки орфографии не заданы частотные словари")
+
+    if index_path:
+        Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+        index.save(index_path)
+        return MappedSymSpellIndex(index_path)
+
+    return index
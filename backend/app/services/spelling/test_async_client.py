@@ -0,0 +1,202 @@
+"""
+Тесты асинхронного клиента проверки орфографии
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun
+from app.services.dsl.yaml_parser import load_validation_engine_from_string
+from app.services.kernel.checks.spelling_check import SpellingCheck
+from app.services.kernel.validation_result import ValidationStatus
+from app.services.spelling import (
+    AsyncSpellingClient,
+    CircuitBreaker,
+    LocalSpellerBackend,
+    RateLimiter,
+    SpellingService,
+    YandexSpellerBackend,
+    build_local_index,
+    register_spelling_backend
+)
+from app.services.spelling.stub_server import SpellerStubServer
+
+
+def make_client(stub, backend_timeout=2.0, batch_texts=100, **kwargs):
+    backend = YandexSpellerBackend(api_url=stub.url, timeout=backend_timeout)
+    backend.max_batch_texts = batch_texts
+    return AsyncSpellingClient(SpellingService(backend), **kwargs)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAsyncSpellingClient:
+    """Тесты параллельных запросов, ограничений и размыкателя цепи"""
+
+    def test_batches_run_concurrently(self):
+        with SpellerStubServer(latency=0.2) as stub:
+            client = make_client(stub, batch_texts=1, concurrency=8)
+
+            started = time.perf_counter()
+            results = client.check_texts_sync(["превед раз", "два три", "четыре пять", "ошибко"])
+            elapsed = time.perf_counter() - started
+
+        assert stub.requests == 7
+        assert elapsed < 0.2 * 4
+        assert results[0] == [{'word': 'превед', 's': ['привет']}]
+        assert results[-1][0]['word'] == 'ошибко'
+
+    def test_concurrency_limit(self):
+        with SpellerStubServer(latency=0.1) as stub:
+            client = make_client(stub, batch_texts=1, concurrency=1)
+
+            started = time.perf_counter()
+            client.check_texts_sync(["раз два три"])
+            elapsed = time.perf_counter() - started
+
+        assert elapsed >= 0.3
+
+    def test_cached_words_skip_network(self):
+        with SpellerStubServer() as stub:
+            client = make_client(stub)
+            client.check_texts_sync(["превед мир"])
+            client.check_texts_sync(["мир превед"])
+
+        assert stub.requests == 1
+
+    def test_server_errors_mark_texts_skipped(self):
+        with SpellerStubServer(mode="error") as stub:
+            client = make_client(stub)
+            results = client.check_texts_sync(["превед", ""])
+
+        assert results == [None, []]
+        assert client.skipped == 1
+        assert "503" in client.last_error
+
+    def test_hang_is_cut_by_timeout(self):
+        with SpellerStubServer(mode="hang") as stub:
+            client = make_client(stub, backend_timeout=3.0, batch_texts=1, concurrency=4, timeout=0.2)
+
+            started = time.perf_counter()
+            results = client.check_texts_sync(["раз два три четыре"])
+            elapsed = time.perf_counter() - started
+
+        assert results == [None]
+        assert elapsed < 1.0
+
+    def test_breaker_opens_and_fails_fast(self):
+        with SpellerStubServer(mode="error") as stub:
+            client = make_client(stub, batch_texts=1, concurrency=1,
+                                 breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+            client.check_texts_sync(["раз два три четыре"])
+
+            assert client.breaker.state == CircuitBreaker.OPEN
+            assert stub.requests == 2
+
+            client.check_texts_sync(["пять"])
+            assert stub.requests == 2
+
+    def test_runs_inside_event_loop(self):
+        async def call_from_loop(client):
+            return client.check_texts_sync(["превед"])
+
+        with SpellerStubServer() as stub:
+            client = make_client(stub)
+            results = asyncio.run(call_from_loop(client))
+
+        assert results == [[{'word': 'превед', 's': ['привет']}]]
+
+
+class TestCircuitBreaker:
+    """Тесты состояний размыкателя цепи"""
+
+    def test_half_open_allows_single_trial(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestRateLimiter:
+    """Тесты ограничения частоты запросов"""
+
+    def test_requests_spread_over_time(self):
+        limiter = RateLimiter(rate=20, burst=1)
+
+        async def acquire_all():
+            for _ in range(5):
+                await limiter.acquire()
+
+        started = time.perf_counter()
+        asyncio.run(acquire_all())
+
+        assert time.perf_counter() - started >= 0.15
+
+
+class TestSpellingCheckSkipped:
+    """Тесты статуса пропущенной проверки"""
+
+    def test_unavailable_service_reports_skipped(self):
+        with SpellerStubServer(mode="error") as stub:
+            register_spelling_backend(
+                'stub_error', lambda s: YandexSpellerBackend(api_url=stub.url, timeout=1)
+            )
+            check = SpellingCheck("spelling", {'backend': 'stub_error'}, "warning", "all")
+            block = Paragraph(text="превед", runs=[TextRun(text="превед")])
+
+            result = check.validate(Slide(page_number=1, width=960, height=540, blocks=[block]))
+
+        assert result.status == ValidationStatus.SKIPPED
+        assert "пропущена" in result.message
+
+    def test_missing_dictionary_reports_skipped(self, tmp_path):
+        register_spelling_backend(
+            'missing_dictionary',
+            lambda s: LocalSpellerBackend(build_local_index([tmp_path / "missing.txt"])),
+            deterministic=True
+        )
+        engine = load_validation_engine_from_string(
+            "rules:\n  - rule: {name: s, check: spelling, params: {backend: missing_dictionary}, severity: info}\n"
+        )
+        block = Paragraph(text="превед", runs=[TextRun(text="превед")])
+
+        assert engine.deterministic
+        results = engine.validate(Presentation(
+            file_path="deck.pdf", slides=[Slide(page_number=1, width=960, height=540, blocks=[block])]
+        ))
+
+        assert results[0].status == ValidationStatus.SKIPPED
+        assert "не настроен" in results[0].message
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
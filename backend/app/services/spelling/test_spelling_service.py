@@ -0,0 +1,75 @@
+"""
+Тесты сервиса проверки орфографии
+"""
+
+import pytest
+
+from app.services.spelling import (
+    SpellingService,
+    SqliteVerdictStore,
+    WordVerdictCache,
+    YandexSpellerBackend
+)
+from app.services.spelling.stub_server import SpellerStubServer
+
+
+@pytest.fixture
+def stub():
+    with SpellerStubServer() as server:
+        yield server
+
+
+def make_service(stub, **kwargs):
+    return SpellingService(YandexSpellerBackend(api_url=stub.url, timeout=2), **kwargs)
+
+
+class TestSpellingService:
+    """Тесты пакетной проверки и кэширования"""
+
+    def test_errors_returned_per_text(self, stub):
+        service = make_service(stub)
+
+        results = service.check_texts(["Превед, мир", "Всё верно", "превед и ошибко"])
+
+        assert results[0] == [{'word': 'Превед', 's': ['привет']}]
+        assert results[1] == []
+        assert [e['word'] for e in results[2]] == ['превед', 'ошибко']
+
+    def test_all_texts_checked_in_one_request(self, stub):
+        service = make_service(stub)
+
+        service.check_texts([f"Слайд номер {i} текст" for i in range(50)])
+
+        assert stub.requests == 1
+
+    def test_repeated_words_served_from_cache(self, stub):
+        service = make_service(stub)
+
+        service.check_texts(["Конфиденциально. Превед"])
+        service.check_texts(["Конфиденциально. Превед"])
+
+        assert stub.requests == 1
+        assert service.cache.stats()["hits"] == 2
+
+    def test_batches_respect_size_limit(self, stub):
+        backend = YandexSpellerBackend(api_url=stub.url, timeout=2)
+        backend.max_batch_texts = 10
+        service = SpellingService(backend)
+
+        service.check_texts([" ".join(f"слово{chr(1072 + i)}" for i in range(25))])
+
+        assert stub.requests == 3
+
+    def test_persistent_store(self, stub, tmp_path):
+        store = SqliteVerdictStore(tmp_path / "spelling.sqlite", namespace="yandex")
+        make_service(stub, store=store).check_texts(["превед мир"])
+
+        service = make_service(stub, cache=WordVerdictCache(), store=store)
+        results = service.check_texts(["превед мир"])
+
+        assert stub.requests == 1
+        assert results == [[{'word': 'превед', 's': ['привет']}]]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,101 @@
+"""
+Тесты локальной проверки орфографии по словарю
+"""
+
+import pytest
+
+from app.services.spelling import (
+    LocalSpellerBackend,
+    MappedSymSpellIndex,
+    SpellingService,
+    SymSpellIndex,
+    build_local_index
+)
+from app.services.spelling.symspell import damerau_distance
+
+
+DICTIONARY = """привет 500
+мир 400
+презентация 300
+слайд 250
+слава 20
+проверка 200
+ошибка 150
+hello 100
+world 90
+"""
+
+
+@pytest.fixture
+def dictionary_path(tmp_path):
+    path = tmp_path / "frequency.txt"
+    path.write_text(DICTIONARY, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def index(dictionary_path):
+    index = SymSpellIndex(max_edit_distance=2)
+    index.load_dictionary(dictionary_path)
+    return index
+
+
+class TestSymSpellIndex:
+    """Тесты индекса удалений"""
+
+    def test_known_word_is_correct(self, index):
+        assert index.lookup("привет") is None
+
+    def test_suggestions_ranked_by_distance_and_frequency(self, index):
+        assert index.lookup("слад")[0] == "слайд"
+        assert index.lookup("ошибко") == ["ошибка"]
+        assert index.lookup("helo") == ["hello"]
+
+    def test_transposition_counts_as_one_edit(self):
+        assert damerau_distance("првиет", "привет", 2) == 1
+        assert damerau_distance("абв", "где", 2) is None
+
+    def test_unknown_word_without_candidates(self, index):
+        assert index.lookup("абракадабра") == []
+
+    def test_mapped_index_matches_memory(self, index, tmp_path):
+        path = tmp_path / "index.bin"
+        index.save(path)
+
+        mapped = MappedSymSpellIndex(path)
+        try:
+            for word in ["привет", "слад", "ошибко", "презинтация", "wrold", "абракадабра"]:
+                assert mapped.lookup(word) == index.lookup(word)
+        finally:
+            mapped.close()
+
+    def test_build_reuses_saved_index(self, dictionary_path, tmp_path):
+        path = tmp_path / "index.bin"
+
+        built = build_local_index([dictionary_path], index_path=path)
+        built.close()
+        reopened = build_local_index([], index_path=path)
+
+        assert isinstance(reopened, MappedSymSpellIndex)
+        assert reopened.lookup("мир") is None
+        reopened.close()
+
+    def test_build_without_dictionaries_fails(self):
+        with pytest.raises(ValueError):
+            build_local_index([])
+
+
+class TestLocalSpellerBackend:
+    """Тесты локального сервиса в формате ответа проверки"""
+
+    def test_errors_in_speller_format(self, index):
+        service = SpellingService(LocalSpellerBackend(index))
+
+        results = service.check_texts(["Превед, мир", "Проверка слайда NASA"])
+
+        assert results[0] == [{'word': 'Превед', 's': ['Привет']}]
+        assert [e['word'] for e in results[1]] == ['слайда']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,108 @@
+"""
+Тесты пакетной проверки презентаций
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.batch_service import BatchFile, run_batch
+from app.services.pipeline_executor import PipelineExecutor
+from app.services.result_cache import ResultCache
+from benchmarks.pdf_fixtures import build_pdf
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 3}
+      severity: error
+"""
+
+
+async def collect(executor, files, concurrency=None, cache=None):
+    return [item async for item in run_batch(executor, files, RULES, "rules.yaml", concurrency, cache)]
+
+
+class TestBatchService:
+    """Тесты потоковой выдачи результатов и сводки по правилам"""
+
+    def test_results_and_summary(self, tmp_path):
+        files = []
+        for index, slides in enumerate([2, 5, 3]):
+            path = tmp_path / f"deck{index}.pdf"
+            path.write_bytes(build_pdf(slides, seed=index))
+            files.append(BatchFile(path.name, path, sha256=str(index)))
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+        files.append(BatchFile(broken.name, broken))
+        files.append(BatchFile("notes.txt", error="Файл презентации должен быть в формате PDF"))
+
+        items = asyncio.run(collect(PipelineExecutor(workers=0), files, concurrency=2))
+
+        assert [item["type"] for item in items] == ["file"] * 5 + ["summary"]
+        by_name = {item["filename"]: item for item in items[:-1]}
+        assert by_name["deck0.pdf"]["status"] == "success"
+        assert by_name["deck1.pdf"]["status"] == "failed"
+        assert by_name["broken.pdf"]["status"] == "error"
+        assert "PDF" in by_name["notes.txt"]["error"]
+
+        summary = items[-1]
+        assert summary["files"] == 5
+        assert (summary["succeeded"], summary["failed"], summary["errors"]) == (2, 1, 2)
+        assert summary["rules"] == [{
+            "rule_name": "Количество слайдов",
+            "severity": "error",
+            "passed": 2,
+            "failed": 1,
+            "skipped": 0,
+            "failed_files": ["deck1.pdf"]
+        }]
+
+    def test_repeated_files_use_result_cache(self, tmp_path):
+        path = tmp_path / "deck.pdf"
+        path.write_bytes(build_pdf(2))
+        files = [BatchFile(path.name, path, sha256="same")]
+        cache = ResultCache()
+        executor = PipelineExecutor(workers=0)
+
+        first = asyncio.run(collect(executor, files, cache=cache))
+        second = asyncio.run(collect(executor, files, cache=cache))
+
+        assert first[0]["cache"] == "miss"
+        assert second[0]["cache"] == "hit"
+        assert second[0]["detailed_results"] == first[0]["detailed_results"]
+        assert second[-1]["succeeded"] == 1
+
+    def test_files_wait_for_executor_slots(self, tmp_path):
+        files = []
+        for index in range(4):
+            path = tmp_path / f"deck{index}.pdf"
+            path.write_bytes(build_pdf(2, seed=index))
+            files.append(BatchFile(path.name, path))
+        executor = PipelineExecutor(workers=0, queue_limit=1)
+        original = executor.run
+        observed = []
+
+        async def run(*args, **kwargs):
+            observed.append(executor.in_flight)
+            return await original(*args, **kwargs)
+
+        executor.run = run
+        items = asyncio.run(collect(executor, files, concurrency=4))
+
+        assert max(observed) <= executor.capacity
+        assert executor.in_flight == 0
+        assert items[-1]["succeeded"] == 4
+        assert executor.rejected == 0
+
+    def test_empty_batch(self):
+        items = asyncio.run(collect(PipelineExecutor(workers=0), []))
+
+        assert items == [{**items[0], "type": "summary", "files": 0, "rules": []}]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,120 @@
+"""
+Тесты выполнения проверки вне цикла событий
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.metrics import STAGES
+from app.services.dsl import get_engine_cache
+from app.services import pipeline_executor
+from app.services.pipeline_executor import PipelineExecutor, PipelineSaturatedError, run_pipeline
+from app.services.profile_service import RuleProfileStore
+from benchmarks.pdf_fixtures import build_pdf
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 3}
+      severity: error
+"""
+
+
+class TestPipelineExecutor:
+    """Тесты допуска запросов и выполнения конвейера"""
+
+    def test_admission_limit(self):
+        executor = PipelineExecutor(workers=1, queue_limit=1, retry_after=7)
+
+        executor.admit()
+        executor.admit()
+        with pytest.raises(PipelineSaturatedError) as error:
+            executor.admit()
+
+        assert error.value.retry_after == 7
+        assert executor.stats()["rejected"] == 1
+
+        executor.release()
+        executor.admit()
+        assert executor.stats()["in_flight"] == 2
+
+    def test_runs_pipeline_in_thread_pool(self, tmp_path):
+        executor = PipelineExecutor(workers=0)
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(5))
+
+        result = asyncio.run(executor.run(pdf_path, RULES, "deck.pdf", "rules.yaml"))
+
+        assert result["presentation"]["total_slides"] == 5
+        assert result["validation"]["failed"] == 1
+        assert set(result["timing"]["stages"]) == set(STAGES)
+        assert "SlidesCountCheck" in result["timing"]["checks"]
+
+    def test_event_loop_stays_responsive(self, tmp_path):
+        executor = PipelineExecutor(workers=0)
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(20))
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            task = asyncio.create_task(ticker())
+            await executor.run(pdf_path, RULES, "deck.pdf", "rules.yaml")
+            task.cancel()
+
+        asyncio.run(scenario())
+
+        assert len(ticks) > 5
+
+    def test_pipeline_errors_propagate(self, tmp_path):
+        executor = PipelineExecutor(workers=0)
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(b"not a pdf")
+
+        with pytest.raises(Exception):
+            asyncio.run(executor.run(pdf_path, RULES, "deck.pdf", "rules.yaml"))
+
+    def test_worker_cache_counters_are_aggregated(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(2))
+        rules = RULES.replace("max: 3", "max: 4")
+        get_engine_cache().clear()
+
+        first = run_pipeline(str(pdf_path), rules, "deck.pdf", "rules.yaml", report_caches=True)
+        second = run_pipeline(str(pdf_path), rules, "deck.pdf", "rules.yaml", report_caches=True)
+
+        assert first["cache_counters"]["engines"] == (0, 1)
+        assert second["cache_counters"]["engines"] == (1, 0)
+
+        executor = PipelineExecutor(workers=0)
+        executor._record_worker_caches(first.pop("cache_counters"))
+        executor._record_worker_caches(second.pop("cache_counters"))
+
+        assert executor.worker_cache_stats()["engines"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+        engines = get_engine_cache().stats()
+        assert executor.cache_counters()["engines"] == (engines["hits"] + 1, engines["misses"] + 1)
+
+    def test_worker_initializer_warms_profiles(self, tmp_path, monkeypatch):
+        RuleProfileStore(tmp_path / "profiles").create_version("corporate", RULES, "rules.yaml")
+        monkeypatch.setattr(pipeline_executor, "get_profile_store",
+                            lambda: RuleProfileStore(tmp_path / "profiles", get_engine_cache()))
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(2))
+        get_engine_cache().clear()
+
+        pipeline_executor._init_worker()
+        result = run_pipeline(str(pdf_path), RULES, "deck.pdf", "corporate@v1", report_caches=True)
+
+        assert result["cache_counters"]["engines"] == (1, 0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,71 @@
+"""
+Тесты хранилища профилей правил
+"""
+
+import pytest
+
+from app.services.dsl import DSLParseError
+from app.services.profile_service import RuleProfileStore, ProfileError, ProfileNotFoundError
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      check: slides_count
+      params:
+        min: 5
+      severity: error
+"""
+
+
+class TestRuleProfileStore:
+    """Тесты версионирования и загрузки профилей"""
+
+    def test_create_and_get_engine(self, tmp_path):
+        store = RuleProfileStore(tmp_path)
+
+        profile = store.create_version("corporate", RULES, "rules.yaml")
+        loaded, engine = store.get_engine("corporate")
+
+        assert profile.version == 1
+        assert loaded == profile
+        assert len(engine.presentation_checks) == 1
+
+    def test_same_content_does_not_create_version(self, tmp_path):
+        store = RuleProfileStore(tmp_path)
+
+        first = store.create_version("corporate", RULES, "rules.yaml")
+        second = store.create_version("corporate", RULES, "rules.yaml")
+        third = store.create_version("corporate", RULES.replace("min: 5", "min: 7"), "rules.yaml")
+
+        assert first == second
+        assert third.version == 2
+        assert store.get_source("corporate", 1) == RULES
+        assert [p.version for p in store.list_versions("corporate")] == [1, 2]
+
+    def test_warm_loads_profiles_from_disk(self, tmp_path):
+        RuleProfileStore(tmp_path).create_version("corporate", RULES, "rules.yaml")
+
+        store = RuleProfileStore(tmp_path)
+
+        assert store.warm() == 1
+        assert ("corporate", 1) in store._engines
+
+    def test_invalid_rules_are_rejected(self, tmp_path):
+        store = RuleProfileStore(tmp_path)
+
+        with pytest.raises(DSLParseError):
+            store.create_version("corporate", "rules: {}", "rules.yaml")
+
+        with pytest.raises(ProfileNotFoundError):
+            store.get("corporate")
+
+    def test_invalid_profile_id(self, tmp_path):
+        store = RuleProfileStore(tmp_path)
+
+        with pytest.raises(ProfileError):
+            store.create_version("../etc", RULES, "rules.yaml")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
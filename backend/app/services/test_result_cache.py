@@ -0,0 +1,128 @@
+"""
+Тесты кэша результатов проверки
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.dsl import load_validation_engine_from_string
+from app.services.file_service import FileService
+from app.services.pipeline_executor import PipelineExecutor
+from app.services.result_cache import ResultCache, etag_matches, result_cache_key
+from benchmarks.pdf_fixtures import build_pdf
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 3}
+      severity: error
+"""
+
+SPELLING_RULES = RULES + """
+  - rule:
+      name: "Орфография"
+      level: slide
+      check: spelling
+      params: {backend: yandex}
+      severity: warning
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def response(status="success"):
+    return {"status": status, "validation": {"failed": 0}, "detailed_results": []}
+
+
+class TestResultCache:
+    """Тесты хранения, вытеснения и срока жизни результатов"""
+
+    def test_key_depends_on_all_inputs(self):
+        key = result_cache_key("pdf", "rules", "deck.pdf", "rules.yaml", version="1")
+
+        assert key == result_cache_key("pdf", "rules", "deck.pdf", "rules.yaml", version="1")
+        assert key != result_cache_key("pdf2", "rules", "deck.pdf", "rules.yaml", version="1")
+        assert key != result_cache_key("pdf", "rules2", "deck.pdf", "rules.yaml", version="1")
+        assert key != result_cache_key("pdf", "rules", "deck.pdf", "rules.yaml", version="2")
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        cache.put("a", response())
+        cache.put("b", response())
+        cache.get("a")
+        cache.put("c", response())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["size"] == 2
+
+    def test_nondeterministic_results_expire_sooner(self):
+        clock = FakeClock()
+        cache = ResultCache(ttl=100, nondeterministic_ttl=10, clock=clock)
+        cache.put("stable", response())
+        cache.put("remote", response(), deterministic=False)
+
+        clock.now += 50
+        assert cache.get("stable") is not None
+        assert cache.get("remote") is None
+
+        clock.now += 60
+        assert cache.get("stable") is None
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        first = ResultCache(directory=tmp_path)
+        stored = first.put("key", response("failed"))
+
+        second = ResultCache(directory=tmp_path)
+        loaded = second.get("key")
+
+        assert loaded.response == response("failed")
+        assert loaded.etag == stored.etag
+        assert second.stats()["disk_hits"] == 1
+
+    def test_etag(self):
+        cache = ResultCache()
+        etag = cache.put("key", response()).etag
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag != cache.put("other", response("failed")).etag
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+    def test_etag_survives_recomputation(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(5))
+        executor = PipelineExecutor(workers=0)
+        cache = ResultCache()
+
+        def compute():
+            result = asyncio.run(executor.run(pdf_path, RULES, "deck.pdf", "rules.yaml"))
+            return cache.put("key", FileService.to_response(result))
+
+        first = compute()
+        cache.clear()
+        second = compute()
+
+        assert first.response["timing"] != second.response["timing"]
+        assert first.etag == second.etag
+
+    def test_engine_determinism(self):
+        assert load_validation_engine_from_string(RULES).deterministic
+        assert not load_validation_engine_from_string(SPELLING_RULES).deterministic
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,105 @@
+"""
+Тесты потоковой загрузки файлов и ограничения размера запроса
+"""
+
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.web.middleware import BodySizeLimitMiddleware
+from app.services.uploads import UploadTooLargeError, read_upload_text, save_upload
+
+
+def make_upload(content: bytes, filename: str = "deck.pdf") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+async def call_app(app, chunks, headers=()):
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": list(headers)}
+    await app(scope, receive, send)
+    return sent
+
+
+async def echo_app(scope, receive, send):
+    size = 0
+    while True:
+        message = await receive()
+        size += len(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(size).encode()})
+
+
+class TestUploads:
+    """Тесты сохранения загруженных файлов"""
+
+    def test_save_upload_hashes_content(self, tmp_path):
+        content = b"%PDF" + b"x" * (3 * 1024 * 1024)
+
+        stored = asyncio.run(save_upload(make_upload(content), tmp_path, max_bytes=10 * 1024 * 1024, suffix=".pdf"))
+
+        assert stored.size == len(content)
+        assert stored.sha256 == hashlib.sha256(content).hexdigest()
+        assert stored.path.read_bytes() == content
+        assert stored.path.suffix == ".pdf"
+
+    def test_save_upload_over_limit_removes_file(self, tmp_path):
+        content = b"x" * (2 * 1024 * 1024 + 1)
+
+        with pytest.raises(UploadTooLargeError):
+            asyncio.run(save_upload(make_upload(content), tmp_path, max_bytes=2 * 1024 * 1024))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_read_upload_text(self):
+        text, digest = asyncio.run(read_upload_text(make_upload("правила".encode()), max_bytes=1024))
+
+        assert text == "правила"
+        assert digest == hashlib.sha256("правила".encode()).hexdigest()
+
+        with pytest.raises(UploadTooLargeError):
+            asyncio.run(read_upload_text(make_upload(b"x" * 2048), max_bytes=1024))
+
+
+class TestBodySizeLimitMiddleware:
+    """Тесты отклонения слишком больших запросов"""
+
+    def test_declared_length_rejected(self):
+        app = BodySizeLimitMiddleware(echo_app, max_bytes=10)
+
+        sent = asyncio.run(call_app(app, [b"x" * 5], headers=[(b"content-length", b"100")]))
+
+        assert sent[0]["status"] == 413
+
+    def test_streamed_body_rejected(self):
+        app = BodySizeLimitMiddleware(echo_app, max_bytes=10)
+
+        sent = asyncio.run(call_app(app, [b"x" * 6, b"x" * 6]))
+
+        assert sent[0]["status"] == 413
+
+    def test_small_body_passes(self):
+        app = BodySizeLimitMiddleware(echo_app, max_bytes=10)
+
+        sent = asyncio.run(call_app(app, [b"x" * 4, b"x" * 4]))
+
+        assert sent[0]["status"] == 200
+        assert sent[1]["body"] == b"8"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,70 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Tuple
+
+from app.core.metrics import UPLOAD_BYTES
+
+if TYPE_CHECKING:
+    from fastapi import UploadFile
+
+CHUNK_SIZE = 1024 * 1024
+
+class UploadTooLargeError(Exception):
+
+    def __init__(self, kind: str, max_bytes: int):
+        super().__init__(f"{kind} превышает лимит {max_bytes // (1024 * 1024)} МБ")
+        self.max_bytes = max_bytes
+
+@dataclass(frozen=True)
+class StoredUpload:
+    path: Path
+    filename: str
+    size: int
+    sha256: str
+
+async def save_upload(upload: "UploadFile", directory: Path, max_bytes: int,
+                      kind: str = "Файл", suffix: str = "") -> StoredUpload:
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=directory, suffix=suffix)
+    path = Path(name)
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as target:
+            while True:
+                chunk = await upload.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise UploadTooLargeError(kind, max_bytes)
+                digest.update(chunk)
+                await asyncio.to_thread(target.write, chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+    UPLOAD_BYTES.observe(size)
+    return StoredUpload(path=path, filename=upload.filename, size=size, sha256=digest.hexdigest())
+
+async def read_upload_text(upload: "UploadFile", max_bytes: int, kind: str = "Файл") -> Tuple[str, str]:
+    digest = hashlib.sha256()
+    chunks = []
+    size = 0
+
+    while True:
+        chunk = await upload.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if max_bytes and size > max_bytes:
+            raise UploadTooLargeError(kind, max_bytes)
+        digest.update(chunk)
+        chunks.append(chunk)
+
+    return b"".join(chunks).decode("utf-8"), digest.hexdigest()
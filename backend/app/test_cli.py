@@ -0,0 +1,134 @@
+"""
+Тесты пакетной проверки из командной строки
+"""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from app.cli import (
+    CliError, Deck, EXIT_ERROR, EXIT_OK, EXIT_VIOLATIONS, MIN_WORKER_MEMORY_MB, default_memory_limit, discover,
+    exit_code, file_sha256, lint, main, to_junit, to_sarif
+)
+from app.services.result_cache import ResultCache
+from benchmarks.pdf_fixtures import build_pdf
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 4}
+      severity: error
+"""
+
+
+@pytest.fixture
+def decks_dir(tmp_path):
+    decks = tmp_path / "decks"
+    (decks / "nested").mkdir(parents=True)
+    (decks / "short.pdf").write_bytes(build_pdf(3))
+    (decks / "nested" / "long.pdf").write_bytes(build_pdf(6))
+    (decks / "notes.txt").write_text("не презентация", encoding="utf-8")
+    return decks
+
+
+def make_decks(paths):
+    return [Deck(index=i, path=p, filename=p.name, sha256=file_sha256(p)) for i, p in enumerate(paths)]
+
+
+def run(decks, **kwargs):
+    items = list(lint(decks, RULES, "rules.yaml", **kwargs))
+    return items[:-1], items[-1]
+
+
+class TestCli:
+    """Тесты поиска файлов, отчетов и кодов выхода"""
+
+    def test_discover_directories_and_globs(self, decks_dir):
+        found = discover([str(decks_dir), str(decks_dir / "*.pdf")])
+
+        assert sorted(path.name for path in found) == ["long.pdf", "short.pdf"]
+        with pytest.raises(CliError):
+            discover([str(decks_dir / "missing-*.pdf")])
+
+    def test_lint_reports_files_and_summary(self, decks_dir):
+        files, summary = run(make_decks(discover([str(decks_dir)])))
+
+        assert {item["filename"]: item["status"] for item in files} == {"long.pdf": "failed", "short.pdf": "success"}
+        assert summary["type"] == "summary"
+        assert (summary["succeeded"], summary["failed"], summary["errors"]) == (1, 1, 0)
+        assert exit_code(files, "error") == EXIT_VIOLATIONS
+        assert exit_code(files, "never") == EXIT_OK
+
+    def test_broken_pdf_is_an_error(self, tmp_path):
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        files, summary = run(make_decks([broken]))
+
+        assert files[0]["status"] == "error"
+        assert summary["errors"] == 1
+        assert exit_code(files, "never") == EXIT_ERROR
+
+    def test_changed_since_skips_cached_decks(self, decks_dir, tmp_path):
+        cache = ResultCache(maxsize=0, directory=tmp_path / "cache")
+        decks = make_decks(discover([str(decks_dir)]))
+        run(decks, cache=cache)
+
+        (decks_dir / "short.pdf").write_bytes(build_pdf(2))
+        files, summary = run(make_decks(discover([str(decks_dir)])), cache=cache, changed_since=True)
+
+        statuses = {item["filename"]: item["status"] for item in files}
+        assert statuses == {"long.pdf": "unchanged", "short.pdf": "success"}
+        assert summary["unchanged"] == 1
+        assert summary["files"] == 1
+
+    def test_cached_result_is_reused_for_renamed_file(self, decks_dir, tmp_path):
+        cache = ResultCache(maxsize=0, directory=tmp_path / "cache")
+        run(make_decks([decks_dir / "short.pdf"]), cache=cache)
+        renamed = decks_dir / "renamed.pdf"
+        renamed.write_bytes((decks_dir / "short.pdf").read_bytes())
+
+        files, _ = run(make_decks([renamed]), cache=cache)
+
+        assert files[0]["cache"] == "hit"
+        assert files[0]["files"]["pdf_filename"] == "renamed.pdf"
+
+    def test_junit_and_sarif(self, decks_dir):
+        files, summary = run(make_decks(discover([str(decks_dir)])))
+        files.append({"type": "file", "index": 2, "filename": "broken.pdf", "sha256": None,
+                      "status": "error", "error": "Ошибка извлечения из PDF"})
+
+        suites = ET.fromstring(to_junit(files, summary))
+        assert (suites.get("tests"), suites.get("failures"), suites.get("errors")) == ("3", "1", "1")
+
+        sarif = json.loads(to_sarif(files, {**summary, "errors": 1}))
+        run_report = sarif["runs"][0]
+        assert sarif["version"] == "2.1.0"
+        assert [result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+                for result in run_report["results"]] == ["long.pdf"]
+        assert run_report["invocations"][0]["executionSuccessful"] is False
+
+    def test_default_memory_limit_splits_ram_between_workers(self):
+        single = default_memory_limit(1)
+
+        assert single >= MIN_WORKER_MEMORY_MB
+        assert default_memory_limit(4) == max(MIN_WORKER_MEMORY_MB, single // 4)
+        assert default_memory_limit(10 ** 6) == MIN_WORKER_MEMORY_MB
+
+    def test_main_writes_report(self, decks_dir, tmp_path, capsys):
+        rules = tmp_path / "rules.yaml"
+        rules.write_text(RULES, encoding="utf-8")
+        output = tmp_path / "report.jsonl"
+
+        code = main([str(decks_dir), "--rules", str(rules), "--workers", "0", "--output", str(output)])
+
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert code == EXIT_VIOLATIONS
+        assert [line["type"] for line in lines] == ["file", "file", "summary"]
+
+        assert main([str(decks_dir)]) == EXIT_ERROR
+        assert "--rules" in capsys.readouterr().err
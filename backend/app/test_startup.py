@@ -0,0 +1,47 @@
+"""
+Тесты времени холодного старта приложения и командной строки
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = ("pdfplumber", "pdfminer", "requests", "httpx", "app.services.kernel.checks.spelling_check")
+
+
+def import_profile(module, tmp_path):
+    env = {**os.environ, "UPLOAD_DIR": str(tmp_path)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total) / 1e6
+    return cumulative
+
+
+class TestColdStart:
+    """Тесты ленивой загрузки тяжелых модулей"""
+
+    @pytest.mark.parametrize("module, budget", [("app.main", 1.5), ("app.cli", 0.75)])
+    def test_import_budget(self, module, budget, tmp_path):
+        cumulative = import_profile(module, tmp_path)
+
+        assert cumulative[module] < budget
+        assert not [name for name in cumulative if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES]
+
+    def test_checks_are_imported_on_first_use(self, tmp_path):
+        cumulative = import_profile("app.services.dsl", tmp_path)
+
+        assert not [name for name in cumulative if name.startswith("app.services.kernel.checks.")]
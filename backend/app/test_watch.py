@@ -0,0 +1,101 @@
+"""
+Тесты режима наблюдения за презентациями
+"""
+
+from app.services.dsl import load_validation_engine_from_string
+from app.watch import DirectoryWatcher, WatchSession, format_report
+from benchmarks.pdf_fixtures import build_pages, write_pages
+
+RULES = """
+rules:
+  - rule:
+      name: "Количество слайдов"
+      level: presentation
+      check: slides_count
+      params: {min: 1, max: 5}
+      severity: error
+  - rule:
+      name: "Шрифт"
+      level: slide
+      check: font_min_size
+      params: {min: 12}
+      severity: warning
+"""
+
+
+def enlarge_fonts(items):
+    return [(x, y, max(size, 12), font, text) for x, y, size, font, text in items]
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDirectoryWatcher:
+    """Тесты обнаружения и устранения дребезга изменений"""
+
+    def test_reports_file_once_it_settles(self, tmp_path):
+        clock = FakeClock()
+        watcher = DirectoryWatcher(tmp_path, debounce=0.5, clock=clock)
+        deck = tmp_path / "deck.pdf"
+        deck.write_bytes(b"%PDF-1.4 partial")
+        (tmp_path / "notes.txt").write_text("-", encoding="utf-8")
+
+        assert watcher.poll() == ([], [])
+        clock.now = 0.3
+        deck.write_bytes(b"%PDF-1.4 partial, still writing")
+        assert watcher.poll() == ([], [])
+        clock.now = 0.6
+        assert watcher.poll() == ([], [])
+        clock.now = 0.9
+        assert watcher.poll() == ([deck], [])
+        clock.now = 2.0
+        assert watcher.poll() == ([], [])
+
+        deck.unlink()
+        assert watcher.poll() == ([], [deck])
+
+
+class TestWatchSession:
+    """Тесты инкрементальной перепроверки и разницы нарушений"""
+
+    def test_reports_new_and_resolved_violations(self, tmp_path):
+        session = WatchSession(load_validation_engine_from_string(RULES))
+        pages = build_pages(4)
+        deck = tmp_path / "deck.pdf"
+        deck.write_bytes(write_pages(pages))
+
+        first = session.update(deck)
+        assert (first.extracted, first.revalidated) == (4, 4)
+        assert len(first.added) == 4 and not first.resolved
+
+        pages[1] = enlarge_fonts(pages[1])
+        deck.write_bytes(write_pages(pages))
+        fixed = session.update(deck)
+
+        assert (fixed.extracted, fixed.revalidated) == (1, 1)
+        assert fixed.added == []
+        assert [violation.message for violation in fixed.resolved] == [first.added[1].message]
+        assert fixed.totals == {"warning": 3}
+        assert "- [WARNING] Шрифт: Слайд 2" in format_report(fixed)
+
+    def test_inserted_slide_does_not_repeat_shifted_violations(self, tmp_path):
+        session = WatchSession(load_validation_engine_from_string(RULES))
+        pages = build_pages(5)
+        deck = tmp_path / "deck.pdf"
+        deck.write_bytes(write_pages(pages[:2] + pages[3:]))
+        session.update(deck)
+
+        deck.write_bytes(write_pages(pages))
+        report = session.update(deck)
+
+        assert report.extracted == 1
+        assert [violation.message for violation in report.added] == [
+            "Слайд 3: найдены шрифты меньше 12pt, минимальный 10.0pt"
+        ]
+        assert report.resolved == []
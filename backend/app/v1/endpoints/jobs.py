@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.responses import JSONResponse
+from app.core.config import get_settings
+from app.core.web.models.models import ProcessingResponse, UploadResponse
+from app.services.dsl import DSLParseError
+from app.services.jobs import get_job_service, JobNotFoundError, JobNotReadyError, JobQueueFullError
+from app.services.profile_service import get_profile_store, ProfileError, ProfileNotFoundError
+from app.services.uploads import read_upload_text, save_upload, UploadTooLargeError
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.post("", status_code=202, response_model=UploadResponse)
+async def create_job(
+    pdf_file: UploadFile = File(..., description="PDF-файл презентации"),
+    yaml_file: Optional[UploadFile] = File(None, description="YAML-файл с правилами DSL"),
+    profile_id: Optional[str] = Form(None, description="Идентификатор сохраненного профиля правил"),
+    profile_version: Optional[int] = Form(None, description="Версия профиля правил (по умолчанию последняя)")
+) -> UploadResponse:
+    if not pdf_file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Файл презентации должен быть в формате PDF")
+    
+    settings = get_settings()
+    
+    if (yaml_file is None) == (profile_id is None):
+        raise HTTPException(status_code=400, detail="Необходимо передать либо YAML-файл с правилами, либо profile_id")
+    
+    yaml_content = None
+    if yaml_file is not None:
+        if not yaml_file.filename.lower().endswith((".yaml", ".yml")):
+            raise HTTPException(status_code=400, detail="Файл правил должен быть в формате YAML (.yaml или .yml)")
+        try:
+            yaml_content, _ = await read_upload_text(yaml_file, settings.max_rules_bytes, "Файл правил")
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Файл правил должен быть в кодировке UTF-8")
+        rules_name = yaml_file.filename
+    else:
+        try:
+            profile = await asyncio.to_thread(get_profile_store().get, profile_id, profile_version)
+        except ProfileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ProfileError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        profile_version = profile.version
+        rules_name = f"{profile.profile_id}@v{profile.version}"
+    
+    upload = None
+    try:
+        upload = await save_upload(
+            pdf_file, settings.upload_path / "tmp", settings.max_pdf_bytes, "Файл презентации", ".pdf"
+        )
+        job = await asyncio.to_thread(
+            get_job_service().submit,
+            upload.path,
+            pdf_file.filename,
+            rules_name,
+            yaml_content=yaml_content,
+            profile_id=profile_id,
+            profile_version=profile_version,
+            pdf_sha256=upload.sha256
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except DSLParseError as e:
+        raise HTTPException(status_code=400, detail=f"Ошибка парсинга правил валидации: {str(e)}")
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    finally:
+        if upload is not None:
+            upload.path.unlink(missing_ok=True)
+    
+    return UploadResponse(
+        file_id=job.job_id,
+        filename=job.filename,
+        status=job.status,
+        message="Задача поставлена в очередь",
+        upload_time=datetime.fromisoformat(job.created_at)
+    )
+
+@router.post("/{job_id}/revalidate", status_code=202, response_model=UploadResponse)
+async def revalidate_job(
+    job_id: str,
+    pdf_file: UploadFile = File(..., description="Новая редакция PDF-файла презентации")
+) -> UploadResponse:
+    if not pdf_file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Файл презентации должен быть в формате PDF")
+    
+    settings = get_settings()
+    upload = None
+    try:
+        upload = await save_upload(
+            pdf_file, settings.upload_path / "tmp", settings.max_pdf_bytes, "Файл презентации", ".pdf"
+        )
+        job = await asyncio.to_thread(
+            get_job_service().revalidate, job_id, upload.path, pdf_file.filename, pdf_sha256=upload.sha256
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except JobNotReadyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    finally:
+        if upload is not None:
+            upload.path.unlink(missing_ok=True)
+    
+    return UploadResponse(
+        file_id=job.job_id,
+        filename=job.filename,
+        status=job.status,
+        message=f"Задача повторной проверки поставлена в очередь (предыдущая: {job_id})",
+        upload_time=datetime.fromisoformat(job.created_at)
+    )
+
+@router.get("/{job_id}", response_model=ProcessingResponse)
+def get_job(job_id: str) -> ProcessingResponse:
+    try:
+        job = get_job_service().get(job_id)
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return ProcessingResponse(
+        file_id=job.job_id,
+        filename=job.filename,
+        status=job.status,
+        slides_count=job.slides_count,
+        processing_time=job.processing_time,
+        page_number_analysis=job.page_number_analysis,
+        error_message=job.error_message,
+        created_at=datetime.fromisoformat(job.created_at)
+    )
+
+@router.get("/{job_id}/result")
+def get_job_result(job_id: str) -> JSONResponse:
+    try:
+        return JSONResponse(get_job_service().result(job_id))
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except JobNotReadyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
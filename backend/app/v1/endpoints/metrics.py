@@ -0,0 +1,45 @@
+from typing import Iterable
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import CONTENT_TYPE, REGISTRY, Sample
+from app.services.jobs import get_job_service
+from app.services.pipeline_executor import get_pipeline_executor, hit_ratios
+from app.services.result_cache import get_result_cache
+
+router = APIRouter(tags=["metrics"])
+
+def _pipeline_samples() -> Iterable[Sample]:
+    stats = get_pipeline_executor().stats()
+    for state in ("in_flight", "queued", "capacity"):
+        yield (state,), stats[state]
+
+def _rejected_samples() -> Iterable[Sample]:
+    yield (), get_pipeline_executor().rejected
+
+def _job_queue_samples() -> Iterable[Sample]:
+    yield (), get_job_service().queue.pending_count()
+
+def _cache_hit_ratio_samples() -> Iterable[Sample]:
+    yield ("results",), get_result_cache().stats()["hit_ratio"]
+    for cache, stats in hit_ratios(get_pipeline_executor().cache_counters()).items():
+        yield (cache,), stats["hit_ratio"]
+
+REGISTRY.callback(
+    "pptx_dsl_pipeline_requests", "Заявки в пуле обработки презентаций", ["state"], _pipeline_samples
+)
+REGISTRY.callback(
+    "pptx_dsl_pipeline_rejected_total", "Заявки, отклоненные из-за перегрузки пула", [], _rejected_samples,
+    kind="counter"
+)
+REGISTRY.callback(
+    "pptx_dsl_job_queue_depth", "Задачи, ожидающие обработки в очереди", [], _job_queue_samples
+)
+REGISTRY.callback(
+    "pptx_dsl_cache_hit_ratio", "Доля попаданий в кэши сервиса", ["cache"], _cache_hit_ratio_samples
+)
+
+@router.get("/metrics", summary="Метрики сервиса в формате Prometheus", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
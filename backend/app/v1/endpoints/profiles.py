@@ -0,0 +1,62 @@
+import asyncio
+from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.core.config import get_settings
+from app.core.web.models.models import RuleProfileResponse
+from app.services.dsl import DSLParseError
+from app.services.profile_service import get_profile_store, ProfileError, ProfileNotFoundError
+from app.services.uploads import read_upload_text, UploadTooLargeError
+
+router = APIRouter(prefix="/profiles", tags=["profiles"])
+
+@router.post("", status_code=201, response_model=RuleProfileResponse)
+async def create_profile(
+    profile_id: str = Form(..., description="Идентификатор профиля правил"),
+    yaml_file: UploadFile = File(..., description="YAML-файл с правилами DSL")
+) -> RuleProfileResponse:
+    if not yaml_file.filename.lower().endswith((".yaml", ".yml")):
+        raise HTTPException(status_code=400, detail="Файл правил должен быть в формате YAML (.yaml или .yml)")
+    
+    try:
+        yaml_content, _ = await read_upload_text(yaml_file, get_settings().max_rules_bytes, "Файл правил")
+        profile = await asyncio.to_thread(
+            get_profile_store().create_version, profile_id, yaml_content, yaml_file.filename
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Файл правил должен быть в кодировке UTF-8")
+    except DSLParseError as e:
+        raise HTTPException(status_code=400, detail=f"Ошибка парсинга правил валидации: {str(e)}")
+    except ProfileError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return RuleProfileResponse(**profile.to_dict())
+
+@router.get("", response_model=List[RuleProfileResponse])
+def list_profiles() -> List[RuleProfileResponse]:
+    return [RuleProfileResponse(**profile) for profile in get_profile_store().list_profiles()]
+
+@router.get("/{profile_id}", response_model=List[RuleProfileResponse])
+def list_profile_versions(profile_id: str) -> List[RuleProfileResponse]:
+    try:
+        versions = get_profile_store().list_versions(profile_id)
+    except ProfileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ProfileError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return [RuleProfileResponse(**profile.to_dict()) for profile in versions]
+
+@router.get("/{profile_id}/source", response_class=PlainTextResponse)
+def get_profile_source(
+    profile_id: str,
+    version: Optional[int] = Query(None, description="Версия профиля (по умолчанию последняя)")
+) -> str:
+    try:
+        return get_profile_store().get_source(profile_id, version)
+    except ProfileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ProfileError as e:
+        raise HTTPException(status_code=400, detail=str(e))
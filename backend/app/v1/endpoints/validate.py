@@ -1,27 +1,163 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+import asyncio
+import json
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from app.core.config import get_settings
+from app.services.batch_service import BatchFile, run_batch
+from app.services.dsl import get_engine_cache, rules_hash, DSLParseError
 from app.services.file_service import FileService
+from app.services.pipeline_executor import get_pipeline_executor, PipelineSaturatedError
+from app.services.profile_service import get_profile_store, ProfileError, ProfileNotFoundError, RuleProfile
+from app.services.result_cache import etag_matches, get_result_cache, result_cache_key
+from app.services.uploads import read_upload_text, save_upload, UploadTooLargeError
 
 router = APIRouter(prefix="/validate", tags=["validation"])
-file_service = FileService()
+
+def _load_profile(profile_id: str, profile_version: Optional[int]) -> Tuple[RuleProfile, str]:
+    store = get_profile_store()
+    profile = store.get(profile_id, profile_version)
+    return profile, store.get_source(profile.profile_id, profile.version)
+
+async def _resolve_rules(
+    yaml_file: Optional[UploadFile],
+    profile_id: Optional[str],
+    profile_version: Optional[int]
+) -> Tuple[str, str]:
+    if (yaml_file is None) == (profile_id is None):
+        raise HTTPException(status_code=400, detail="Необходимо передать либо YAML-файл с правилами, либо profile_id")
+    
+    if yaml_file is not None:
+        if not yaml_file.filename.lower().endswith((".yaml", ".yml")):
+            raise HTTPException(status_code=400, detail="Файл правил должен быть в формате YAML (.yaml или .yml)")
+        
+        try:
+            yaml_content, _ = await read_upload_text(yaml_file, get_settings().max_rules_bytes, "Файл правил")
+            await asyncio.to_thread(get_engine_cache().get_or_compile, yaml_content)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Файл правил должен быть в кодировке UTF-8")
+        except DSLParseError as e:
+            raise HTTPException(status_code=400, detail=f"Ошибка парсинга правил валидации: {str(e)}")
+        rules_name = yaml_file.filename
+    else:
+        try:
+            profile, yaml_content = await asyncio.to_thread(_load_profile, profile_id, profile_version)
+        except ProfileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ProfileError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        rules_name = f"{profile.profile_id}@v{profile.version}"
+    
+    return yaml_content, rules_name
 
 @router.post("")
 async def validate_presentation(
     pdf_file: UploadFile = File(..., description="PDF-файл презентации"),
-    yaml_file: UploadFile = File(..., description="YAML-файл с правилами DSL")
-) -> JSONResponse:
+    yaml_file: Optional[UploadFile] = File(None, description="YAML-файл с правилами DSL"),
+    profile_id: Optional[str] = Form(None, description="Идентификатор сохраненного профиля правил"),
+    profile_version: Optional[int] = Form(None, description="Версия профиля правил (по умолчанию последняя)"),
+    if_none_match: Optional[str] = Header(None, description="ETag ранее полученного результата"),
+    trace: bool = Query(False, description="Вернуть трассировку обработки в формате Chrome trace-event")
+) -> Response:
     if not pdf_file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Файл презентации должен быть в формате PDF")
     
-    if not yaml_file.filename.lower().endswith((".yaml", ".yml")):
-        raise HTTPException(status_code=400, detail="Файл правил должен быть в формате YAML (.yaml или .yml)")
+    settings = get_settings()
+    if trace and not settings.TRACE_DEBUG_ENABLED:
+        raise HTTPException(status_code=403, detail="Трассировка запросов отключена")
+    yaml_content, rules_name = await _resolve_rules(yaml_file, profile_id, profile_version)
+    
+    upload = None
+    try:
+        upload = await save_upload(
+            pdf_file, settings.upload_path / "tmp", settings.max_pdf_bytes, "Файл презентации", ".pdf"
+        )
+        
+        cache = get_result_cache()
+        key = result_cache_key(upload.sha256, rules_hash(yaml_content), pdf_file.filename, rules_name)
+        cached = cache.get(key) if not trace else None
+        cache_status = "hit" if cached is not None else ("bypass" if trace else "miss")
+        
+        result = None
+        if cached is None:
+            executor = get_pipeline_executor()
+            try:
+                executor.admit()
+            except PipelineSaturatedError as e:
+                raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+            try:
+                result = await executor.run(upload.path, yaml_content, pdf_file.filename, rules_name, trace=trace)
+            finally:
+                executor.release()
+            cached = cache.put(key, FileService.to_response(result), result.get("deterministic", False))
+    except HTTPException:
+        raise
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Ошибка обработки файлов: {str(e)}")
+    finally:
+        if upload is not None:
+            upload.path.unlink(missing_ok=True)
+    
+    headers = {"ETag": cached.etag, "X-Cache": cache_status}
+    if trace:
+        return JSONResponse({**cached.response, "trace": result["trace"]}, headers=headers)
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(cached.response, headers=headers)
 
-    result = file_service.process_uploaded_files(pdf_file, yaml_file)
-    
-    return JSONResponse({
-        "status": "success" if result["success"] else "failed",
-        "files": result["files"],
-        "validation": result["validation"],
-        "presentation": result["presentation"],
-        "detailed_results": result["detailed_results"]
-    })
+@router.post("/batch")
+async def validate_batch(
+    pdf_files: List[UploadFile] = File(..., description="PDF-файлы презентаций"),
+    yaml_file: Optional[UploadFile] = File(None, description="YAML-файл с правилами DSL"),
+    profile_id: Optional[str] = Form(None, description="Идентификатор сохраненного профиля правил"),
+    profile_version: Optional[int] = Form(None, description="Версия профиля правил (по умолчанию последняя)")
+) -> StreamingResponse:
+    settings = get_settings()
+    if len(pdf_files) > settings.BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком много файлов в пакете: {len(pdf_files)}, максимум {settings.BATCH_MAX_FILES}"
+        )
+    
+    yaml_content, rules_name = await _resolve_rules(yaml_file, profile_id, profile_version)
+    
+    executor = get_pipeline_executor()
+    try:
+        executor.ensure_capacity()
+    except PipelineSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    
+    files: List[BatchFile] = []
+    
+    def cleanup() -> None:
+        for batch_file in files:
+            if batch_file.path is not None:
+                batch_file.path.unlink(missing_ok=True)
+    
+    try:
+        for pdf_file in pdf_files:
+            if not pdf_file.filename.lower().endswith(".pdf"):
+                files.append(BatchFile(pdf_file.filename, error="Файл презентации должен быть в формате PDF"))
+                continue
+            try:
+                upload = await save_upload(
+                    pdf_file, settings.upload_path / "tmp", settings.max_pdf_bytes, "Файл презентации", ".pdf"
+                )
+            except UploadTooLargeError as e:
+                files.append(BatchFile(pdf_file.filename, error=str(e)))
+                continue
+            files.append(BatchFile(pdf_file.filename, upload.path, upload.sha256))
+    except BaseException:
+        cleanup()
+        raise
+    
+    async def stream():
+        async for item in run_batch(executor, files, yaml_content, rules_name, cache=get_result_cache()):
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson", background=BackgroundTask(cleanup))
@@ -8,12 +8,23 @@ from typing import List, Optional
 import os
 import json
 from app.domain.entities import Slide
+from app.services.dsl import get_engine_cache
+from app.services.kernel.slide_cache import get_slide_result_cache
+from app.services.pipeline_executor import get_pipeline_executor
+from app.services.result_cache import get_result_cache
+from app.services.spelling import spelling_clients_stats, spelling_services_stats
 
 from app.v1.endpoints.validate import router as validation_router
+from app.v1.endpoints.profiles import router as profiles_router
+from app.v1.endpoints.jobs import router as jobs_router
+from app.v1.endpoints.metrics import router as metrics_router
 
 router = APIRouter()
 
 router.include_router(validation_router)
+router.include_router(profiles_router)
+router.include_router(jobs_router)
+router.include_router(metrics_router)
 
 @router.get("/healthz", summary="Проверка на то, насколько жив сервис")
 def heallthz() -> dict:
@@ -27,3 +38,15 @@ def version() -> dict:
         "version": s.APP_VERSION,
         "env": s.ENV,
     }
+
+@router.get("/cache/stats", summary="Статистика кэшей сервиса")
+def cache_stats() -> dict:
+    slide_cache = get_slide_result_cache()
+    return {
+        "engines": get_engine_cache().stats(),
+        "results": get_result_cache().stats(),
+        "slides": slide_cache.stats() if slide_cache is not None else None,
+        "spelling": spelling_services_stats(),
+        "spelling_clients": spelling_clients_stats(),
+        "workers": get_pipeline_executor().worker_cache_stats(),
+    }
@@ -0,0 +1,266 @@
+import argparse
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.cli import CliError, resolve_rules
+from app.core.logging import get_logger, setup_logging
+from app.domain.entities import Presentation
+from app.services.dsl import DSLParseError, get_engine_cache
+from app.services.kernel.slide_cache import get_slide_result_cache, slide_message_prefix
+from app.services.kernel.validation_engine import SlideOutcome, ValidationEngine
+from app.services.kernel.validation_result import ValidationResult, ValidationStatus
+from app.services.pdf.pdf_processing import PdfProcessingService
+
+logger = get_logger(__name__)
+
+Signature = Tuple[int, int]
+ViolationKey = Tuple[str, str, str, str]
+
+@dataclass(frozen=True)
+class Violation:
+    key: ViolationKey
+    severity: str
+    rule_name: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"[{self.severity.upper()}] {self.rule_name}: {self.message}"
+
+@dataclass
+class WatchReport:
+    filename: str
+    slides: int
+    extracted: int
+    revalidated: int
+    elapsed: float
+    added: List[Violation] = field(default_factory=list)
+    resolved: List[Violation] = field(default_factory=list)
+    totals: Dict[str, int] = field(default_factory=dict)
+
+class DirectoryWatcher:
+
+    def __init__(self, root: Path, debounce: float = 0.3, clock: Callable[[], float] = time.monotonic):
+        self.root = Path(root)
+        self.debounce = debounce
+        self.clock = clock
+        self._known: Dict[Path, Signature] = {}
+        self._pending: Dict[Path, Tuple[Signature, float]] = {}
+
+    def scan(self) -> Dict[Path, Signature]:
+        if self.root.is_file():
+            paths = [self.root]
+        else:
+            paths = [p for p in self.root.rglob("*") if p.suffix.lower() == ".pdf"]
+
+        signatures = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def poll(self) -> Tuple[List[Path], List[Path]]:
+        now = self.clock()
+        current = self.scan()
+
+        settled = []
+        for path, signature in current.items():
+            if self._known.get(path) == signature:
+                self._pending.pop(path, None)
+                continue
+            pending = self._pending.get(path)
+            if pending is None or pending[0] != signature:
+                self._pending[path] = (signature, now)
+            elif now - pending[1] >= self.debounce:
+                del self._pending[path]
+                self._known[path] = signature
+                settled.append(path)
+
+        removed = [path for path in self._known if path not in current]
+        for path in removed:
+            del self._known[path]
+        for path in [path for path in self._pending if path not in current]:
+            del self._pending[path]
+        return sorted(settled), removed
+
+def violation_index(results: List[ValidationResult], outcomes: List[SlideOutcome]) -> Dict[ViolationKey, List[Violation]]:
+    index: Dict[ViolationKey, List[Violation]] = {}
+
+    def add(result: ValidationResult, fingerprint: str, tail: str) -> None:
+        if result.status != ValidationStatus.FAILED:
+            return
+        key = (fingerprint, result.rule_name, result.severity.value, tail)
+        index.setdefault(key, []).append(
+            Violation(key=key, severity=result.severity.value, rule_name=result.rule_name, message=result.message)
+        )
+
+    slide_results = sum(len(outcome.results) for outcome in outcomes)
+    for result in results[:len(results) - slide_results]:
+        add(result, "", result.message)
+    for outcome in outcomes:
+        prefix = slide_message_prefix(outcome.page_number)
+        for result in outcome.results:
+            tail = result.message[len(prefix):] if result.message.startswith(prefix) else result.message
+            add(result, outcome.fingerprint or "", tail)
+    return index
+
+def diff_violations(before: Dict[ViolationKey, List[Violation]],
+                    after: Dict[ViolationKey, List[Violation]]) -> Tuple[List[Violation], List[Violation]]:
+    old = Counter({key: len(items) for key, items in before.items()})
+    new = Counter({key: len(items) for key, items in after.items()})
+    added = [violation for key, count in (new - old).items() for violation in after[key][-count:]]
+    resolved = [violation for key, count in (old - new).items() for violation in before[key][-count:]]
+
+    unmatched: Dict[Tuple[str, str, str], List[Violation]] = {}
+    for violation in resolved:
+        unmatched.setdefault((violation.rule_name, violation.severity, violation.message), []).append(violation)
+    still_added = []
+    matched = set()
+    for violation in added:
+        same = unmatched.get((violation.rule_name, violation.severity, violation.message))
+        if same:
+            matched.add(id(same.pop()))
+        else:
+            still_added.append(violation)
+    return still_added, [violation for violation in resolved if id(violation) not in matched]
+
+class WatchSession:
+
+    def __init__(self, engine: ValidationEngine, processor: Optional[PdfProcessingService] = None):
+        self.engine = engine
+        self.processor = processor or PdfProcessingService()
+        self.presentation: Optional[Presentation] = None
+        self.outcomes: Optional[List[SlideOutcome]] = None
+        self.violations: Dict[ViolationKey, List[Violation]] = {}
+
+    def reset_rules(self, engine: ValidationEngine) -> None:
+        self.engine = engine
+        self.outcomes = None
+
+    def update(self, pdf_path: Path) -> WatchReport:
+        started = time.perf_counter()
+        previous = self.presentation
+        presentation = self.processor.process_pdf(pdf_path, previous=previous, content_keys=True)
+        known = {slide.content_key for slide in previous.slides} if previous is not None else set()
+
+        slide_cache = get_slide_result_cache()
+        session = slide_cache.session() if slide_cache is not None else None
+        try:
+            results, outcomes = self.engine.validate_slides(presentation, self.outcomes, slide_cache=session)
+        finally:
+            if session is not None:
+                session.close()
+
+        violations = violation_index(results, outcomes)
+        added, resolved = diff_violations(self.violations, violations)
+        self.presentation, self.outcomes, self.violations = presentation, outcomes, violations
+
+        totals = Counter(violation.severity for items in violations.values() for violation in items)
+        return WatchReport(
+            filename=str(pdf_path),
+            slides=len(presentation.slides),
+            extracted=sum(1 for slide in presentation.slides if slide.content_key not in known),
+            revalidated=sum(1 for outcome in outcomes if not outcome.reused),
+            elapsed=time.perf_counter() - started,
+            added=added,
+            resolved=resolved,
+            totals=dict(totals)
+        )
+
+def format_report(report: WatchReport) -> str:
+    lines = [
+        f"{report.filename}: слайдов {report.slides}, извлечено {report.extracted}, "
+        f"проверено {report.revalidated} ({report.elapsed:.2f} с)"
+    ]
+    lines.extend(f"  + {violation}" for violation in report.added)
+    lines.extend(f"  - {violation}" for violation in report.resolved)
+    if not report.added and not report.resolved:
+        lines.append("  без изменений")
+    lines.append(
+        f"  ошибок: {report.totals.get('error', 0)}, предупреждений: {report.totals.get('warning', 0)}, "
+        f"информационных: {report.totals.get('info', 0)}"
+    )
+    return "\n".join(lines)
+
+def watch(root: Path, rules: Optional[str], profile: Optional[str], interval: float, debounce: float) -> None:
+    yaml_content, rules_name = resolve_rules(rules, profile)
+    engine = get_engine_cache().get_or_compile(yaml_content)
+    watcher = DirectoryWatcher(root, debounce=debounce)
+    sessions: Dict[Path, WatchSession] = {}
+    rules_path = Path(rules) if rules is not None else None
+    rules_mtime = rules_path.stat().st_mtime_ns if rules_path is not None else None
+    print(f"Наблюдение за {root} с правилами {rules_name}. Ctrl+C для выхода", flush=True)
+
+    while True:
+        changed, removed = watcher.poll()
+
+        if rules_path is not None:
+            try:
+                mtime = rules_path.stat().st_mtime_ns
+            except OSError:
+                mtime = rules_mtime
+            if mtime != rules_mtime:
+                rules_mtime = mtime
+                try:
+                    yaml_content, _ = resolve_rules(rules, None)
+                    engine = get_engine_cache().get_or_compile(yaml_content)
+                except (CliError, DSLParseError) as e:
+                    print(f"Правила не перезагружены: {e}", file=sys.stderr, flush=True)
+                else:
+                    print(f"Правила {rules_name} перезагружены", flush=True)
+                    for session in sessions.values():
+                        session.reset_rules(engine)
+                    changed = sorted(set(changed) | set(sessions))
+
+        for path in removed:
+            sessions.pop(path, None)
+            print(f"{path}: удален", flush=True)
+
+        for path in changed:
+            session = sessions.setdefault(path, WatchSession(engine))
+            try:
+                report = session.update(path)
+            except Exception as e:
+                print(f"{path}: ошибка обработки: {e}", file=sys.stderr, flush=True)
+                continue
+            print(format_report(report), flush=True)
+
+        time.sleep(interval)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="pptx-dsl-watch", description="Повторная проверка PDF-презентаций при каждом сохранении"
+    )
+    parser.add_argument("path", help="Каталог или PDF-файл")
+    parser.add_argument("-r", "--rules", help="YAML-файл с правилами (перечитывается при изменении)")
+    parser.add_argument("-p", "--profile", help="Сохраненный профиль правил: ID или ID:VERSION")
+    parser.add_argument("--interval", type=float, default=0.2, help="Период опроса файловой системы, с")
+    parser.add_argument("--debounce", type=float, default=0.3,
+                        help="Сколько файл должен не меняться перед проверкой, с")
+    args = parser.parse_args(argv)
+    setup_logging(logging.WARNING)
+
+    try:
+        watch(Path(args.path), args.rules, args.profile, args.interval, args.debounce)
+    except DSLParseError as e:
+        print(f"Ошибка парсинга правил валидации: {e}", file=sys.stderr)
+        return 2
+    except CliError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
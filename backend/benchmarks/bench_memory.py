@@ -0,0 +1,155 @@
+import argparse
+import gc
+import json
+import resource
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.adapters.pdf.pdfplumber_extractor import PdfPlumberExtractor
+from app.services.dsl import load_validation_engine
+from app.services.kernel.validation_engine import ValidationEngine
+from app.services.pdf.layout import LayoutAnalyzer
+from app.services.pdf.normalization import TextNormalizer
+from app.services.pdf.pdf_processing import PdfProcessingService
+from benchmarks.fixtures import PROFILES_DIR
+from benchmarks.pdf_fixtures import DeckSpec, build_deck
+
+MB = 1024 * 1024
+
+DECK_SIZES = (25, 50, 100, 200)
+
+def _proc_status(field: str) -> Optional[int]:
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+def reset_rss_peak() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+def rss_peak() -> int:
+    peak = _proc_status("VmHWM")
+    if peak is not None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+def measure_stage(name: str, func: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+    gc.collect()
+    rss_reset = reset_rss_peak()
+    rss_before = _proc_status("VmRSS")
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+
+    result = func()
+
+    _, peak = tracemalloc.get_traced_memory()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    return result, {
+        "stage": name,
+        "retained_bytes": current - before,
+        "peak_bytes": peak - before,
+        "rss_peak_bytes": rss_peak(),
+        "rss_growth_bytes": rss_peak() - rss_before if rss_reset and rss_before is not None else None
+    }
+
+def count_objects(presentation) -> Dict[str, int]:
+    paragraphs = [block for slide in presentation.slides for block in slide.blocks]
+    return {
+        "slides": len(presentation.slides),
+        "retained_raw_chars": sum(len(slide.raw_chars) for slide in presentation.slides),
+        "text_runs": sum(len(block.runs) for block in paragraphs),
+        "paragraphs": len(paragraphs)
+    }
+
+def profile_deck(pdf_path: Path, engine: ValidationEngine) -> Dict[str, Any]:
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        extractor = PdfPlumberExtractor()
+        normalizer = TextNormalizer()
+        analyzer = LayoutAnalyzer()
+
+        raw, extract = measure_stage("extract", lambda: extractor.extract(pdf_path))
+        glyphs = sum(len(slide.raw_chars) for slide in raw.slides)
+        extract["raw_chars"] = glyphs
+
+        runs, normalize = measure_stage(
+            "normalize", lambda: [normalizer.normalize_symbols(slide.raw_chars) for slide in raw.slides]
+        )
+        normalize["text_runs"] = sum(len(slide_runs) for slide_runs in runs)
+
+        paragraphs, layout = measure_stage("layout", lambda: [
+            analyzer.build_paragraphs(slide_runs, slide.width, slide.height)
+            for slide_runs, slide in zip(runs, raw.slides)
+        ])
+        layout["paragraphs"] = sum(len(blocks) for blocks in paragraphs)
+        del raw, runs, paragraphs
+
+        presentation, process = measure_stage("process_pdf", lambda: PdfProcessingService().process_pdf(pdf_path))
+        process.update(count_objects(presentation))
+
+        _, validate = measure_stage("validate", lambda: engine.validate(presentation))
+        del presentation
+
+        slides = process["slides"]
+        pipeline_peak = max(process["peak_bytes"], process["retained_bytes"] + validate["peak_bytes"])
+        return {
+            "slides": slides,
+            "glyphs": glyphs,
+            "stages": [extract, normalize, layout, process, validate],
+            "pipeline_peak_bytes": pipeline_peak,
+            "retained_bytes_per_glyph": round(process["retained_bytes"] / glyphs, 1) if glyphs else 0.0,
+            "peak_bytes_per_glyph": round(pipeline_peak / glyphs, 1) if glyphs else 0.0,
+            "peak_mb_per_100_pages": round(pipeline_peak / MB / slides * 100, 2) if slides else 0.0
+        }
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+def profile_sizes(sizes: List[int], profile: Path, directory: Path) -> List[Dict[str, Any]]:
+    engine = load_validation_engine(str(profile))
+    reports = []
+    for slides in sizes:
+        pdf_path = directory / f"deck-{slides}.pdf"
+        pdf_path.write_bytes(build_deck(DeckSpec(slides=slides, paragraphs=4, words=(10, 20))))
+        reports.append({"deck": pdf_path.name, "pdf_bytes": pdf_path.stat().st_size, **profile_deck(pdf_path, engine)})
+    return reports
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Профилирование памяти конвейера на презентациях растущего размера")
+    parser.add_argument("--sizes", default=",".join(map(str, DECK_SIZES)), help="Количество слайдов через запятую")
+    parser.add_argument("--profile", default=str(PROFILES_DIR / "corporate_100.yaml"))
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    with tempfile.TemporaryDirectory() as directory:
+        report = {
+            "benchmark": "memory",
+            "profile": Path(args.profile).name,
+            "decks": profile_sizes(sizes, Path(args.profile), Path(directory))
+        }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BACKEND_DIR))
+
+os.environ.setdefault("UPLOAD_DIR", tempfile.mkdtemp(prefix="pptx-dsl-bench-"))
+os.environ.setdefault("PIPELINE_WORKERS", "0")
+os.environ.setdefault("RESULT_CACHE_SIZE", "0")
+os.environ.setdefault("SLIDE_CACHE_SIZE", "0")
+
+from app.adapters.pdf.pdfplumber_extractor import PdfPlumberExtractor
+from app.services.dsl import load_validation_engine
+from app.services.pdf.layout import LayoutAnalyzer
+from app.services.pdf.normalization import TextNormalizer
+from app.services.pdf.page_number import PageNumberDetector
+from app.services.pdf.pdf_processing import PdfProcessingService
+from benchmarks.fixtures import PROFILES_DIR
+from benchmarks.load_light_heavy import multipart
+from benchmarks.pdf_fixtures import DECK_PRESETS, build_deck
+
+STAGES = ("extract", "normalize", "layout", "page_numbers", "validate", "asgi_validate")
+
+def measure(func: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict[str, float]:
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3)
+    }
+
+async def asgi_post(app, path: str, body: bytes, content_type: str) -> Tuple[int, bytes]:
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "POST", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80)
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    response = {"status": 0, "body": b""}
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return response["status"], response["body"]
+
+def stage_runners(pdf_path: Path) -> Dict[str, Callable[[], Any]]:
+    extractor = PdfPlumberExtractor()
+    normalizer = TextNormalizer()
+    analyzer = LayoutAnalyzer()
+
+    raw = extractor.extract(pdf_path)
+    chars = [slide.raw_chars for slide in raw.slides]
+    runs = [normalizer.normalize_symbols(slide_chars) for slide_chars in chars]
+    sizes = [(slide.width, slide.height) for slide in raw.slides]
+
+    slides = PdfProcessingService().process_pdf(pdf_path).slides
+
+    def page_numbers():
+        stream = PageNumberDetector().stream()
+        for slide in slides:
+            stream.feed(slide)
+        return stream.finish()
+
+    return {
+        "extract": lambda: extractor.extract(pdf_path),
+        "normalize": lambda: [normalizer.normalize_symbols(slide_chars) for slide_chars in chars],
+        "layout": lambda: [analyzer.build_paragraphs(r, w, h) for r, (w, h) in zip(runs, sizes)],
+        "page_numbers": page_numbers
+    }
+
+def run_suite(decks: List[str], stages: List[str], profiles: List[Path], repeat: int) -> List[Dict[str, Any]]:
+    results = []
+    app = None
+    with tempfile.TemporaryDirectory() as directory:
+        for deck in decks:
+            spec = DECK_PRESETS[deck]
+            pdf_bytes = build_deck(spec)
+            pdf_path = Path(directory) / f"{deck}.pdf"
+            pdf_path.write_bytes(pdf_bytes)
+            base = {"deck": deck, "slides": spec.slides, "pdf_bytes": len(pdf_bytes)}
+
+            runners = stage_runners(pdf_path)
+            for stage, runner in runners.items():
+                if stage in stages:
+                    results.append({"stage": stage, **base, **measure(runner, repeat)})
+
+            presentation = PdfProcessingService().process_pdf(pdf_path)
+            for profile in profiles:
+                if "validate" in stages:
+                    engine = load_validation_engine(str(profile))
+                    results.append({
+                        "stage": "validate", "profile": profile.name, **base,
+                        **measure(lambda: engine.validate(presentation), repeat)
+                    })
+                if "asgi_validate" in stages:
+                    if app is None:
+                        from app.main import app
+                    body, content_type = multipart({
+                        "pdf_file": (f"{deck}.pdf", pdf_bytes),
+                        "yaml_file": (profile.name, profile.read_bytes())
+                    })
+
+                    def post():
+                        status, payload = asyncio.run(asgi_post(app, "/api/v1/validate", body, content_type))
+                        if status != 200:
+                            raise SystemExit(f"/validate вернул {status}: {payload[:200]!r}")
+
+                    results.append({
+                        "stage": "asgi_validate", "profile": profile.name, **base,
+                        **measure(post, repeat)
+                    })
+    return results
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def result_key(result: Dict[str, Any]) -> Tuple[str, str, str]:
+    return result["stage"], result["deck"], result.get("profile", "")
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    previous = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        before = previous.get(result_key(result))
+        if before is None or not before["min_ms"]:
+            continue
+        ratio = result["min_ms"] / before["min_ms"]
+        result["baseline_min_ms"] = before["min_ms"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(result)
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Бенчмарк этапов конвейера на синтетических презентациях")
+    parser.add_argument("--decks", default="small,dense,lists,columns,unnumbered",
+                        help=f"Пресеты презентаций через запятую: {', '.join(DECK_PRESETS)}")
+    parser.add_argument("--stages", default=",".join(STAGES), help="Этапы через запятую")
+    parser.add_argument("--profiles", default="", help="YAML-профили через запятую (по умолчанию все эталонные)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    parser.add_argument("--baseline", help="JSON-отчет предыдущего запуска для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Допустимое замедление относительно baseline")
+    args = parser.parse_args()
+
+    decks = [deck for deck in args.decks.split(",") if deck]
+    unknown = [deck for deck in decks if deck not in DECK_PRESETS]
+    if unknown:
+        raise SystemExit(f"Неизвестные пресеты: {', '.join(unknown)}")
+    stages = [stage for stage in args.stages.split(",") if stage]
+    profiles = [Path(path) for path in args.profiles.split(",") if path] or sorted(PROFILES_DIR.glob("*.yaml"))
+
+    report = {
+        "benchmark": "pipeline",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": run_suite(decks, stages, profiles, args.repeat)
+    }
+
+    regressions = []
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.threshold)
+        report["regressions"] = [result_key(result) for result in regressions]
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if regressions:
+        raise SystemExit(f"Замедление более чем на {args.threshold:.0%}: {len(regressions)} измерений")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.services.dsl import load_validation_engine
+from benchmarks.fixtures import PROFILES_DIR, build_presentation
+
+def run_unplanned(engine, presentation):
+    results = [check.validate(presentation) for check in engine.presentation_checks]
+    for slide in presentation.slides:
+        for check in engine.slide_checks:
+            if check.applies_to_slide(slide.page_number):
+                results.append(check.validate(slide))
+    return results
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Бенчмарк планировщика правил")
+    parser.add_argument("--profile", default=str(PROFILES_DIR / "corporate_100.yaml"))
+    parser.add_argument("--slides", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    args = parser.parse_args()
+    
+    engine = load_validation_engine(args.profile)
+    presentation = build_presentation(args.slides)
+    
+    planned = engine.validate(presentation)
+    unplanned = run_unplanned(engine, presentation)
+    if planned != unplanned:
+        raise SystemExit("Результаты планировщика отличаются от последовательного выполнения")
+    
+    unplanned_time = best_of(lambda: run_unplanned(engine, presentation), args.repeat)
+    planned_time = best_of(lambda: engine.validate(presentation), args.repeat)
+    
+    report = {
+        "benchmark": "rule_planner",
+        "profile": Path(args.profile).name,
+        "slides": args.slides,
+        "results": len(planned),
+        "plan": engine.plan.stats(),
+        "unplanned_seconds": round(unplanned_time, 6),
+        "planned_seconds": round(planned_time, 6),
+        "speedup": round(unplanned_time / planned_time, 2) if planned_time else None
+    }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
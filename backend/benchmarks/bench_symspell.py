@@ -0,0 +1,108 @@
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.services.spelling.symspell import MappedSymSpellIndex, SymSpellIndex
+
+ALPHABET = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+
+def synthetic_dictionary(words: int, rng: random.Random) -> dict:
+    dictionary = {}
+    while len(dictionary) < words:
+        word = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(3, 12)))
+        dictionary[word] = int(1_000_000 / (len(dictionary) + 1)) + 1
+    return dictionary
+
+def misspell(word: str, rng: random.Random) -> str:
+    for _ in range(rng.randint(1, 2)):
+        position = rng.randrange(len(word))
+        operation = rng.choice(("delete", "insert", "replace", "swap"))
+        if operation == "delete" and len(word) > 2:
+            word = word[:position] + word[position + 1:]
+        elif operation == "insert":
+            word = word[:position] + rng.choice(ALPHABET) + word[position:]
+        elif operation == "swap" and position < len(word) - 1:
+            word = word[:position] + word[position + 1] + word[position] + word[position + 2:]
+        else:
+            word = word[:position] + rng.choice(ALPHABET) + word[position + 1:]
+    return word
+
+def throughput(index, queries) -> float:
+    started = time.perf_counter()
+    for word in queries:
+        index.lookup(word)
+    elapsed = time.perf_counter() - started
+    return len(queries) / elapsed if elapsed else float("inf")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Бенчмарк локальной проверки орфографии")
+    parser.add_argument("--dictionary", help="Частотный словарь (по умолчанию синтетический)")
+    parser.add_argument("--words", type=int, default=30000, help="Размер синтетического словаря")
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--misspelled", type=float, default=0.2, help="Доля слов с ошибками")
+    parser.add_argument("--max-edit-distance", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    index = SymSpellIndex(max_edit_distance=args.max_edit_distance)
+
+    started = time.perf_counter()
+    if args.dictionary:
+        index.load_dictionary(args.dictionary)
+    else:
+        for word, count in synthetic_dictionary(args.words, rng).items():
+            index.add_word(word, count)
+    build_time = time.perf_counter() - started
+
+    vocabulary = list(index.words)
+    queries = [
+        misspell(word, rng) if rng.random() < args.misspelled else word
+        for word in (rng.choice(vocabulary) for _ in range(args.queries))
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = Path(tmp) / "index.bin"
+
+        started = time.perf_counter()
+        index.save(index_path)
+        save_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        mapped = MappedSymSpellIndex(index_path)
+        open_time = time.perf_counter() - started
+
+        sample = queries[:500]
+        if [mapped.lookup(w) for w in sample] != [index.lookup(w) for w in sample]:
+            raise SystemExit("Результаты индекса в памяти и отображенного индекса отличаются")
+
+        report = {
+            "benchmark": "symspell",
+            "dictionary": Path(args.dictionary).name if args.dictionary else "synthetic",
+            "words": len(vocabulary),
+            "deletes": len(index.deletes),
+            "queries": len(queries),
+            "misspelled": args.misspelled,
+            "max_edit_distance": args.max_edit_distance,
+            "build_seconds": round(build_time, 3),
+            "save_seconds": round(save_time, 3),
+            "index_bytes": index_path.stat().st_size,
+            "open_seconds": round(open_time, 6),
+            "memory_words_per_second": round(throughput(index, queries)),
+            "mapped_words_per_second": round(throughput(mapped, queries))
+        }
+        mapped.close()
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SLIDE_CACHE_SIZE", "0")
+
+from app.core.tracing import current_trace, span, traced
+from app.services.dsl import load_validation_engine
+from app.services.file_service import FileService
+from benchmarks.fixtures import PROFILES_DIR, build_presentation
+from benchmarks.pdf_fixtures import build_pdf
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def noop_span_seconds(calls: int = 200000) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        with span("noop"):
+            pass
+    return (time.perf_counter() - started) / calls
+
+def noop_lookup_seconds(calls: int = 200000) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        if current_trace() is not None:
+            pass
+    return (time.perf_counter() - started) / calls
+
+def disabled_cost(events, per_span: float, per_lookup: float) -> float:
+    checks = sum(1 for event in events if event["cat"] == "check")
+    return per_span * (len(events) - checks) + per_lookup * checks
+
+def traced_run(func):
+    with traced(True) as trace:
+        func()
+    return trace
+
+def overhead(baseline: float, measured: float) -> float:
+    return round((measured - baseline) / baseline * 100, 2) if baseline else 0.0
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Бенчмарк накладных расходов трассировки")
+    parser.add_argument("--profile", default=str(PROFILES_DIR / "corporate_100.yaml"))
+    parser.add_argument("--slides", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    args = parser.parse_args()
+
+    engine = load_validation_engine(args.profile)
+    presentation = build_presentation(args.slides)
+    service = FileService()
+
+    with tempfile.TemporaryDirectory() as directory:
+        pdf_path = Path(directory) / "deck.pdf"
+        pdf_path.write_bytes(build_pdf(args.slides))
+        run_pipeline = lambda: service.process_file(pdf_path, engine, "deck.pdf", "rules.yaml")
+        run_engine = lambda: engine.validate_slides(presentation)
+
+        run_pipeline()
+        pipeline_events = traced_run(run_pipeline).events
+        engine_events = traced_run(run_engine).events
+
+        pipeline_off = best_of(run_pipeline, args.repeat)
+        pipeline_on = best_of(lambda: traced_run(run_pipeline), args.repeat)
+        engine_off = best_of(run_engine, args.repeat)
+        engine_on = best_of(lambda: traced_run(run_engine), args.repeat)
+
+    per_span = noop_span_seconds()
+    per_lookup = noop_lookup_seconds()
+    report = {
+        "benchmark": "tracing",
+        "profile": Path(args.profile).name,
+        "slides": args.slides,
+        "noop_span_ns": round(per_span * 1e9, 1),
+        "noop_lookup_ns": round(per_lookup * 1e9, 1),
+        "pipeline": {
+            "spans": len(pipeline_events),
+            "off_seconds": round(pipeline_off, 6),
+            "on_seconds": round(pipeline_on, 6),
+            "on_overhead_pct": overhead(pipeline_off, pipeline_on),
+            "off_overhead_pct": round(disabled_cost(pipeline_events, per_span, per_lookup) / pipeline_off * 100, 3)
+        },
+        "engine": {
+            "spans": len(engine_events),
+            "off_seconds": round(engine_off, 6),
+            "on_seconds": round(engine_on, 6),
+            "on_overhead_pct": overhead(engine_off, engine_on),
+            "off_overhead_pct": round(disabled_cost(engine_events, per_span, per_lookup) / engine_off * 100, 3)
+        }
+    }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
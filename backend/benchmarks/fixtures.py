@@ -0,0 +1,58 @@
+import random
+from pathlib import Path
+from typing import List
+
+from app.domain.entities import Presentation, Slide, Paragraph, TextRun, ListType
+
+PROFILES_DIR = Path(__file__).parent / "profiles"
+
+WORDS = (
+    "презентация отчет квартал выручка рост клиент продукт команда проект стратегия "
+    "рынок доля анализ результат план задача срок бюджет риск метрика"
+).split()
+
+FONTS = ["Arial", "Calibri", "Times New Roman", "Roboto"]
+
+FOOTER = "Конфиденциально. Только для внутреннего использования"
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+def _paragraph(rng: random.Random, text: str, font: str, size: float, y: float,
+               list_type: ListType = ListType.NONE, level: int = 0) -> Paragraph:
+    x = 60 + 50 * level
+    bbox = (x, y, x + 8 * len(text) * size / 16, y + size)
+    runs = [
+        TextRun(text=ch, font_family=font, font_size=size, bbox=bbox)
+        for ch in text
+    ]
+    return Paragraph(text=text, runs=runs, list_type=list_type, level=level, bbox=bbox)
+
+def build_presentation(slides: int = 100, seed: int = 0) -> Presentation:
+    rng = random.Random(seed)
+    result: List[Slide] = []
+    
+    for number in range(1, slides + 1):
+        font = FONTS[number % len(FONTS)]
+        blocks = [_paragraph(rng, _sentence(rng, rng.randint(2, 6)), font, 28, 40)]
+        
+        y = 120.0
+        for _ in range(rng.randint(1, 3)):
+            blocks.append(_paragraph(rng, _sentence(rng, rng.randint(8, 30)), font, rng.choice([11, 14, 16]), y))
+            y += 40
+        
+        if number % 2 == 0:
+            list_type = ListType.BULLET if number % 4 == 0 else ListType.NUMBERED
+            for item in range(rng.randint(2, 9)):
+                level = 1 if item % 3 == 2 else 0
+                blocks.append(_paragraph(rng, _sentence(rng, rng.randint(2, 8)), font, 16, y, list_type, level))
+                y += 24
+        
+        blocks.append(_paragraph(rng, FOOTER, font, 10, 500))
+        blocks.append(_paragraph(rng, str(number), font, 10, 515))
+        result.append(Slide(page_number=number, width=960, height=540, blocks=blocks))
+    
+    presentation = Presentation(file_path=Path("synthetic.pdf"), slides=result)
+    presentation.intern_texts()
+    return presentation
@@ -0,0 +1,156 @@
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BACKEND_DIR))
+
+from benchmarks.fixtures import PROFILES_DIR
+from benchmarks.pdf_fixtures import build_pdf
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def multipart(files: Dict[str, Tuple[str, bytes]]) -> Tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    body = bytearray()
+    for name, (filename, content) in files.items():
+        body += (
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"{name}\"; filename=\"{filename}\"\r\n"
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode() + content + b"\r\n"
+    body += f"--{boundary}--\r\n".encode()
+    return bytes(body), f"multipart/form-data; boundary={boundary}"
+
+def request(port: int, method: str, path: str, body: bytes = b"", content_type: str = "") -> Tuple[int, float]:
+    started = time.perf_counter()
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    headers = {"Content-Type": content_type} if content_type else {}
+    connection.request(method, path, body=body or None, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+    return response.status, time.perf_counter() - started
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(pick(0.95) * 1000, 2),
+        "p99_ms": round(pick(0.99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2)
+    }
+
+def light_load(port: int, duration: float, clients: int) -> List[float]:
+    latencies: List[float] = []
+    deadline = time.monotonic() + duration
+
+    def client():
+        while time.monotonic() < deadline:
+            status, elapsed = request(port, "GET", "/api/v1/healthz")
+            if status == 200:
+                latencies.append(elapsed)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Задержка легких запросов во время тяжелых проверок")
+    parser.add_argument("--workers", type=int, default=2, help="PIPELINE_WORKERS сервера (0 - пул потоков)")
+    parser.add_argument("--heavy", type=int, default=4, help="Одновременных тяжелых запросов /validate")
+    parser.add_argument("--slides", type=int, default=150, help="Слайдов в тяжелой презентации")
+    parser.add_argument("--light-clients", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--profile", default=str(PROFILES_DIR / "corporate_100.yaml"))
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    args = parser.parse_args()
+
+    port = free_port()
+    upload_dir = tempfile.mkdtemp(prefix="pptx-dsl-load-")
+    env = {**os.environ, "PIPELINE_WORKERS": str(args.workers), "UPLOAD_DIR": upload_dir}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env
+    )
+
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                request(port, "GET", "/api/v1/healthz")
+                break
+            except OSError:
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise SystemExit("Сервер не запустился")
+                time.sleep(0.2)
+
+        baseline = light_load(port, args.duration / 2, args.light_clients)
+
+        body, content_type = multipart({
+            "pdf_file": ("heavy.pdf", build_pdf(args.slides)),
+            "yaml_file": ("rules.yaml", Path(args.profile).read_bytes())
+        })
+        heavy_latencies: List[float] = []
+        heavy_statuses: Dict[int, int] = {}
+        stop = threading.Event()
+
+        def heavy_client():
+            while not stop.is_set():
+                status, elapsed = request(port, "POST", "/api/v1/validate", body, content_type)
+                heavy_statuses[status] = heavy_statuses.get(status, 0) + 1
+                if status == 200:
+                    heavy_latencies.append(elapsed)
+                elif status == 503:
+                    time.sleep(0.5)
+
+        heavy_threads = [threading.Thread(target=heavy_client) for _ in range(args.heavy)]
+        for thread in heavy_threads:
+            thread.start()
+        time.sleep(0.5)
+
+        loaded = light_load(port, args.duration, args.light_clients)
+        stop.set()
+        for thread in heavy_threads:
+            thread.join()
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    report = {
+        "benchmark": "light_vs_heavy",
+        "pipeline_workers": args.workers,
+        "heavy_clients": args.heavy,
+        "heavy_slides": args.slides,
+        "light_baseline": percentiles(baseline),
+        "light_under_load": percentiles(loaded),
+        "heavy": {**percentiles(heavy_latencies), "statuses": heavy_statuses}
+    }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
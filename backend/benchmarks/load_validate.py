@@ -0,0 +1,339 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BACKEND_DIR))
+
+from app.services.spelling.stub_server import SpellerStubServer
+from benchmarks.fixtures import PROFILES_DIR
+from benchmarks.load_light_heavy import free_port, multipart, percentiles
+from benchmarks.pdf_fixtures import DECK_PRESETS, build_deck
+
+MB = 1024 * 1024
+
+SPELLING_RULE = """
+  - rule:
+      name: "Орфография"
+      level: slide
+      check: spelling
+      params: {backend: yandex}
+      severity: warning
+"""
+
+@dataclass
+class Workload:
+    decks: List[Tuple[str, bytes]]
+    deck_weights: List[float]
+    profiles: List[Tuple[str, bytes]]
+    profile_weights: List[float]
+    jobs_ratio: float
+    rng: random.Random
+
+    def pick(self) -> Tuple[str, Tuple[str, bytes], Tuple[str, bytes]]:
+        kind = "jobs" if self.rng.random() < self.jobs_ratio else "validate"
+        deck = self.rng.choices(self.decks, self.deck_weights)[0]
+        profile = self.rng.choices(self.profiles, self.profile_weights)[0]
+        return kind, deck, profile
+
+@dataclass
+class Stats:
+    started: float = field(default_factory=time.monotonic)
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    statuses: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    errors: int = 0
+    completed: int = 0
+
+    def record(self, label: str, status: str, elapsed: Optional[float]) -> None:
+        counts = self.statuses.setdefault(label, {})
+        counts[status] = counts.get(status, 0) + 1
+        if elapsed is not None:
+            self.latencies.setdefault(label, []).append(elapsed)
+            self.completed += 1
+        else:
+            self.errors += 1
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    weights = {}
+    for item in spec.split(","):
+        if not item:
+            continue
+        name, _, weight = item.partition(":")
+        weights[name] = float(weight or 1)
+    return weights
+
+def load_profile(name: str) -> Tuple[str, bytes]:
+    if name == "spelling":
+        source = (PROFILES_DIR / "basic_12.yaml").read_text(encoding="utf-8").rstrip("\n") + "\n" + SPELLING_RULE
+        return "spelling.yaml", source.encode("utf-8")
+    path = Path(name) if Path(name).exists() else PROFILES_DIR / name
+    return path.name, path.read_bytes()
+
+async def http_request(host: str, port: int, method: str, path: str, body: bytes = b"",
+                       content_type: str = "", timeout: float = 300.0) -> Tuple[int, bytes]:
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        headers = [f"{method} {path} HTTP/1.1", f"Host: {host}:{port}", "Connection: close",
+                   f"Content-Length: {len(body)}"]
+        if content_type:
+            headers.append(f"Content-Type: {content_type}")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        raw = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    if b"transfer-encoding: chunked" in head.lower():
+        payload = _dechunk(payload)
+    return status, payload
+
+def _dechunk(payload: bytes) -> bytes:
+    output = bytearray()
+    while payload:
+        size_line, _, payload = payload.partition(b"\r\n")
+        size = int(size_line.split(b";")[0], 16)
+        if size == 0:
+            break
+        output += payload[:size]
+        payload = payload[size + 2:]
+    return bytes(output)
+
+async def run_validate(port: int, deck: Tuple[str, bytes], profile: Tuple[str, bytes]) -> Tuple[int, float]:
+    body, content_type = multipart({"pdf_file": deck, "yaml_file": profile})
+    started = time.perf_counter()
+    status, _ = await http_request("127.0.0.1", port, "POST", "/api/v1/validate", body, content_type)
+    return status, time.perf_counter() - started
+
+async def run_job(port: int, deck: Tuple[str, bytes], profile: Tuple[str, bytes],
+                  poll_interval: float) -> Tuple[int, float]:
+    body, content_type = multipart({"pdf_file": deck, "yaml_file": profile})
+    started = time.perf_counter()
+    status, payload = await http_request("127.0.0.1", port, "POST", "/api/v1/jobs", body, content_type)
+    if status != 202:
+        return status, time.perf_counter() - started
+
+    job_id = json.loads(payload)["file_id"]
+    while True:
+        await asyncio.sleep(poll_interval)
+        status, payload = await http_request("127.0.0.1", port, "GET", f"/api/v1/jobs/{job_id}")
+        if status != 200:
+            return status, time.perf_counter() - started
+        state = json.loads(payload)["status"]
+        if state not in ("pending", "processing"):
+            break
+
+    status, _ = await http_request("127.0.0.1", port, "GET", f"/api/v1/jobs/{job_id}/result")
+    return status, time.perf_counter() - started
+
+async def one_request(port: int, workload: Workload, stats: Stats, poll_interval: float) -> None:
+    kind, deck, profile = workload.pick()
+    label = f"{kind}:{deck[0]}:{profile[0]}"
+    try:
+        if kind == "jobs":
+            status, elapsed = await run_job(port, deck, profile, poll_interval)
+        else:
+            status, elapsed = await run_validate(port, deck, profile)
+    except (OSError, asyncio.TimeoutError, ValueError) as e:
+        stats.record(label, type(e).__name__, None)
+        return
+    stats.record(label, str(status), elapsed if 200 <= status < 300 else None)
+
+async def closed_loop(port: int, workload: Workload, stats: Stats, concurrency: int,
+                      deadline: float, poll_interval: float) -> None:
+    async def client():
+        while time.monotonic() < deadline:
+            await one_request(port, workload, stats, poll_interval)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+
+async def open_loop(port: int, workload: Workload, stats: Stats, rate: float, max_in_flight: int,
+                    deadline: float, poll_interval: float) -> int:
+    tasks = set()
+    dropped = 0
+    while time.monotonic() < deadline:
+        await asyncio.sleep(workload.rng.expovariate(rate))
+        if len(tasks) >= max_in_flight:
+            dropped += 1
+            continue
+        task = asyncio.create_task(one_request(port, workload, stats, poll_interval))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    return dropped
+
+def process_tree_rss(pid: int) -> int:
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status", encoding="ascii") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children", encoding="ascii") as children:
+                    pending.extend(int(child) for child in children.read().split())
+        except OSError:
+            continue
+    return total
+
+async def sample_rss(pid: int, interval: float, started: float, samples: List[Dict[str, float]],
+                     stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        rss = process_tree_rss(pid)
+        if rss:
+            samples.append({"t": round(time.monotonic() - started, 2), "rss_mb": round(rss / MB, 1)})
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+async def wait_ready(port: int, server: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            status, _ = await http_request("127.0.0.1", port, "GET", "/api/v1/healthz", timeout=5)
+            if status == 200:
+                return
+        except OSError:
+            pass
+        if time.monotonic() > deadline or server.poll() is not None:
+            raise SystemExit("Сервер не запустился")
+        await asyncio.sleep(0.2)
+
+async def run_load(args, workload: Workload, port: int, server: subprocess.Popen) -> Dict[str, Any]:
+    await wait_ready(port, server)
+
+    stats = Stats()
+    samples: List[Dict[str, float]] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(server.pid, args.sample_interval, stats.started, samples, stop))
+
+    deadline = time.monotonic() + args.duration
+    dropped = 0
+    if args.rate:
+        dropped = await open_loop(port, workload, stats, args.rate, args.max_in_flight, deadline, args.poll_interval)
+    else:
+        await closed_loop(port, workload, stats, args.concurrency, deadline, args.poll_interval)
+
+    elapsed = time.monotonic() - stats.started
+    stop.set()
+    await sampler
+
+    all_latencies = [value for values in stats.latencies.values() for value in values]
+    attempted = stats.completed + stats.errors
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "requests": attempted,
+        "completed": stats.completed,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / attempted, 4) if attempted else 0.0,
+        "dropped_arrivals": dropped,
+        "throughput_rps": round(stats.completed / elapsed, 3) if elapsed else 0.0,
+        "latency": percentiles(all_latencies),
+        "by_request": {
+            label: {**percentiles(stats.latencies.get(label, [])), "statuses": statuses}
+            for label, statuses in sorted(stats.statuses.items())
+        },
+        "rss": {
+            "peak_mb": max((sample["rss_mb"] for sample in samples), default=None),
+            "samples": samples
+        }
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочное тестирование /validate и фоновых задач на локальном сервере")
+    parser.add_argument("--decks", default="small:3,dense:1,large:1",
+                        help=f"Пресеты презентаций с весами: {', '.join(DECK_PRESETS)}")
+    parser.add_argument("--profiles", default="basic_12.yaml:2,corporate_100.yaml:1,spelling:1",
+                        help="Профили правил с весами (файлы из benchmarks/profiles, пути или spelling)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Одновременных клиентов (замкнутый цикл)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Запросов в секунду (открытый цикл, Пуассон)")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="Предел одновременных запросов при --rate")
+    parser.add_argument("--jobs-ratio", type=float, default=0.0, help="Доля запросов через /jobs")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--workers", type=int, default=2, help="PIPELINE_WORKERS сервера (0 - пул потоков)")
+    parser.add_argument("--job-workers", type=int, default=2, help="JOB_WORKERS сервера")
+    parser.add_argument("--result-cache", action="store_true", help="Не отключать кэш результатов")
+    parser.add_argument("--speller-latency", type=float, default=0.05, help="Задержка заглушки орфографии, с")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Период замера RSS сервера, с")
+    parser.add_argument("--poll-interval", type=float, default=0.2, help="Период опроса статуса задачи, с")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Путь к JSON-файлу с результатами")
+    args = parser.parse_args()
+
+    deck_weights = parse_weights(args.decks)
+    unknown = [name for name in deck_weights if name not in DECK_PRESETS]
+    if unknown:
+        raise SystemExit(f"Неизвестные пресеты: {', '.join(unknown)}")
+    profile_weights = parse_weights(args.profiles)
+
+    workload = Workload(
+        decks=[(f"{name}.pdf", build_deck(DECK_PRESETS[name])) for name in deck_weights],
+        deck_weights=list(deck_weights.values()),
+        profiles=[load_profile(name) for name in profile_weights],
+        profile_weights=list(profile_weights.values()),
+        jobs_ratio=args.jobs_ratio,
+        rng=random.Random(args.seed)
+    )
+
+    port = free_port()
+    upload_dir = tempfile.mkdtemp(prefix="pptx-dsl-load-")
+    with SpellerStubServer(latency=args.speller_latency) as speller:
+        env = {
+            **os.environ,
+            "UPLOAD_DIR": upload_dir,
+            "PIPELINE_WORKERS": str(args.workers),
+            "JOB_WORKERS": str(args.job_workers),
+            "SPELLER_API_URL": speller.url
+        }
+        if not args.result_cache:
+            env["RESULT_CACHE_SIZE"] = "0"
+        server_log = Path(upload_dir) / "server.log"
+        with open(server_log, "wb") as log:
+            server = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+                cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT
+            )
+            try:
+                results = asyncio.run(run_load(args, workload, port, server))
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+        speller_requests = speller.requests
+
+    report = {
+        "benchmark": "load_validate",
+        "mode": {"rate": args.rate} if args.rate else {"concurrency": args.concurrency},
+        "pipeline_workers": args.workers,
+        "job_workers": args.job_workers,
+        "cpu_count": os.cpu_count(),
+        "decks": deck_weights,
+        "profiles": profile_weights,
+        "jobs_ratio": args.jobs_ratio,
+        "speller_requests": speller_requests,
+        "server_log": str(server_log),
+        **results
+    }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+WORDS = (
+    "revenue growth quarter client product team project strategy market share "
+    "analysis result plan task deadline budget risk metric roadmap launch"
+).split()
+
+FONTS = {"F1": "Helvetica", "F2": "Times-Roman", "F3": "Helvetica-Bold"}
+
+PAGE_WIDTH = 960
+PAGE_HEIGHT = 540
+
+TextItem = Tuple[float, float, float, str, str]
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+def _slide_items(rng: random.Random, number: int, paragraphs: int) -> List[TextItem]:
+    items: List[TextItem] = [(60, 60, 28, "F3", f"Slide {number}: {_sentence(rng, 3)}")]
+
+    y = 140.0
+    for _ in range(paragraphs):
+        items.append((60, y, 16, "F1", _sentence(rng, rng.randint(6, 12))))
+        y += 30
+
+    for item in range(rng.randint(2, 5)):
+        items.append((80, y, 16, rng.choice(["F1", "F2"]), f"- {_sentence(rng, rng.randint(2, 6))}"))
+        y += 26
+
+    items.append((60, 500, 10, "F1", "Confidential. For internal use only"))
+    items.append((900, 515, 10, "F1", str(number)))
+    return items
+
+def build_pages(slides: int = 20, paragraphs: int = 3, seed: int = 0) -> List[List[TextItem]]:
+    rng = random.Random(seed)
+    return [_slide_items(rng, number, paragraphs) for number in range(1, slides + 1)]
+
+def build_pdf(slides: int = 20, paragraphs: int = 3, seed: int = 0) -> bytes:
+    return _write_pdf(build_pages(slides, paragraphs, seed), FONTS)
+
+def write_pages(pages: List[List[TextItem]]) -> bytes:
+    return _write_pdf(pages, FONTS)
+
+PAGE_NUMBER_ANCHORS = {
+    "bottom_right": (900, 515),
+    "bottom_center": (475, 515),
+    "bottom_left": (30, 515),
+    "top_right": (900, 20),
+    "top_center": (475, 20),
+    "top_left": (30, 20),
+}
+
+@dataclass(frozen=True)
+class DeckSpec:
+    slides: int = 20
+    paragraphs: int = 3
+    words: Tuple[int, int] = (6, 12)
+    fonts: Tuple[str, ...] = ("Helvetica", "Times-Roman")
+    list_items: int = 3
+    numbered: bool = False
+    columns: int = 1
+    page_numbers: str = "bottom_right"
+    footer: bool = True
+    seed: int = 0
+
+DECK_PRESETS: Dict[str, DeckSpec] = {
+    "small": DeckSpec(slides=10),
+    "dense": DeckSpec(slides=30, paragraphs=5, words=(25, 45), page_numbers="bottom_center"),
+    "lists": DeckSpec(slides=30, paragraphs=1, list_items=8, numbered=True, page_numbers="top_right"),
+    "columns": DeckSpec(slides=30, columns=2, fonts=("Helvetica", "Times-Roman", "Courier"), page_numbers="bottom_left"),
+    "unnumbered": DeckSpec(slides=30, page_numbers="none", footer=False),
+    "large": DeckSpec(slides=200, paragraphs=4, words=(10, 20)),
+}
+
+def _wrap(text: str, size: float, width: float) -> List[str]:
+    limit = max(8, int(width / (size * 0.5)))
+    lines, current = [], ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) > limit and current:
+            lines.append(current)
+            candidate = word
+        current = candidate
+    return lines + [current] if current else lines
+
+def _spec_items(rng: random.Random, spec: DeckSpec, fonts: List[str], number: int) -> List[TextItem]:
+    items: List[TextItem] = [(60, 60, 28, "F0", f"Slide {number}: {_sentence(rng, 3)}")]
+
+    columns = max(1, spec.columns)
+    gap = 40
+    column_width = (PAGE_WIDTH - 120 - gap * (columns - 1)) / columns
+    bottom = PAGE_HEIGHT - 70
+    for column in range(columns):
+        x = 60 + column * (column_width + gap)
+        y = 130.0
+        font = fonts[(number + column) % len(fonts)]
+        size = 16 if spec.words[1] <= 20 else 12
+        for _ in range(spec.paragraphs):
+            for line in _wrap(_sentence(rng, rng.randint(*spec.words)), size, column_width):
+                if y > bottom:
+                    break
+                items.append((x, y, size, font, line))
+                y += size * 1.25
+            y += size * 0.75
+
+        for item in range(1, spec.list_items + 1):
+            if y > bottom:
+                break
+            marker = f"{item}." if spec.numbered else "-"
+            items.append((x + 20, y, 14, rng.choice(fonts), f"{marker} {_sentence(rng, rng.randint(2, 6))}"))
+            y += 28
+
+    if spec.footer:
+        items.append((60, 500, 10, fonts[0], "Confidential. For internal use only"))
+    anchor = PAGE_NUMBER_ANCHORS.get(spec.page_numbers)
+    if anchor is not None:
+        items.append((anchor[0], anchor[1], 10, fonts[0], str(number)))
+    return items
+
+def build_deck(spec: DeckSpec) -> bytes:
+    rng = random.Random(spec.seed)
+    fonts = {"F0": "Helvetica-Bold"}
+    fonts.update({f"F{index}": font for index, font in enumerate(spec.fonts, 1)})
+    body_fonts = [name for name in fonts if name != "F0"]
+    pages = [_spec_items(rng, spec, body_fonts, number) for number in range(1, spec.slides + 1)]
+    return _write_pdf(pages, fonts)
+
+def _write_pdf(pages: List[List[TextItem]], fonts: Dict[str, str]) -> bytes:
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    font_ids = {
+        name: add(f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} /Encoding /WinAnsiEncoding >>".encode())
+        for name, font in fonts.items()
+    }
+    resources = " ".join(f"/{name} {object_id} 0 R" for name, object_id in font_ids.items())
+    pages_id = len(objects) + 2 * len(pages) + 1
+
+    page_ids = []
+    for items in pages:
+        content = b"".join(
+            f"BT /{font} {size} Tf {x} {PAGE_HEIGHT - y} Td ({_escape(text)}) Tj ET\n".encode("latin-1")
+            for x, y, size, font, text in items
+        )
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Contents {content_id} 0 R /Resources << /Font << {resources} >> >> >>".encode()
+        ))
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    add(f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode())
+    catalog_id = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{object_id} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    output += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(output)
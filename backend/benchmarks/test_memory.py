@@ -0,0 +1,59 @@
+"""
+Тесты бюджетов памяти конвейера обработки
+"""
+
+import pytest
+
+from benchmarks.bench_memory import MB, profile_sizes
+from benchmarks.fixtures import PROFILES_DIR
+
+RETAINED_BYTES_PER_GLYPH = 600
+PEAK_BYTES_PER_GLYPH = 3000
+PEAK_MB_PER_100_PAGES = 160
+RSS_SLACK_MB = 32
+
+
+@pytest.fixture(scope="module")
+def reports(tmp_path_factory):
+    return profile_sizes([4, 12], PROFILES_DIR / "corporate_100.yaml", tmp_path_factory.mktemp("decks"))
+
+
+def stage(report, name):
+    return next(item for item in report["stages"] if item["stage"] == name)
+
+
+class TestMemoryBudgets:
+    """Тесты пикового и удерживаемого объема памяти"""
+
+    def test_object_counts(self, reports):
+        for report in reports:
+            process = stage(report, "process_pdf")
+            assert process["text_runs"] == report["glyphs"]
+            assert process["paragraphs"] > 0
+
+    def test_raw_chars_are_released(self, reports):
+        for report in reports:
+            assert stage(report, "process_pdf")["retained_raw_chars"] == 0
+
+    def test_bytes_per_glyph(self, reports):
+        for report in reports:
+            assert report["retained_bytes_per_glyph"] <= RETAINED_BYTES_PER_GLYPH
+            assert report["peak_bytes_per_glyph"] <= PEAK_BYTES_PER_GLYPH
+
+    def test_peak_per_100_pages(self, reports):
+        for report in reports:
+            assert report["peak_mb_per_100_pages"] <= PEAK_MB_PER_100_PAGES
+
+    def test_memory_grows_linearly(self, reports):
+        small, large = reports
+
+        assert large["retained_bytes_per_glyph"] <= small["retained_bytes_per_glyph"] * 1.25
+        assert large["peak_bytes_per_glyph"] <= small["peak_bytes_per_glyph"] * 1.25
+
+    def test_rss_growth(self, reports):
+        for report in reports:
+            growth = stage(report, "process_pdf")["rss_growth_bytes"]
+            if growth is None:
+                pytest.skip("Сброс пикового RSS недоступен на этой платформе")
+            budget = PEAK_MB_PER_100_PAGES * report["slides"] / 100 + RSS_SLACK_MB
+            assert growth / MB <= budget
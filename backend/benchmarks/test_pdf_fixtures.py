@@ -0,0 +1,55 @@
+"""
+Тесты генератора синтетических презентаций
+"""
+
+import pytest
+
+from app.domain.entities import ListType, PageNumberPosition
+from app.services.pdf.pdf_processing import PdfProcessingService
+from benchmarks.pdf_fixtures import DeckSpec, build_deck
+
+
+def process(tmp_path, spec):
+    path = tmp_path / "deck.pdf"
+    path.write_bytes(build_deck(spec))
+    return PdfProcessingService().process_pdf(path)
+
+
+class TestBuildDeck:
+    """Тесты параметров синтетических презентаций"""
+
+    def test_is_deterministic(self):
+        spec = DeckSpec(slides=3, seed=7)
+
+        assert build_deck(spec) == build_deck(spec)
+        assert build_deck(spec) != build_deck(DeckSpec(slides=3, seed=8))
+
+    @pytest.mark.parametrize("placement, position", [
+        ("bottom_right", PageNumberPosition.BOTTOM_RIGHT),
+        ("bottom_center", PageNumberPosition.BOTTOM_CENTER),
+        ("top_right", PageNumberPosition.TOP_RIGHT),
+    ])
+    def test_page_number_placement(self, tmp_path, placement, position):
+        presentation = process(tmp_path, DeckSpec(slides=4, page_numbers=placement))
+
+        assert [slide.detected_page_number for slide in presentation.slides] == ["1", "2", "3", "4"]
+        assert presentation.slides[0].page_number_position == position
+
+    def test_without_page_numbers(self, tmp_path):
+        presentation = process(tmp_path, DeckSpec(slides=2, page_numbers="none"))
+
+        assert all(slide.detected_page_number is None for slide in presentation.slides)
+
+    def test_numbered_lists_and_fonts(self, tmp_path):
+        spec = DeckSpec(slides=2, paragraphs=1, list_items=4, numbered=True, fonts=("Courier",))
+        presentation = process(tmp_path, spec)
+
+        blocks = presentation.slides[0].blocks
+        assert sum(1 for block in blocks if block.list_type == ListType.NUMBERED) == 4
+        assert any("Courier" in font for font in presentation.fonts_used)
+
+    def test_columns_split_paragraphs(self, tmp_path):
+        single = process(tmp_path, DeckSpec(slides=1, columns=1, list_items=0))
+        double = process(tmp_path, DeckSpec(slides=1, columns=2, list_items=0))
+
+        assert len(double.slides[0].blocks) > len(single.slides[0].blocks)